@@ -6,23 +6,348 @@ Usage:
     python notes_browser.py [--port PORT] [--repo PATH] [--ref REF]
 
 Dependencies:
-    pip install flask markdown2
+    pip install flask mistune
+    pip install pygit2  # Optional: read objects in-process instead of via git subprocesses
+    pip install orjson  # Optional: faster JSON for the API routes
+    pip install waitress  # Optional: multi-threaded production WSGI server
 """
 
 import argparse
+import functools
+import hashlib
+import itertools
+import os
 import re
 import subprocess
-from datetime import datetime
-from typing import Optional
-from flask import Flask, render_template_string, request, jsonify
-import markdown2
+import threading
+import time
+from typing import Iterator, Optional
+from flask import Flask, Response, jsonify, request, stream_with_context
+from flask.json.provider import JSONProvider
+import jinja2
+import mistune
+
+try:
+    import pygit2
+except ImportError:  # Optional - fall back to git subprocesses
+    pygit2 = None
+
+try:
+    import orjson
+except ImportError:  # Optional - fall back to Flask's stdlib json
+    orjson = None
+
+try:
+    import waitress
+except ImportError:  # Optional - fall back to Flask's development server
+    waitress = None
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes with orjson, keeping Flask's sorted keys."""
+
+    mimetype = "application/json"
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        # Skip the bytes -> str -> bytes round trip that dumps() would imply
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Configuration
 REPO_PATH = "."
 NOTES_REF = "refs/notes/commits"
 
+# Markdown parsers for note sections and for code comment bodies, built once.
+# Fenced code blocks are always on; hard_wrap turns single newlines into <br>.
+SECTION_MARKDOWN = mistune.create_markdown(
+    escape=False, hard_wrap=True, plugins=["table", "strikethrough", "url"]
+)
+COMMENT_MARKDOWN = mistune.create_markdown(
+    escape=False, hard_wrap=True, plugins=["strikethrough", "url"]
+)
+
+# Compiled patterns
+PR_HEADER_RE = re.compile(r"#\s*🟣\s*PR\s*#(\d+)")  # "# 🟣 PR #123:"
+PR_NUMBER_RE = re.compile(r"PR\s*#(\d+)")  # Any "PR #123"
+PR_URL_RE = re.compile(r"\*\*URL:\*\*\s+(https://github\.com/\S+)")
+CODE_COMMENT_RE = re.compile(  # **@user** on `file:line` header line
+    r"^\*\*@([\w-]+)\*\*[^\S\n]+on[^\S\n]+`(.+?):(\d+)`.*$", re.MULTILINE
+)
+COMMENT_BODY_LINE_RE = re.compile(  # Non-blank line, with a leading "> " captured separately
+    r"^(?:> (.*\S.*)|(?!> )(.*\S.*))$", re.MULTILINE
+)
+# GitHub usernames are 1-39 alphanumerics or hyphens, not starting with a hyphen.
+# Not the "@" in user@host or .../@name, nor a prefix of a longer @word.
+AUTHOR_RE = re.compile(r"(?<![\w/])@([A-Za-z0-9][A-Za-z0-9-]{0,38})(?![\w-])")
+AUTHOR_LINK_HTML = r'<a href="https://github.com/\1" target="_blank" class="author-link">@\1</a>'
+FULL_SHA_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")  # SHA-1 or SHA-256 object name
+SECTION_SPLIT_RE = re.compile(r"^(## .*|### .*|---.*)$", re.MULTILINE)  # Section/sub-section/footer lines
+
+# Single-pass HTML escaping for code context lines
+HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Code comment fragments for render_code_comment_html
+CODE_COMMENT_HTML = (
+    '<div class="code-comment">\n'
+    '<div class="code-comment-header">\n'
+    '<span class="file-path">{file}</span>\n'
+    '<span class="line-number">Line {line}</span>\n'
+    '</div>\n'
+    '{code_context}'
+    '<div class="code-comment-body">\n'
+    '<div class="comment-meta">\n'
+    '<a href="https://github.com/{author}" target="_blank" class="author-link comment-author">{author}</a> commented\n'
+    '</div>\n'
+    '{body_html}\n'
+    '</div>\n'
+    '</div>'
+)
+CODE_CONTEXT_HTML = '<div class="code-context">\n<table class="code-lines">\n{rows}</table>\n</div>\n'
+CODE_LINE_ROW_HTML = (
+    '<tr{row_class}>\n'
+    '<td class="line-num">{line_num}</td>\n'
+    '<td class="line-code">{line_code}</td>\n'
+    '</tr>\n'
+)
+
+# "## " header keyword -> section key, checked in order
+SECTION_HEADERS = (
+    ("Metadata", "metadata"),
+    ("Description", "description"),
+    ("Commits", "commits"),
+    ("File Changes", "file_changes"),
+    ("Reviews", "reviews"),
+    ("Discussion", "discussion"),
+    ("Checks", "checks"),
+)
+
+
+class _CatFile:
+    """Long-lived `git cat-file --batch` process for reading objects."""
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _read(self, spec: str) -> Optional[tuple[str, bytes, bytes]]:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = self._start()
+
+        self._proc.stdin.write(spec.encode() + b"\n")
+        self._proc.stdin.flush()
+
+        # Header is "<sha> <type> <size>" or "<spec> missing"
+        header = self._proc.stdout.readline()
+        if not header:
+            raise OSError("git cat-file exited unexpectedly")
+
+        parts = header.split()
+        if len(parts) != 3:
+            return None
+
+        object_sha, object_type, size = parts
+        data = self._proc.stdout.read(int(size))
+        self._proc.stdout.read(1)  # Trailing newline after object contents
+        return object_sha.decode(), object_type, data
+
+    def read(self, spec: str) -> Optional[tuple[str, bytes, bytes]]:
+        """Return (sha, type, contents) of the object named by `spec`, or None."""
+        if "\n" in spec:
+            return None
+
+        with self._lock:
+            try:
+                return self._read(spec)
+            except (OSError, ValueError):
+                # Process died mid-request - restart once and retry
+                self.close()
+                try:
+                    return self._read(spec)
+                except (OSError, ValueError):
+                    self.close()
+                    return None
+
+    def fetch(self, spec: str) -> Optional[bytes]:
+        """Return the contents of the blob named by `spec`, or None."""
+        obj = self.read(spec)
+        return obj[2] if obj is not None and obj[1] == b"blob" else None
+
+    def resolve(self, spec: str) -> Optional[str]:
+        """Return the full SHA of the object named by `spec`, or None."""
+        obj = self.read(spec)
+        return obj[0] if obj is not None else None
+
+    def close(self) -> None:
+        """Terminate the cat-file process if running."""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except Exception:
+                self._proc.kill()
+            self._proc = None
+
+
+_cat_files: dict[str, _CatFile] = {}
+_repo_handles_lock = threading.Lock()
+
+
+def _get_cat_file(repo_path: str) -> _CatFile:
+    """Get the shared cat-file process for a repository."""
+    with _repo_handles_lock:
+        cat_file = _cat_files.get(repo_path)
+        if cat_file is None:
+            cat_file = _cat_files[repo_path] = _CatFile(repo_path)
+        return cat_file
+
+
+@functools.lru_cache(maxsize=256)
+def _get_file_lines(repo_path: str, commit_sha: str, file_path: str) -> Optional[tuple[str, ...]]:
+    """Get a file's lines at a commit, cached so several comments on one file split it once."""
+    content = _get_reader(repo_path).get_file_at_commit(commit_sha, file_path)
+    if content is None:
+        return None
+
+    # Split on "\n" only so line numbers match git's; splitlines() also breaks on \f etc.
+    lines = content.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return tuple(lines)
+
+
+class _LibGit2Repo:
+    """In-process read-only access to a repository through pygit2 (libgit2)."""
+
+    def __init__(self, repo: "pygit2.Repository"):
+        self.repo = repo
+        # libgit2 repository handles must not be used from several threads at once
+        self._lock = threading.Lock()
+
+    def fetch(self, spec: str) -> Optional[bytes]:
+        """Return the contents of the blob named by `spec`, or None."""
+        with self._lock:
+            try:
+                obj = self.repo.revparse_single(spec)
+            except (KeyError, ValueError, pygit2.GitError):
+                return None
+            return obj.data if obj.type == pygit2.GIT_OBJECT_BLOB else None
+
+    def resolve(self, spec: str) -> Optional[str]:
+        """Return the full SHA of the object named by `spec`, or None."""
+        with self._lock:
+            try:
+                return str(self.repo.revparse_single(spec).id)
+            except (KeyError, ValueError, pygit2.GitError):
+                return None
+
+    def ref_tips(self, prefix: str = "refs/notes/") -> dict[str, str]:
+        """Get the tip SHA of every ref under `prefix`, keyed by ref name."""
+        with self._lock:
+            ref_tips = {}
+            for name in sorted(self.repo.references):
+                if not name.startswith(prefix):
+                    continue
+                try:
+                    ref_tips[name] = str(self.repo.references[name].resolve().target)
+                except (KeyError, pygit2.GitError):
+                    continue  # Dangling symbolic ref
+            return ref_tips
+
+    def notes(self, notes_ref: str) -> list[tuple[str, str]]:
+        """List (note_sha, annotated_sha) pairs in a notes ref."""
+        with self._lock:
+            try:
+                return [(str(note.id), str(note.annotated_id)) for note in self.repo.notes(notes_ref)]
+            except (KeyError, pygit2.GitError):
+                return []
+
+    def note(self, notes_ref: str, commit_sha: str) -> Optional[str]:
+        """Get the note attached to an object, or None."""
+        with self._lock:
+            try:
+                target = self.repo.revparse_single(commit_sha)
+                return self.repo.lookup_note(str(target.id), notes_ref).message.strip()
+            except (KeyError, ValueError, pygit2.GitError):
+                return None
+
+    def note_oid(self, notes_ref: str, commit_sha: str) -> Optional[str]:
+        """Get the blob SHA of the note attached to an object, or None."""
+        with self._lock:
+            try:
+                target = self.repo.revparse_single(commit_sha)
+                return str(self.repo.lookup_note(str(target.id), notes_ref).id)
+            except (KeyError, ValueError, pygit2.GitError):
+                return None
+
+    def commit_info(self, commit_shas: list[str]) -> dict[str, tuple[str, str, str, str]]:
+        """Get (author name, author email, timestamp, subject) keyed by commit SHA."""
+        commit_info = {}
+        with self._lock:
+            for commit_sha in commit_shas:
+                try:
+                    commit = self.repo[commit_sha]
+                except (KeyError, ValueError):
+                    continue
+                if commit.type != pygit2.GIT_OBJECT_COMMIT:
+                    continue
+
+                # Same as git's %s: first paragraph of the message on one line
+                subject = " ".join(commit.message.strip().split("\n\n", 1)[0].split())
+                commit_info[commit_sha] = (
+                    commit.author.name, commit.author.email, str(commit.author.time), subject
+                )
+        return commit_info
+
+
+_libgit2_repos: dict[str, Optional[_LibGit2Repo]] = {}
+
+
+def _get_libgit2_repo(repo_path: str) -> Optional[_LibGit2Repo]:
+    """Get the shared pygit2 handle for a repository, or None if unavailable."""
+    if pygit2 is None:
+        return None
+
+    with _repo_handles_lock:
+        if repo_path not in _libgit2_repos:
+            try:
+                _libgit2_repos[repo_path] = _LibGit2Repo(pygit2.Repository(repo_path))
+            except pygit2.GitError:
+                _libgit2_repos[repo_path] = None
+        return _libgit2_repos[repo_path]
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: int) -> str:
+    """Format a unix timestamp as local "YYYY-MM-DD HH:MM:SS", memoized per timestamp."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+# PR number extracted from each note, keyed by note blob SHA
+_pr_numbers_by_note: dict[str, Optional[int]] = {}
+_MISSING = object()
+
 
 class GitNotesReader:
     """Handle reading git notes from repository."""
@@ -30,39 +355,70 @@ class GitNotesReader:
     def __init__(self, repo_path: str = ".", notes_ref: str = "refs/notes/commits"):
         self.repo_path = repo_path
         self.notes_ref = notes_ref
+        self._libgit2 = _get_libgit2_repo(repo_path)
+        self._cat_file = _get_cat_file(repo_path)
 
-    def _run_git_command(self, args: list[str]) -> tuple[bool, str]:
+    def _run_git_command(
+        self, args: list[str], input_data: Optional[str] = None
+    ) -> tuple[bool, str]:
         """Run a git command and return success status and output."""
         try:
+            # Work in bytes and decode the whole output once at the end
             result = subprocess.run(
                 ["git"] + args,
                 cwd=self.repo_path,
+                input=input_data.encode() if input_data is not None else None,
                 capture_output=True,
-                text=True,
                 check=False,
             )
-            return result.returncode == 0, result.stdout.strip()
+            return result.returncode == 0, result.stdout.decode("utf-8", "replace").strip()
         except Exception as e:
             return False, str(e)
 
     def list_available_refs(self) -> list[str]:
         """List all available git notes refs."""
+        refs = list(self.get_ref_tips())
+        return refs if refs else ["refs/notes/commits"]  # Default ref
+
+    def get_ref_tips(self, prefix: str = "refs/notes/") -> dict[str, str]:
+        """Get the tip SHA of every ref under `prefix` (git notes refs by default)."""
+        if self._libgit2 is not None:
+            return self._libgit2.ref_tips(prefix)
+
         success, output = self._run_git_command(
-            ["for-each-ref", "--format=%(refname)", "refs/notes/"]
+            ["for-each-ref", "--format=%(refname) %(objectname)", prefix]
         )
 
         if not success or not output:
-            return ["refs/notes/commits"]  # Default ref
+            return {}
 
-        refs = [line.strip() for line in output.split("\n") if line.strip()]
-        return refs if refs else ["refs/notes/commits"]
+        ref_tips = {}
+        for line in output.split("\n"):
+            parts = line.split()
+            if len(parts) == 2:
+                ref_tips[parts[0]] = parts[1]
+        return ref_tips
+
+    def _read_blob(self, spec: str) -> Optional[str]:
+        """Read a blob by name (SHA or <commit>:<path>) and decode it."""
+        if self._libgit2 is not None:
+            data = self._libgit2.fetch(spec)
+        else:
+            data = self._cat_file.fetch(spec)
+        return data.decode("utf-8", "replace") if data is not None else None
+
+    def resolve_commit(self, revision: str) -> Optional[str]:
+        """Resolve a revision (SHA, abbreviated SHA, branch, HEAD...) to a full SHA, or None."""
+        # A full SHA always names the same object, so there is nothing to look up
+        if FULL_SHA_RE.fullmatch(revision):
+            return revision
+        if self._libgit2 is not None:
+            return self._libgit2.resolve(revision)
+        return self._cat_file.resolve(revision)
 
     def get_file_at_commit(self, commit_sha: str, file_path: str) -> Optional[str]:
         """Get file content at a specific commit."""
-        success, output = self._run_git_command(
-            ["show", f"{commit_sha}:{file_path}"]
-        )
-        return output if success else None
+        return self._read_blob(f"{commit_sha}:{file_path}")
 
     def get_file_lines_at_commit(
         self, commit_sha: str, file_path: str, line_num: int, context_lines: int = 3
@@ -73,19 +429,17 @@ class GitNotesReader:
             dict with keys: lines (list of tuples (line_num, line_content)),
                            start_line, end_line
         """
-        content = self.get_file_at_commit(commit_sha, file_path)
-        if not content:
+        lines = _get_file_lines(self.repo_path, commit_sha, file_path)
+        if not lines:
             return None
 
-        lines = content.split("\n")
         start_line = max(1, line_num - context_lines)
         end_line = min(len(lines), line_num + context_lines)
 
         # Extract lines with their numbers
-        result_lines = []
-        for i in range(start_line - 1, end_line):
-            if i < len(lines):
-                result_lines.append((i + 1, lines[i]))
+        result_lines = list(
+            enumerate(lines[start_line - 1:end_line], start=start_line)
+        )
 
         return {
             "lines": result_lines,
@@ -96,6 +450,57 @@ class GitNotesReader:
 
     def list_notes(self) -> list[dict]:
         """List all commits that have notes attached."""
+        return list(self.iter_notes())
+
+    def iter_notes(self) -> Iterator[dict]:
+        """Yield all commits that have notes attached, newest first.
+
+        Commit metadata is fetched up front for sorting; each note's content
+        is only read as its entry is yielded, so callers can stream results.
+        """
+        pairs = self._list_note_pairs()
+        if not pairs:
+            return
+
+        # Get commit info for every noted commit in a single git log call
+        commit_info = self._get_commit_info([commit_sha for _, commit_sha in pairs])
+
+        noted_commits = [
+            (note_sha, commit_sha, commit_info[commit_sha])
+            for note_sha, commit_sha in pairs
+            if commit_sha in commit_info
+        ]
+
+        # Sort by timestamp, newest first
+        noted_commits.sort(key=lambda x: int(x[2][2]), reverse=True)
+
+        for note_sha, commit_sha, info in noted_commits:
+            author_name, author_email, timestamp, subject = info
+
+            # Get note content to extract PR number. The note SHA identifies its
+            # content, so the result is cached across requests and repositories.
+            pr_number = _pr_numbers_by_note.get(note_sha, _MISSING)
+            if pr_number is _MISSING:
+                pr_number = self._extract_pr_number(self._get_note_blob(note_sha))
+                _pr_numbers_by_note[note_sha] = pr_number
+
+            yield {
+                "commit_sha": commit_sha,
+                "commit_sha_short": commit_sha[:7],
+                "note_sha": note_sha,
+                "author_name": author_name,
+                "author_email": author_email,
+                "timestamp": int(timestamp),
+                "date": _format_timestamp(int(timestamp)),
+                "subject": subject,
+                "pr_number": pr_number,
+            }
+
+    def _list_note_pairs(self) -> list[tuple[str, str]]:
+        """List (note_sha, commit_sha) pairs for the notes ref."""
+        if self._libgit2 is not None:
+            return self._libgit2.notes(self.notes_ref)
+
         success, output = self._run_git_command(
             ["notes", "--ref", self.notes_ref, "list"]
         )
@@ -103,71 +508,90 @@ class GitNotesReader:
         if not success or not output:
             return []
 
-        notes = []
+        pairs = []
         for line in output.split("\n"):
-            if not line.strip():
-                continue
-
             parts = line.split()
             if len(parts) >= 2:
-                note_sha, commit_sha = parts[0], parts[1]
+                pairs.append((parts[0], parts[1]))
+        return pairs
 
-                # Get commit info
-                success, commit_info = self._run_git_command([
-                    "log", "-1", "--format=%H%n%an%n%ae%n%at%n%s",
-                    commit_sha
-                ])
+    def _get_commit_info(self, commit_shas: list[str]) -> dict[str, tuple[str, str, str, str]]:
+        """Get (author name, author email, timestamp, subject) keyed by commit SHA."""
+        if self._libgit2 is not None:
+            return self._libgit2.commit_info(commit_shas)
 
+        log_format = "--format=%H%x1f%an%x1f%ae%x1f%at%x1f%s%x1e"
+        success, output = self._run_git_command(
+            ["log", "--no-walk=unsorted", "--stdin", log_format],
+            input_data="\n".join(commit_shas) + "\n",
+        )
+
+        if not success:
+            # One bad object fails the whole batch - fall back to one call per commit
+            outputs = []
+            for commit_sha in commit_shas:
+                success, commit_output = self._run_git_command(["log", "-1", log_format, commit_sha])
                 if success:
-                    lines = commit_info.split("\n")
-                    if len(lines) >= 5:
-                        commit_hash, author_name, author_email, timestamp, subject = lines[:5]
-
-                        # Get note content to extract PR number
-                        note_content = self.get_note(commit_sha)
-                        pr_number = self._extract_pr_number(note_content)
-
-                        notes.append({
-                            "commit_sha": commit_sha,
-                            "commit_sha_short": commit_sha[:7],
-                            "note_sha": note_sha,
-                            "author_name": author_name,
-                            "author_email": author_email,
-                            "timestamp": int(timestamp),
-                            "date": datetime.fromtimestamp(int(timestamp)).strftime("%Y-%m-%d %H:%M:%S"),
-                            "subject": subject,
-                            "pr_number": pr_number,
-                        })
+                    outputs.append(commit_output)
+            output = "".join(outputs)
 
-        # Sort by timestamp, newest first
-        notes.sort(key=lambda x: x["timestamp"], reverse=True)
-        return notes
+        commit_info = {}
+        for record in output.split("\x1e"):
+            fields = record.strip("\n").split("\x1f")
+            if len(fields) == 5:
+                commit_hash, author_name, author_email, timestamp, subject = fields
+                commit_info[commit_hash] = (author_name, author_email, timestamp, subject)
+
+        return commit_info
+
+    def _get_note_blob(self, note_sha: str) -> Optional[str]:
+        """Get note content by the note's blob SHA."""
+        return self._read_blob(note_sha)
 
     def get_note(self, commit_sha: str) -> Optional[str]:
         """Get the note content for a specific commit."""
+        if self._libgit2 is not None:
+            return self._libgit2.note(self.notes_ref, commit_sha)
+
         success, output = self._run_git_command(
             ["notes", "--ref", self.notes_ref, "show", commit_sha]
         )
         return output if success else None
 
+    def get_note_oid(self, commit_sha: str) -> Optional[str]:
+        """Get the blob SHA of the note for a specific commit."""
+        if self._libgit2 is not None:
+            return self._libgit2.note_oid(self.notes_ref, commit_sha)
+
+        success, output = self._run_git_command(
+            ["notes", "--ref", self.notes_ref, "list", commit_sha]
+        )
+        return output if success and output else None
+
     def _extract_pr_number(self, note_content: Optional[str]) -> Optional[int]:
         """Extract PR number from note content."""
         if not note_content:
             return None
 
         # Look for "# 🟣 PR #123:" pattern
-        match = re.search(r"#\s*🟣\s*PR\s*#(\d+)", note_content)
+        match = PR_HEADER_RE.search(note_content)
         if match:
             return int(match.group(1))
 
         # Fallback: look for any "PR #123" pattern
-        match = re.search(r"PR\s*#(\d+)", note_content)
+        match = PR_NUMBER_RE.search(note_content)
         if match:
             return int(match.group(1))
 
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _get_reader(repo_path: str, notes_ref: str = "refs/notes/commits") -> GitNotesReader:
+    """Get a shared reader for a repository and notes ref."""
+    return GitNotesReader(repo_path, notes_ref)
+
+
 def parse_note_sections(content: str) -> dict:
     """Parse markdown note content into structured sections."""
     sections = {
@@ -190,80 +614,64 @@ def parse_note_sections(content: str) -> dict:
         return sections
 
     # Extract title (first line with 🟣 PR #)
-    lines = content.split("\n")
-    if lines and "🟣" in lines[0]:
-        sections["title"] = lines[0].strip("# ").strip()
+    first_line, _, rest = content.partition("\n")
+    if "🟣" in first_line:
+        sections["title"] = first_line.strip("# ").strip()
         # Extract PR number from title
-        pr_match = re.search(r'PR\s*#(\d+)', sections["title"])
+        pr_match = PR_NUMBER_RE.search(sections["title"])
         if pr_match:
             sections["pr_number"] = int(pr_match.group(1))
 
-    # Split by headers
+    # Split the rest into alternating [body, header, body, header, ...] chunks.
+    # A trailing newline terminates every line, so each chunk after a header is
+    # the newline ending the header followed by its (newline-terminated) lines.
+    parts = SECTION_SPLIT_RE.split(rest + "\n")
+
     current_section = None
-    current_content = []
+    current_content = [parts[0]]
 
-    for line in lines[1:]:
-        # Check if this is a section header
-        if line.startswith("## "):
+    for header, body in zip(parts[1::2], parts[2::2]):
+        body = body[1:]
+
+        if header.startswith("## "):
             # Save previous section
-            if current_section and current_content:
-                sections[current_section] = "\n".join(current_content).strip()
+            if current_section and (text := "".join(current_content)):
+                sections[current_section] = text.strip()
 
             # Start new section
-            header = line.strip("# ").strip()
-            if "Metadata" in header:
-                current_section = "metadata"
-            elif "Description" in header:
-                current_section = "description"
-            elif "Commits" in header:
-                current_section = "commits"
-            elif "File Changes" in header:
-                current_section = "file_changes"
-            elif "Reviews" in header:
-                current_section = "reviews"
-            elif "Discussion" in header:
-                current_section = "discussion"
-            elif "Checks" in header:
-                current_section = "checks"
-            else:
-                current_section = None
-
-            current_content = []
-        elif line.startswith("### "):
-            # Sub-section within discussion
-            if current_section == "discussion":
-                sub_header = line.strip("# ").strip()
-                if "Conversation" in sub_header:
-                    if current_content:
-                        sections["conversation"] = "\n".join(current_content).strip()
-                    current_content = []
-                elif "Code Review Comments" in sub_header:
-                    if current_content:
-                        sections["conversation"] = "\n".join(current_content).strip()
-                    current_content = []
+            header_text = header.strip("# ").strip()
+            current_section = next(
+                (key for keyword, key in SECTION_HEADERS if keyword in header_text),
+                None,
+            )
+            current_content = [body]
+        elif header.startswith("### "):
+            # Sub-section within discussion; other sub-headers are dropped
+            sub_header = header.strip("# ").strip()
+            if current_section == "discussion" and (
+                "Conversation" in sub_header or "Code Review Comments" in sub_header
+            ):
+                if text := "".join(current_content):
+                    sections["conversation"] = text.strip()
+                current_content = [body]
+                if "Conversation" not in sub_header:
                     current_section = "code_comments"
-        elif line.startswith("---"):
+            else:
+                current_content.append(body)
+        else:
             # Footer section
-            if current_section and current_content:
-                if current_section == "code_comments":
-                    sections["code_comments"] = "\n".join(current_content).strip()
-                elif current_section:
-                    sections[current_section] = "\n".join(current_content).strip()
+            if current_section and (text := "".join(current_content)):
+                sections[current_section] = text.strip()
             current_section = "footer"
-            current_content = []
-        else:
-            current_content.append(line)
+            current_content = [body]
 
     # Save last section
-    if current_section and current_content:
-        if current_section == "code_comments":
-            sections["code_comments"] = "\n".join(current_content).strip()
-        else:
-            sections[current_section] = "\n".join(current_content).strip()
+    if current_section and (text := "".join(current_content)):
+        sections[current_section] = text.strip()
 
     # Extract PR URL from metadata section
     if sections.get("metadata"):
-        url_match = re.search(r'\*\*URL:\*\*\s+(https://github\.com/[^\s]+)', sections["metadata"])
+        url_match = PR_URL_RE.search(sections["metadata"])
         if url_match:
             sections["pr_url"] = url_match.group(1)
 
@@ -281,57 +689,59 @@ def parse_code_comments(content: str) -> list[dict]:
     if not content:
         return comments
 
-    lines = content.split("\n")
-    current_comment = None
-
-    for i, line in enumerate(lines):
-        # Match: **@username** on `file.py:123` (timestamp)
-        match = re.match(r'\*\*@([\w-]+)\*\*\s+on\s+`(.+?):(\d+)`', line)
-        if match:
-            # Save previous comment
-            if current_comment:
-                comments.append(current_comment)
-
-            author, file_path, line_num = match.groups()
-            current_comment = {
-                "file": file_path,
-                "line": int(line_num),
-                "author": author,
-                "body": []
-            }
-            continue
-
-        # Add body lines to current comment
-        if current_comment is not None:
-            # Stop at empty lines that separate comments
-            if not line.strip() and current_comment["body"]:
-                # Empty line after body content - might be end of comment
-                continue
-            elif line.strip():
-                # Remove leading '> ' from quoted lines
-                clean_line = line[2:] if line.startswith("> ") else line
-                if clean_line.strip():  # Only add non-empty content
-                    current_comment["body"].append(clean_line)
-
-    # Save last comment
-    if current_comment:
-        comments.append(current_comment)
+    # Each comment runs from its header line to the next header (or the end);
+    # body lines are the non-blank lines in between with any '> ' removed
+    matches = list(CODE_COMMENT_RE.finditer(content))
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        author, file_path, line_num = match.groups()
+        body_end = next_match.start() if next_match else len(content)
+        body = [
+            quoted or unquoted
+            for quoted, unquoted in COMMENT_BODY_LINE_RE.findall(content, match.end(), body_end)
+        ]
+        comments.append({
+            "file": file_path,
+            "line": int(line_num),
+            "author": author,
+            "body": body
+        })
 
     return comments
 
 
 def linkify_authors(html: str) -> str:
     """Convert @username references to clickable GitHub profile links."""
-    # Match @username (but not inside HTML tags or already in links)
-    pattern = r'@([\w-]+)'
-
-    def replace_author(match):
-        username = match.group(1)
-        return f'<a href="https://github.com/{username}" target="_blank" class="author-link">@{username}</a>'
-
     # Simple replacement - this works for most cases
     # More sophisticated parsing would be needed to avoid replacing inside existing tags
-    return re.sub(pattern, replace_author, html)
+    return AUTHOR_RE.sub(AUTHOR_LINK_HTML, html)
+
+
+@functools.lru_cache(maxsize=512)
+def render_markdown(text: str, markdown: mistune.Markdown = SECTION_MARKDOWN) -> str:
+    """Convert markdown to HTML with linkified authors.
+
+    Note content is immutable for a given text, so results are cached by content.
+    """
+    html = markdown(text)
+    return linkify_authors(html)
+
+
+@functools.lru_cache(maxsize=512)
+def load_note(repo_path: str, note_oid: str) -> Optional[tuple[str, dict, list[dict]]]:
+    """Read and parse a note blob, returning (content, sections, code comments).
+
+    A note blob never changes for a given OID, so the result is cached by it
+    and repeat views skip both the read and the parse. Callers that modify
+    the sections or comments must copy them first.
+    """
+    content = _get_reader(repo_path)._get_note_blob(note_oid)
+    content = content.strip() if content else ""
+    if not content:
+        return None
+
+    sections = parse_note_sections(content)
+    code_comments = parse_code_comments(sections["code_comments"]) if sections.get("code_comments") else []
+    return content, sections, code_comments
 
 
 def render_code_comment_html(
@@ -339,16 +749,11 @@ def render_code_comment_html(
     commit_sha: str,
     reader: GitNotesReader
 ) -> str:
-    """Render a code comment in GitHub style with code context from commit."""
-    html_parts = []
-
-    # File header
-    html_parts.append(f'<div class="code-comment">')
-    html_parts.append(f'<div class="code-comment-header">')
-    html_parts.append(f'<span class="file-path">{comment["file"]}</span>')
-    html_parts.append(f'<span class="line-number">Line {comment["line"]}</span>')
-    html_parts.append(f'</div>')
+    """Render a code comment in GitHub style with code context from commit.
 
+    Files deleted or renamed by the commit come back "missing" from the
+    object lookup (and that miss is cached), so they render without context.
+    """
     # Get code context from the commit
     code_context = reader.get_file_lines_at_commit(
         commit_sha,
@@ -357,51 +762,623 @@ def render_code_comment_html(
         context_lines=3
     )
 
+    code_context_html = ""
     if code_context:
-        html_parts.append(f'<div class="code-context">')
-        html_parts.append(f'<table class="code-lines">')
-
-        for line_num, line_content in code_context["lines"]:
-            # Highlight the target line
-            is_target = line_num == code_context["target_line"]
-            row_class = ' class="target-line"' if is_target else ''
-
-            # Escape HTML in line content
-            escaped_line = (line_content
-                .replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;"))
-
-            html_parts.append(f'<tr{row_class}>')
-            html_parts.append(f'<td class="line-num">{line_num}</td>')
-            html_parts.append(f'<td class="line-code">{escaped_line}</td>')
-            html_parts.append(f'</tr>')
-
-        html_parts.append(f'</table>')
-        html_parts.append(f'</div>')
-
-    # Comment body
-    html_parts.append(f'<div class="code-comment-body">')
-    html_parts.append(f'<div class="comment-meta">')
-    author_username = comment["author"]
-    html_parts.append(f'<a href="https://github.com/{author_username}" target="_blank" class="author-link comment-author">{author_username}</a> commented')
-    html_parts.append(f'</div>')
+        target_line = code_context["target_line"]
+        rows = "".join(
+            CODE_LINE_ROW_HTML.format(
+                # Highlight the target line
+                row_class=' class="target-line"' if line_num == target_line else "",
+                line_num=line_num,
+                line_code=line_content.translate(HTML_ESCAPE_TABLE),
+            )
+            for line_num, line_content in code_context["lines"]
+        )
+        code_context_html = CODE_CONTEXT_HTML.format(rows=rows)
 
     body_text = "\n".join(comment["body"])
-    # Convert markdown in body
-    body_html = markdown2.markdown(
-        body_text,
-        extras=["fenced-code-blocks", "break-on-newline"]
+    # Convert markdown in body and linkify any @mentions
+    body_html = render_markdown(body_text, COMMENT_MARKDOWN)
+
+    return CODE_COMMENT_HTML.format(
+        file=comment["file"],
+        line=comment["line"],
+        author=comment["author"],
+        code_context=code_context_html,
+        body_html=body_html,
     )
-    # Linkify any @mentions in the body
-    body_html = linkify_authors(body_html)
-    html_parts.append(body_html)
-    html_parts.append(f'</div>')
-    html_parts.append(f'</div>')
 
-    return "\n".join(html_parts)
 
+# Stylesheets, served separately so browsers cache them across pages
+INDEX_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
+    background-color: #0d1117;
+    color: #c9d1d9;
+    line-height: 1.5;
+}
+
+.header {
+    background-color: #161b22;
+    border-bottom: 1px solid #30363d;
+    padding: 16px 32px;
+}
+
+.header-content {
+    display: flex;
+    align-items: center;
+    gap: 16px;
+}
+
+.header h1 {
+    font-size: 20px;
+    font-weight: 600;
+    color: #f0f6fc;
+    flex: 1;
+}
+
+.header p {
+    color: #8b949e;
+    font-size: 14px;
+    margin-top: 4px;
+}
+
+.ref-selector {
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+
+.ref-selector label {
+    color: #8b949e;
+    font-size: 14px;
+}
+
+.ref-selector select {
+    background-color: #0d1117;
+    border: 1px solid #30363d;
+    border-radius: 6px;
+    color: #c9d1d9;
+    padding: 5px 12px;
+    font-size: 14px;
+    cursor: pointer;
+}
+
+.ref-selector select:hover {
+    border-color: #58a6ff;
+}
+
+.ref-selector select:focus {
+    outline: none;
+    border-color: #58a6ff;
+}
+
+.container {
+    max-width: 1280px;
+    margin: 0 auto;
+    padding: 24px 32px;
+}
+
+.notes-list {
+    background-color: #0d1117;
+}
+
+.note-item {
+    background-color: #161b22;
+    border: 1px solid #30363d;
+    border-radius: 6px;
+    padding: 16px;
+    margin-bottom: 16px;
+    transition: border-color 0.2s;
+}
+
+.note-item:hover {
+    border-color: #58a6ff;
+}
+
+.note-item a {
+    text-decoration: none;
+    color: inherit;
+    display: block;
+}
+
+.note-header {
+    display: flex;
+    align-items: flex-start;
+    gap: 12px;
+    margin-bottom: 8px;
+}
+
+.pr-badge {
+    background-color: #8957e5;
+    color: white;
+    padding: 4px 8px;
+    border-radius: 12px;
+    font-size: 12px;
+    font-weight: 600;
+    white-space: nowrap;
+}
+
+.note-title {
+    font-size: 16px;
+    font-weight: 600;
+    color: #58a6ff;
+    flex: 1;
+}
+
+.note-meta {
+    display: flex;
+    align-items: center;
+    gap: 16px;
+    font-size: 12px;
+    color: #8b949e;
+    margin-top: 8px;
+}
+
+.commit-sha {
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+    background-color: #1f6feb1a;
+    color: #58a6ff;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-size: 12px;
+}
+
+.empty-state {
+    text-align: center;
+    padding: 64px 32px;
+    color: #8b949e;
+}
+
+.empty-state h2 {
+    font-size: 24px;
+    margin-bottom: 8px;
+    color: #c9d1d9;
+}
+
+.empty-state p {
+    font-size: 14px;
+}
+
+.empty-state code {
+    background-color: #161b22;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+}
+"""
+
+NOTE_DETAIL_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
+    background-color: #0d1117;
+    color: #c9d1d9;
+    line-height: 1.5;
+}
+
+.header {
+    background-color: #161b22;
+    border-bottom: 1px solid #30363d;
+    padding: 16px 32px;
+}
+
+.header-content {
+    max-width: 1280px;
+    margin: 0 auto;
+    display: flex;
+    align-items: center;
+    gap: 16px;
+}
+
+.back-link {
+    color: #58a6ff;
+    text-decoration: none;
+    font-size: 14px;
+}
+
+.back-link:hover {
+    text-decoration: underline;
+}
+
+.header h1 {
+    font-size: 20px;
+    font-weight: 600;
+    color: #f0f6fc;
+    flex: 1;
+}
+
+.container {
+    max-width: 1280px;
+    margin: 0 auto;
+    padding: 24px 32px;
+}
+
+.pr-header {
+    margin-bottom: 24px;
+}
+
+.pr-title {
+    font-size: 32px;
+    font-weight: 600;
+    color: #f0f6fc;
+    margin-bottom: 16px;
+    line-height: 1.25;
+}
+
+.pr-title-link {
+    color: #f0f6fc;
+    text-decoration: none;
+}
+
+.pr-title-link:hover {
+    color: #58a6ff;
+}
+
+.author-link {
+    color: inherit;
+    text-decoration: none;
+    font-weight: 600;
+}
+
+.author-link:hover {
+    color: #58a6ff;
+    text-decoration: underline;
+}
+
+.section {
+    background-color: #161b22;
+    border: 1px solid #30363d;
+    border-radius: 6px;
+    margin-bottom: 16px;
+    overflow: hidden;
+}
+
+.section-header {
+    background-color: #161b22;
+    padding: 16px;
+    border-bottom: 1px solid #30363d;
+    font-size: 14px;
+    font-weight: 600;
+    color: #f0f6fc;
+}
+
+.section-content {
+    padding: 16px;
+}
+
+.metadata-grid {
+    display: grid;
+    grid-template-columns: auto 1fr;
+    gap: 8px 16px;
+    font-size: 14px;
+}
+
+.metadata-label {
+    color: #8b949e;
+    font-weight: 600;
+}
+
+.metadata-value {
+    color: #c9d1d9;
+}
+
+.commit-list, .file-list, .comment-list {
+    list-style: none;
+}
+
+.commit-item, .file-item {
+    padding: 8px 0;
+    border-bottom: 1px solid #21262d;
+    font-size: 14px;
+}
+
+.commit-item:last-child, .file-item:last-child {
+    border-bottom: none;
+}
+
+.commit-sha {
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+    background-color: #1f6feb1a;
+    color: #58a6ff;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-size: 12px;
+    margin-right: 8px;
+}
+
+.file-path {
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+    color: #58a6ff;
+}
+
+.comment {
+    background-color: #0d1117;
+    border: 1px solid #30363d;
+    border-radius: 6px;
+    margin-bottom: 16px;
+    overflow: hidden;
+}
+
+.comment-header {
+    padding: 8px 16px;
+    background-color: #161b22;
+    border-bottom: 1px solid #30363d;
+    font-size: 12px;
+    color: #8b949e;
+}
+
+.comment-author {
+    color: #f0f6fc;
+    font-weight: 600;
+}
+
+.comment-body {
+    padding: 16px;
+    font-size: 14px;
+}
+
+.check-item {
+    display: flex;
+    align-items: center;
+    gap: 12px;
+    padding: 12px 0;
+    border-bottom: 1px solid #21262d;
+    font-size: 14px;
+}
+
+.check-item:last-child {
+    border-bottom: none;
+}
+
+.check-status {
+    width: 20px;
+    height: 20px;
+    border-radius: 50%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-size: 12px;
+}
+
+.check-status.success {
+    background-color: #238636;
+    color: white;
+}
+
+.check-status.failure {
+    background-color: #da3633;
+    color: white;
+}
+
+.check-status.other {
+    background-color: #6e7681;
+    color: white;
+}
+
+.check-name {
+    flex: 1;
+    color: #f0f6fc;
+}
+
+.check-duration {
+    color: #8b949e;
+    font-size: 12px;
+}
+
+.markdown-content {
+    font-size: 14px;
+    line-height: 1.6;
+}
+
+.markdown-content p {
+    margin-bottom: 16px;
+}
+
+.markdown-content ul, .markdown-content ol {
+    margin-left: 24px;
+    margin-bottom: 16px;
+}
+
+.markdown-content li {
+    margin-bottom: 4px;
+}
+
+.markdown-content code {
+    background-color: #1f6feb1a;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+    font-size: 12px;
+}
+
+.markdown-content pre {
+    background-color: #0d1117;
+    border: 1px solid #30363d;
+    border-radius: 6px;
+    padding: 16px;
+    overflow-x: auto;
+    margin-bottom: 16px;
+}
+
+.markdown-content pre code {
+    background: none;
+    padding: 0;
+    font-size: 12px;
+}
+
+.markdown-content h1, .markdown-content h2, .markdown-content h3 {
+    margin-top: 24px;
+    margin-bottom: 16px;
+    color: #f0f6fc;
+}
+
+.markdown-content h1 {
+    font-size: 24px;
+    border-bottom: 1px solid #30363d;
+    padding-bottom: 8px;
+}
+
+.markdown-content h2 {
+    font-size: 20px;
+}
+
+.markdown-content h3 {
+    font-size: 16px;
+}
+
+.markdown-content blockquote {
+    border-left: 4px solid #30363d;
+    padding-left: 16px;
+    margin: 16px 0;
+    color: #8b949e;
+}
+
+.markdown-content a {
+    color: #58a6ff;
+    text-decoration: none;
+}
+
+.markdown-content a:hover {
+    text-decoration: underline;
+}
+
+.footer {
+    text-align: center;
+    padding: 16px;
+    color: #8b949e;
+    font-size: 12px;
+    border-top: 1px solid #30363d;
+    margin-top: 24px;
+}
+
+.empty-section {
+    color: #8b949e;
+    font-style: italic;
+    font-size: 14px;
+}
+
+.code-comment {
+    background-color: #0d1117;
+    border: 1px solid #30363d;
+    border-radius: 6px;
+    margin-bottom: 16px;
+    overflow: hidden;
+}
+
+.code-comment-header {
+    background-color: #161b22;
+    padding: 8px 16px;
+    border-bottom: 1px solid #30363d;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.code-comment-header .file-path {
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+    color: #c9d1d9;
+    font-size: 14px;
+}
+
+.code-comment-header .line-number {
+    font-size: 12px;
+    color: #8b949e;
+}
+
+.code-context {
+    background-color: #0d1117;
+    border-bottom: 1px solid #30363d;
+    overflow-x: auto;
+}
+
+.code-context pre {
+    margin: 0;
+    padding: 12px 16px;
+    background-color: #161b22;
+    border: none;
+    border-radius: 0;
+}
+
+.code-context code {
+    font-size: 12px;
+    color: #c9d1d9;
+    line-height: 1.5;
+}
+
+.code-lines {
+    width: 100%;
+    border-collapse: collapse;
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+    font-size: 12px;
+    line-height: 20px;
+}
+
+.code-lines td {
+    padding: 0;
+    border: none;
+}
+
+.code-lines .line-num {
+    width: 1%;
+    min-width: 50px;
+    padding: 0 10px;
+    text-align: right;
+    color: #6e7681;
+    background-color: #0d1117;
+    user-select: none;
+    vertical-align: top;
+}
+
+.code-lines .line-code {
+    padding: 0 10px;
+    color: #c9d1d9;
+    background-color: #0d1117;
+    white-space: pre;
+    vertical-align: top;
+}
+
+.code-lines tr:hover .line-num,
+.code-lines tr:hover .line-code {
+    background-color: #161b22;
+}
+
+.code-lines tr.target-line .line-num,
+.code-lines tr.target-line .line-code {
+    background-color: #ffd33d1a;
+}
+
+.code-lines tr.target-line .line-num {
+    color: #ffd33d;
+    font-weight: 600;
+}
+
+.code-comment-body {
+    padding: 16px;
+}
+
+.comment-meta {
+    margin-bottom: 12px;
+    font-size: 12px;
+    color: #8b949e;
+}
+
+.comment-meta .comment-author {
+    color: #f0f6fc;
+    font-weight: 600;
+}
+"""
 
 # HTML Templates
 INDEX_TEMPLATE = """
@@ -411,169 +1388,7 @@ INDEX_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Git Notes Browser - PR Summaries</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
-            background-color: #0d1117;
-            color: #c9d1d9;
-            line-height: 1.5;
-        }
-
-        .header {
-            background-color: #161b22;
-            border-bottom: 1px solid #30363d;
-            padding: 16px 32px;
-        }
-
-        .header-content {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-        }
-
-        .header h1 {
-            font-size: 20px;
-            font-weight: 600;
-            color: #f0f6fc;
-            flex: 1;
-        }
-
-        .header p {
-            color: #8b949e;
-            font-size: 14px;
-            margin-top: 4px;
-        }
-
-        .ref-selector {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-
-        .ref-selector label {
-            color: #8b949e;
-            font-size: 14px;
-        }
-
-        .ref-selector select {
-            background-color: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            color: #c9d1d9;
-            padding: 5px 12px;
-            font-size: 14px;
-            cursor: pointer;
-        }
-
-        .ref-selector select:hover {
-            border-color: #58a6ff;
-        }
-
-        .ref-selector select:focus {
-            outline: none;
-            border-color: #58a6ff;
-        }
-
-        .container {
-            max-width: 1280px;
-            margin: 0 auto;
-            padding: 24px 32px;
-        }
-
-        .notes-list {
-            background-color: #0d1117;
-        }
-
-        .note-item {
-            background-color: #161b22;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            padding: 16px;
-            margin-bottom: 16px;
-            transition: border-color 0.2s;
-        }
-
-        .note-item:hover {
-            border-color: #58a6ff;
-        }
-
-        .note-item a {
-            text-decoration: none;
-            color: inherit;
-            display: block;
-        }
-
-        .note-header {
-            display: flex;
-            align-items: flex-start;
-            gap: 12px;
-            margin-bottom: 8px;
-        }
-
-        .pr-badge {
-            background-color: #8957e5;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: 600;
-            white-space: nowrap;
-        }
-
-        .note-title {
-            font-size: 16px;
-            font-weight: 600;
-            color: #58a6ff;
-            flex: 1;
-        }
-
-        .note-meta {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            font-size: 12px;
-            color: #8b949e;
-            margin-top: 8px;
-        }
-
-        .commit-sha {
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            background-color: #1f6feb1a;
-            color: #58a6ff;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-size: 12px;
-        }
-
-        .empty-state {
-            text-align: center;
-            padding: 64px 32px;
-            color: #8b949e;
-        }
-
-        .empty-state h2 {
-            font-size: 24px;
-            margin-bottom: 8px;
-            color: #c9d1d9;
-        }
-
-        .empty-state p {
-            font-size: 14px;
-        }
-
-        .empty-state code {
-            background-color: #161b22;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ STYLESHEET_URLS.index }}">
 </head>
 <body>
     <div class="header">
@@ -596,9 +1411,10 @@ INDEX_TEMPLATE = """
     </div>
 
     <div class="container">
-        {% if notes %}
+        {% for note in notes %}
+        {% if loop.first %}
         <div class="notes-list">
-            {% for note in notes %}
+        {% endif %}
             <div class="note-item">
                 <a href="/note/{{ note.commit_sha }}?ref={{ notes_ref }}">
                     <div class="note-header">
@@ -614,8 +1430,9 @@ INDEX_TEMPLATE = """
                     </div>
                 </a>
             </div>
-            {% endfor %}
+        {% if loop.last %}
         </div>
+        {% endif %}
         {% else %}
         <div class="empty-state">
             <h2>No notes found</h2>
@@ -623,7 +1440,7 @@ INDEX_TEMPLATE = """
             <p style="margin-top: 16px;">Make sure you've fetched the notes reference:</p>
             <p style="margin-top: 8px;"><code>git fetch origin {{ notes_ref }}:{{ notes_ref }}</code></p>
         </div>
-        {% endif %}
+        {% endfor %}
     </div>
 </body>
 </html>
@@ -636,431 +1453,7 @@ NOTE_DETAIL_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{{ sections.title or 'PR Summary' }} - Git Notes Browser</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
-            background-color: #0d1117;
-            color: #c9d1d9;
-            line-height: 1.5;
-        }
-
-        .header {
-            background-color: #161b22;
-            border-bottom: 1px solid #30363d;
-            padding: 16px 32px;
-        }
-
-        .header-content {
-            max-width: 1280px;
-            margin: 0 auto;
-            display: flex;
-            align-items: center;
-            gap: 16px;
-        }
-
-        .back-link {
-            color: #58a6ff;
-            text-decoration: none;
-            font-size: 14px;
-        }
-
-        .back-link:hover {
-            text-decoration: underline;
-        }
-
-        .header h1 {
-            font-size: 20px;
-            font-weight: 600;
-            color: #f0f6fc;
-            flex: 1;
-        }
-
-        .container {
-            max-width: 1280px;
-            margin: 0 auto;
-            padding: 24px 32px;
-        }
-
-        .pr-header {
-            margin-bottom: 24px;
-        }
-
-        .pr-title {
-            font-size: 32px;
-            font-weight: 600;
-            color: #f0f6fc;
-            margin-bottom: 16px;
-            line-height: 1.25;
-        }
-
-        .pr-title-link {
-            color: #f0f6fc;
-            text-decoration: none;
-        }
-
-        .pr-title-link:hover {
-            color: #58a6ff;
-        }
-
-        .author-link {
-            color: inherit;
-            text-decoration: none;
-            font-weight: 600;
-        }
-
-        .author-link:hover {
-            color: #58a6ff;
-            text-decoration: underline;
-        }
-
-        .section {
-            background-color: #161b22;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            margin-bottom: 16px;
-            overflow: hidden;
-        }
-
-        .section-header {
-            background-color: #161b22;
-            padding: 16px;
-            border-bottom: 1px solid #30363d;
-            font-size: 14px;
-            font-weight: 600;
-            color: #f0f6fc;
-        }
-
-        .section-content {
-            padding: 16px;
-        }
-
-        .metadata-grid {
-            display: grid;
-            grid-template-columns: auto 1fr;
-            gap: 8px 16px;
-            font-size: 14px;
-        }
-
-        .metadata-label {
-            color: #8b949e;
-            font-weight: 600;
-        }
-
-        .metadata-value {
-            color: #c9d1d9;
-        }
-
-        .commit-list, .file-list, .comment-list {
-            list-style: none;
-        }
-
-        .commit-item, .file-item {
-            padding: 8px 0;
-            border-bottom: 1px solid #21262d;
-            font-size: 14px;
-        }
-
-        .commit-item:last-child, .file-item:last-child {
-            border-bottom: none;
-        }
-
-        .commit-sha {
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            background-color: #1f6feb1a;
-            color: #58a6ff;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-size: 12px;
-            margin-right: 8px;
-        }
-
-        .file-path {
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            color: #58a6ff;
-        }
-
-        .comment {
-            background-color: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            margin-bottom: 16px;
-            overflow: hidden;
-        }
-
-        .comment-header {
-            padding: 8px 16px;
-            background-color: #161b22;
-            border-bottom: 1px solid #30363d;
-            font-size: 12px;
-            color: #8b949e;
-        }
-
-        .comment-author {
-            color: #f0f6fc;
-            font-weight: 600;
-        }
-
-        .comment-body {
-            padding: 16px;
-            font-size: 14px;
-        }
-
-        .check-item {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            padding: 12px 0;
-            border-bottom: 1px solid #21262d;
-            font-size: 14px;
-        }
-
-        .check-item:last-child {
-            border-bottom: none;
-        }
-
-        .check-status {
-            width: 20px;
-            height: 20px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 12px;
-        }
-
-        .check-status.success {
-            background-color: #238636;
-            color: white;
-        }
-
-        .check-status.failure {
-            background-color: #da3633;
-            color: white;
-        }
-
-        .check-status.other {
-            background-color: #6e7681;
-            color: white;
-        }
-
-        .check-name {
-            flex: 1;
-            color: #f0f6fc;
-        }
-
-        .check-duration {
-            color: #8b949e;
-            font-size: 12px;
-        }
-
-        .markdown-content {
-            font-size: 14px;
-            line-height: 1.6;
-        }
-
-        .markdown-content p {
-            margin-bottom: 16px;
-        }
-
-        .markdown-content ul, .markdown-content ol {
-            margin-left: 24px;
-            margin-bottom: 16px;
-        }
-
-        .markdown-content li {
-            margin-bottom: 4px;
-        }
-
-        .markdown-content code {
-            background-color: #1f6feb1a;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            font-size: 12px;
-        }
-
-        .markdown-content pre {
-            background-color: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            padding: 16px;
-            overflow-x: auto;
-            margin-bottom: 16px;
-        }
-
-        .markdown-content pre code {
-            background: none;
-            padding: 0;
-            font-size: 12px;
-        }
-
-        .markdown-content h1, .markdown-content h2, .markdown-content h3 {
-            margin-top: 24px;
-            margin-bottom: 16px;
-            color: #f0f6fc;
-        }
-
-        .markdown-content h1 {
-            font-size: 24px;
-            border-bottom: 1px solid #30363d;
-            padding-bottom: 8px;
-        }
-
-        .markdown-content h2 {
-            font-size: 20px;
-        }
-
-        .markdown-content h3 {
-            font-size: 16px;
-        }
-
-        .markdown-content blockquote {
-            border-left: 4px solid #30363d;
-            padding-left: 16px;
-            margin: 16px 0;
-            color: #8b949e;
-        }
-
-        .markdown-content a {
-            color: #58a6ff;
-            text-decoration: none;
-        }
-
-        .markdown-content a:hover {
-            text-decoration: underline;
-        }
-
-        .footer {
-            text-align: center;
-            padding: 16px;
-            color: #8b949e;
-            font-size: 12px;
-            border-top: 1px solid #30363d;
-            margin-top: 24px;
-        }
-
-        .empty-section {
-            color: #8b949e;
-            font-style: italic;
-            font-size: 14px;
-        }
-
-        .code-comment {
-            background-color: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            margin-bottom: 16px;
-            overflow: hidden;
-        }
-
-        .code-comment-header {
-            background-color: #161b22;
-            padding: 8px 16px;
-            border-bottom: 1px solid #30363d;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        .code-comment-header .file-path {
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            color: #c9d1d9;
-            font-size: 14px;
-        }
-
-        .code-comment-header .line-number {
-            font-size: 12px;
-            color: #8b949e;
-        }
-
-        .code-context {
-            background-color: #0d1117;
-            border-bottom: 1px solid #30363d;
-            overflow-x: auto;
-        }
-
-        .code-context pre {
-            margin: 0;
-            padding: 12px 16px;
-            background-color: #161b22;
-            border: none;
-            border-radius: 0;
-        }
-
-        .code-context code {
-            font-size: 12px;
-            color: #c9d1d9;
-            line-height: 1.5;
-        }
-
-        .code-lines {
-            width: 100%;
-            border-collapse: collapse;
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            font-size: 12px;
-            line-height: 20px;
-        }
-
-        .code-lines td {
-            padding: 0;
-            border: none;
-        }
-
-        .code-lines .line-num {
-            width: 1%;
-            min-width: 50px;
-            padding: 0 10px;
-            text-align: right;
-            color: #6e7681;
-            background-color: #0d1117;
-            user-select: none;
-            vertical-align: top;
-        }
-
-        .code-lines .line-code {
-            padding: 0 10px;
-            color: #c9d1d9;
-            background-color: #0d1117;
-            white-space: pre;
-            vertical-align: top;
-        }
-
-        .code-lines tr:hover .line-num,
-        .code-lines tr:hover .line-code {
-            background-color: #161b22;
-        }
-
-        .code-lines tr.target-line .line-num,
-        .code-lines tr.target-line .line-code {
-            background-color: #ffd33d1a;
-        }
-
-        .code-lines tr.target-line .line-num {
-            color: #ffd33d;
-            font-weight: 600;
-        }
-
-        .code-comment-body {
-            padding: 16px;
-        }
-
-        .comment-meta {
-            margin-bottom: 12px;
-            font-size: 12px;
-            color: #8b949e;
-        }
-
-        .comment-meta .comment-author {
-            color: #f0f6fc;
-            font-weight: 600;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ STYLESHEET_URLS.note_detail }}">
 </head>
 <body>
     <div class="header">
@@ -1181,92 +1574,261 @@ NOTE_DETAIL_TEMPLATE = """
 </html>
 """
 
+# Stylesheet URLs carry a hash of their content, so they can be cached forever
+STYLESHEETS = {"index": INDEX_CSS, "note_detail": NOTE_DETAIL_CSS}
+STYLESHEET_DIGESTS = {
+    name: hashlib.sha1(css.encode()).hexdigest()[:12] for name, css in STYLESHEETS.items()
+}
+STYLESHEET_URLS = {
+    name: f"/assets/{name}.{digest}.css" for name, digest in STYLESHEET_DIGESTS.items()
+}
+
+# Templates are parsed and compiled once at import rather than on every request.
+# They use no Flask globals, so they get a plain Environment with a named
+# loader instead of Flask's debug-dependent one.
+JINJA_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader({
+        "index.html": INDEX_TEMPLATE,
+        "note_detail.html": NOTE_DETAIL_TEMPLATE,
+    }),
+    autoescape=True,
+    # The sources are constants, so skip freshness checks and keep compiled
+    # bytecode across restarts (the cache is keyed by source checksum)
+    auto_reload=False,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(pattern="__notes_browser_%s.cache"),
+)
+JINJA_ENV.globals["STYLESHEET_URLS"] = STYLESHEET_URLS
+INDEX_PAGE = JINJA_ENV.get_template("index.html")
+NOTE_DETAIL_PAGE = JINJA_ENV.get_template("note_detail.html")
+
+# Changes whenever a template or stylesheet does, so cached pages that link
+# an old stylesheet URL are revalidated after an upgrade
+PAGE_VERSION = hashlib.sha1(
+    "\n".join([INDEX_TEMPLATE, NOTE_DETAIL_TEMPLATE, *sorted(STYLESHEET_URLS.values())]).encode()
+).hexdigest()
+
+
+def notes_etag(reader: GitNotesReader) -> str:
+    """Build an ETag for a notes listing from the tips of all refs.
+
+    Notes are immutable for a given ref tip and commit metadata is immutable
+    for a given SHA, so the listing can only change when some ref moves.
+    Branch and remote refs count too: notes on commits that are not in the
+    repository are left out, so fetching a branch can add rows. The page
+    version covers the markup itself.
+    """
+    ref_tips = reader.get_ref_tips("refs/")
+    state = "\n".join(f"{ref} {sha}" for ref, sha in sorted(ref_tips.items()))
+    return hashlib.sha1(f"{PAGE_VERSION}\n{reader.notes_ref}\n{state}".encode()).hexdigest()
+
+
+def not_modified_response(etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already has this ETag, else None."""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def stream_json_array(items: Iterator[dict], batch_size: int = 64) -> Iterator[str]:
+    """Encode items as a JSON array, yielding output as items are produced.
+
+    Items are encoded compactly with the app's JSON provider (orjson is always
+    compact), as jsonify does outside debug mode, and sent in batches to avoid
+    a write per item.
+    """
+    parts = ["["]
+    for i, item in enumerate(items):
+        if i:
+            parts.append(",")
+        parts.append(app.json.dumps(item, separators=(",", ":")))
+        if len(parts) >= batch_size:
+            yield "".join(parts)
+            parts = []
+    parts.append("]\n")
+    yield "".join(parts)
+
 
 # Routes
 @app.route("/")
 def index():
     """Display list of all notes."""
     notes_ref = request.args.get("ref", NOTES_REF)
-    reader = GitNotesReader(REPO_PATH, notes_ref)
-    notes = reader.list_notes()
+    reader = _get_reader(REPO_PATH, notes_ref)
+
+    etag = notes_etag(reader)
+    not_modified = not_modified_response(etag)
+    if not_modified:
+        return not_modified
+
     available_refs = reader.list_available_refs()
-    return render_template_string(
-        INDEX_TEMPLATE,
-        notes=notes,
+
+    # Stream rows out as each note is read instead of building the whole page
+    stream = INDEX_PAGE.stream(
+        notes=reader.iter_notes(),
         notes_ref=notes_ref,
         available_refs=available_refs
     )
+    stream.enable_buffering()
+    response = Response(stream_with_context(stream), mimetype="text/html")
+    response.set_etag(etag, weak=True)
+    return response
 
 
-@app.route("/note/<commit_sha>")
-def note_detail(commit_sha: str):
-    """Display detailed view of a specific note."""
-    notes_ref = request.args.get("ref", NOTES_REF)
-    reader = GitNotesReader(REPO_PATH, notes_ref)
-    note_content = reader.get_note(commit_sha)
-
-    if not note_content:
-        return f"<h1>Note not found</h1><p>No note found for commit {commit_sha}</p>", 404
-
-    # Parse sections
-    sections = parse_note_sections(note_content)
-
-    # Parse code comments for special rendering
-    parsed_code_comments = []
-    if sections.get("code_comments"):
-        comments = parse_code_comments(sections["code_comments"])
-        parsed_code_comments = [
-            render_code_comment_html(c, commit_sha, reader)
-            for c in comments
-        ]
+@functools.lru_cache(maxsize=256)
+def render_note_sections(repo_path: str, commit_sha: str, note_oid: str) -> tuple[dict, list[str]]:
+    """Render a note's sections and code comments to HTML.
+
+    The note must exist (see load_note). The output depends only on the note
+    blob and on the commit the code context is read from, so it is cached by
+    both. Callers must not modify the result.
+    """
+    reader = _get_reader(repo_path)
+    _, parsed_sections, comments = load_note(repo_path, note_oid)
+    # Copied, since the markdown pass below replaces values
+    sections = dict(parsed_sections)
+
+    # Render parsed code comments specially
+    parsed_code_comments = [
+        render_code_comment_html(c, commit_sha, reader)
+        for c in comments
+    ]
 
     # Convert markdown to HTML for each section (except code_comments if parsed)
     for key, value in sections.items():
         if value and key != "title" and key != "code_comments" and key != "pr_url" and key != "pr_number":
-            html = markdown2.markdown(
-                value,
-                extras=["fenced-code-blocks", "tables", "break-on-newline"]
-            )
-            # Linkify author mentions
-            sections[key] = linkify_authors(html)
+            sections[key] = render_markdown(value)
 
     # Only convert code_comments to markdown if we didn't parse them
     if sections.get("code_comments") and not parsed_code_comments:
-        html = markdown2.markdown(
-            sections["code_comments"],
-            extras=["fenced-code-blocks", "tables", "break-on-newline"]
-        )
-        sections["code_comments"] = linkify_authors(html)
+        sections["code_comments"] = render_markdown(sections["code_comments"])
 
-    return render_template_string(
-        NOTE_DETAIL_TEMPLATE,
+    return sections, parsed_code_comments
+
+
+def render_note_page(reader: GitNotesReader, commit_sha: str, note_oid: str) -> str:
+    """Render the detail page HTML for an existing note."""
+    sections, parsed_code_comments = render_note_sections(reader.repo_path, commit_sha, note_oid)
+    return NOTE_DETAIL_PAGE.render(
         sections=sections,
         commit_sha=commit_sha,
-        notes_ref=notes_ref,
+        notes_ref=reader.notes_ref,
         parsed_code_comments=parsed_code_comments
     )
 
 
+class _NotePageCache:
+    """Detail pages for the most recent notes, rendered ahead of time.
+
+    Entries map (notes_ref, commit_sha) to (note_oid, html). A hit is only
+    served while the commit's note is still that blob, so a refresh that has
+    not yet caught up with a moved notes ref never serves a stale page.
+    """
+
+    def __init__(self):
+        self._pages: dict[tuple[str, str], tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, notes_ref: str, commit_sha: str, note_oid: str) -> Optional[str]:
+        """Return the precomputed page for this note, if still current."""
+        with self._lock:
+            entry = self._pages.get((notes_ref, commit_sha))
+        if entry is None or entry[0] != note_oid:
+            return None
+        return entry[1]
+
+    def refresh(self, repo_path: str, notes_ref: str, count: int) -> None:
+        """Render the `count` most recent notes and replace the cached pages."""
+        reader = _get_reader(repo_path, notes_ref)
+        pages = {}
+        for note in itertools.islice(reader.iter_notes(), count):
+            commit_sha, note_oid = note["commit_sha"], note["note_sha"]
+            if load_note(repo_path, note_oid):
+                html = render_note_page(reader, commit_sha, note_oid)
+                pages[(notes_ref, commit_sha)] = (note_oid, html)
+
+        with self._lock:
+            self._pages = pages
+
+    def start_refresher(self, repo_path: str, notes_ref: str, count: int, interval: float) -> None:
+        """Refresh now and then every `interval` seconds on a daemon thread."""
+        def run():
+            while True:
+                try:
+                    self.refresh(repo_path, notes_ref, count)
+                except Exception as e:
+                    print(f"Warning: note page precompute failed: {e}")
+                time.sleep(interval)
+
+        threading.Thread(target=run, name="note-page-precompute", daemon=True).start()
+
+
+note_pages = _NotePageCache()
+
+
+@app.route("/assets/<name>.<digest>.css")
+def stylesheet(name: str, digest: str):
+    """Serve a page stylesheet; its URL changes whenever its content does."""
+    if STYLESHEET_DIGESTS.get(name) != digest:
+        return "Not found", 404
+
+    response = Response(STYLESHEETS[name], mimetype="text/css")
+    response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+@app.route("/note/<commit_sha>")
+def note_detail(commit_sha: str):
+    """Display detailed view of a specific note."""
+    notes_ref = request.args.get("ref", NOTES_REF)
+    reader = _get_reader(REPO_PATH, notes_ref)
+
+    # The page and code context caches are keyed by commit, so a moving
+    # revision such as HEAD or a branch name is pinned to its SHA first
+    revision = commit_sha
+    commit_sha = reader.resolve_commit(revision)
+    note_oid = reader.get_note_oid(commit_sha) if commit_sha else None
+
+    if not note_oid or not load_note(REPO_PATH, note_oid):
+        return f"<h1>Note not found</h1><p>No note found for commit {revision}</p>", 404
+
+    page = note_pages.get(notes_ref, commit_sha, note_oid)
+    if page is None:
+        page = render_note_page(reader, commit_sha, note_oid)
+    return page
+
+
 @app.route("/api/notes")
 def api_notes():
     """API endpoint to get list of notes as JSON."""
     notes_ref = request.args.get("ref", NOTES_REF)
-    reader = GitNotesReader(REPO_PATH, notes_ref)
-    notes = reader.list_notes()
-    return jsonify(notes)
+    reader = _get_reader(REPO_PATH, notes_ref)
+
+    etag = notes_etag(reader)
+    not_modified = not_modified_response(etag)
+    if not_modified:
+        return not_modified
+
+    # Stream entries out as each note is read instead of building the whole list
+    response = Response(stream_json_array(reader.iter_notes()), mimetype=app.json.mimetype)
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @app.route("/api/note/<commit_sha>")
 def api_note_detail(commit_sha: str):
     """API endpoint to get note content as JSON."""
     notes_ref = request.args.get("ref", NOTES_REF)
-    reader = GitNotesReader(REPO_PATH, notes_ref)
-    note_content = reader.get_note(commit_sha)
+    reader = _get_reader(REPO_PATH, notes_ref)
+    note_oid = reader.get_note_oid(commit_sha)
+    note = load_note(REPO_PATH, note_oid) if note_oid else None
 
-    if not note_content:
+    if not note:
         return jsonify({"error": "Note not found"}), 404
 
-    sections = parse_note_sections(note_content)
+    note_content, sections, _ = note
     return jsonify({
         "commit_sha": commit_sha,
         "sections": sections,
@@ -1278,7 +1840,7 @@ def api_note_detail(commit_sha: str):
 @app.route("/api/refs")
 def api_refs():
     """API endpoint to get list of available refs as JSON."""
-    reader = GitNotesReader(REPO_PATH, NOTES_REF)
+    reader = _get_reader(REPO_PATH, NOTES_REF)
     refs = reader.list_available_refs()
     return jsonify({"refs": refs})
 
@@ -1314,6 +1876,29 @@ def main():
         default="127.0.0.1",
         help="Host to bind to (default: 127.0.0.1)"
     )
+    parser.add_argument(
+        "--precompute",
+        type=int,
+        default=20,
+        help="Number of most recent note pages to render ahead of time, 0 to disable (default: 20)"
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=300,
+        help="Seconds between re-renders of the precomputed note pages (default: 300)"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=8,
+        help="Worker threads for the waitress server (default: 8)"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Run Flask's development server in debug mode with the auto-reloader"
+    )
 
     args = parser.parse_args()
 
@@ -1326,7 +1911,16 @@ def main():
     print(f"   Server: http://{args.host}:{args.port}")
     print()
 
-    app.run(host=args.host, port=args.port, debug=True)
+    # The debug reloader also runs main() in its file-watching parent
+    # process; only the child that serves requests needs the pages.
+    serving = not args.debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+    if args.precompute > 0 and serving:
+        note_pages.start_refresher(REPO_PATH, NOTES_REF, args.precompute, args.refresh_interval)
+
+    if waitress is not None and not args.debug:
+        waitress.serve(app, host=args.host, port=args.port, threads=args.threads)
+    else:
+        app.run(host=args.host, port=args.port, debug=args.debug)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,15 @@ PR activity data collection and transformation.
 Orchestrates fetching data from GitHub API and transforms it into typed models.
 """
 
+import functools
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, Callable, Iterator, Optional
 
-from .github_client import GitHubClient
+from .github_client import GRAPHQL_BATCH_SIZE, GitHubAPIError, GitHubClient
 from .models import (
     CheckRun,
     Commit,
@@ -22,23 +25,69 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Issue references in one pass: a closing keyword reference (closes/fixes/
+# resolves #123) or a plain reference (#123, owner/repo#123)
+_ISSUE_REF_RE = re.compile(
+    r"(?P<close>close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s+#(?P<close_num>\d+)"
+    r"|(?:^|[\s(])(?:[\w-]+/[\w-]+)?#(?P<ref_num>\d+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# Login shown for deleted accounts, which GraphQL returns as a null author
+GHOST_USER = "ghost"
+
+
+def _login(actor: Optional[dict[str, Any]]) -> str:
+    """Get a GraphQL actor's login, falling back to the ghost user."""
+    return actor["login"] if actor else GHOST_USER
+
+
+def _has_next_page(node: Any) -> bool:
+    """Check whether any GraphQL connection in a response was cut off."""
+    if isinstance(node, dict):
+        page_info = node.get("pageInfo")
+        if page_info and page_info.get("hasNextPage"):
+            return True
+        return any(_has_next_page(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_has_next_page(item) for item in node)
+    return False
+
+
+def _has_unstarted_check_run(pr: dict[str, Any]) -> bool:
+    """Check whether GraphQL returned a check run without a start time (e.g. a queued one)."""
+    merge_commit = pr.get("mergeCommit") or pr.get("potentialMergeCommit")
+    if not merge_commit:
+        return False
+    return any(
+        not check_data.get("startedAt")
+        for suite in merge_commit["checkSuites"]["nodes"]
+        for check_data in suite["checkRuns"]["nodes"]
+    )
+
 
 class PRActivityCollector:
     """Collects and transforms PR activity data from GitHub API."""
 
-    def __init__(self, client: GitHubClient):
+    def __init__(self, client: GitHubClient, use_graphql: bool = True):
         """
         Initialize collector with GitHub API client.
 
         Args:
             client: Configured GitHubClient instance
+            use_graphql: Try one GraphQL query before the REST endpoints
         """
         self.client = client
+        self.use_graphql = use_graphql
 
     def collect_all_activity(self, pr_number: int) -> PRActivity:
         """
         Collect all activity data for a PR.
 
+        Everything but the file changes comes from a single GraphQL query
+        when it fits; the REST endpoints are used otherwise.
+
         Args:
             pr_number: Pull request number
 
@@ -48,49 +97,101 @@ class PRActivityCollector:
         Raises:
             GitHubAPIError: If API requests fail
         """
-        logger.info(f"Collecting activity for PR #{pr_number}")
+        if self.use_graphql:
+            return self._collect_activity(pr_number, lambda: self._fetch_pr_graphql(pr_number))
+        return self._collect_activity(pr_number, lambda: None)
 
-        # Fetch base PR data
-        pr_data = self.client.get_pull_request(pr_number)
+    def collect_activities(self, pr_numbers: list[int]) -> Iterator[PRActivity]:
+        """
+        Collect all activity data for several PRs.
 
-        # Collect all activity data in parallel would be ideal, but we'll do it sequentially
-        logger.info("Fetching commits...")
-        commits = self._collect_commits(pr_number)
+        The GraphQL data for up to GRAPHQL_BATCH_SIZE PRs is fetched in one
+        query, and each PR is yielded as soon as it is complete.
 
-        logger.info("Fetching file changes...")
-        file_changes = self._collect_file_changes(pr_number)
+        Args:
+            pr_numbers: Pull request numbers
 
-        logger.info("Fetching comments...")
-        comments = self._collect_comments(pr_number)
+        Yields:
+            Complete PRActivity for each PR, in the order given
 
-        logger.info("Fetching reviews...")
-        reviews = self._collect_reviews(pr_number)
+        Raises:
+            GitHubAPIError: If API requests fail
+        """
+        for start in range(0, len(pr_numbers), GRAPHQL_BATCH_SIZE):
+            batch = pr_numbers[start:start + GRAPHQL_BATCH_SIZE]
+            graphql_prs = self._fetch_prs_graphql(batch) if self.use_graphql else {}
+            for pr_number in batch:
+                yield self._collect_activity(pr_number, functools.partial(graphql_prs.get, pr_number))
+
+    def _collect_activity(
+        self, pr_number: int, get_graphql_pr: Callable[[], Optional[dict[str, Any]]]
+    ) -> PRActivity:
+        """Collect a PR's activity, using its GraphQL data if get_graphql_pr returns any."""
+        logger.info(f"Collecting activity for PR #{pr_number}")
 
-        logger.info("Fetching check runs...")
-        check_runs = []
-        if pr_data.get("merge_commit_sha"):
-            check_runs = self._collect_check_runs(pr_data["merge_commit_sha"])
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            # File changes need REST either way (GraphQL has no patches), so
+            # start them before anything else
+            file_changes_future = executor.submit(self._collect_file_changes, pr_number)
+
+            graphql_pr = get_graphql_pr()
+            if graphql_pr is not None:
+                logger.info("Fetched PR data, commits, comments, reviews and check runs in one GraphQL query")
+                pr_data = self._graphql_pr_data(graphql_pr)
+                commits = self._graphql_commits(graphql_pr)
+                comments = self._graphql_comments(graphql_pr)
+                reviews = self._graphql_reviews(graphql_pr)
+                check_runs = self._graphql_check_runs(graphql_pr)
+            else:
+                # Only the check runs depend on the PR data (for its merge commit), so
+                # start everything else before fetching it and run all concurrently
+                logger.info("Fetching PR data, commits, file changes, comments, reviews and check runs...")
+                commits_future = executor.submit(self._collect_commits, pr_number)
+                comments_future = executor.submit(self._collect_comments, pr_number)
+                reviews_future = executor.submit(self._collect_reviews, pr_number)
+
+                # Fetch base PR data on this thread while the others are in flight
+                pr_data = self.client.get_pull_request(pr_number)
+
+                check_runs_future = None
+                if pr_data.get("merge_commit_sha"):
+                    check_runs_future = executor.submit(self._collect_check_runs, pr_data["merge_commit_sha"])
+
+                commits = commits_future.result()
+                comments = comments_future.result()
+                reviews = reviews_future.result()
+                check_runs = check_runs_future.result() if check_runs_future else []
+
+            file_changes = file_changes_future.result()
 
         logger.info("Extracting linked issues...")
         linked_issues, closes_issues = self._extract_linked_issues(pr_data)
 
+        # Bind nested objects used more than once
+        user = pr_data["user"]
+        base = pr_data["base"]
+        head = pr_data["head"]
+        head_repo = head["repo"]
+        merged_by = pr_data.get("merged_by")
+        merged_at = pr_data.get("merged_at")
+
         # Build PRActivity object
         activity = PRActivity(
             number=pr_data["number"],
             title=pr_data["title"],
-            author=pr_data["user"]["login"],
-            author_avatar_url=pr_data["user"]["avatar_url"],
-            state="merged" if pr_data.get("merged_at") else pr_data["state"],
-            base_branch=pr_data["base"]["ref"],
-            head_branch=pr_data["head"]["ref"],
-            base_repo=pr_data["base"]["repo"]["full_name"],
-            head_repo=pr_data["head"]["repo"]["full_name"] if pr_data["head"]["repo"] else "unknown",
+            author=user["login"],
+            author_avatar_url=user["avatar_url"],
+            state="merged" if merged_at else pr_data["state"],
+            base_branch=base["ref"],
+            head_branch=head["ref"],
+            base_repo=base["repo"]["full_name"],
+            head_repo=head_repo["full_name"] if head_repo else "unknown",
             created_at=self._parse_datetime_required(pr_data["created_at"], "created_at"),
             updated_at=self._parse_datetime_required(pr_data["updated_at"], "updated_at"),
             closed_at=self._parse_datetime(pr_data.get("closed_at")),
-            merged_at=self._parse_datetime(pr_data.get("merged_at")),
+            merged_at=self._parse_datetime(merged_at),
             merge_commit_sha=pr_data.get("merge_commit_sha"),
-            merged_by=pr_data["merged_by"]["login"] if pr_data.get("merged_by") else None,
+            merged_by=merged_by["login"] if merged_by else None,
             description=pr_data.get("body") or "",
             labels=[label["name"] for label in pr_data.get("labels", [])],
             linked_issues=linked_issues,
@@ -118,102 +219,127 @@ class PRActivityCollector:
 
     def _collect_commits(self, pr_number: int) -> list[Commit]:
         """Collect and transform commits."""
-        commits_data = self.client.get_pr_commits(pr_number)
-
-        commits = []
-        for commit_data in commits_data:
-            commit = Commit(
-                sha=commit_data["sha"],
-                message=commit_data["commit"]["message"],
-                author=commit_data["commit"]["author"]["name"],
-                author_email=commit_data["commit"]["author"]["email"],
-                timestamp=self._parse_datetime_required(commit_data["commit"]["author"]["date"], "commit.author.date"),
-                url=commit_data["html_url"],
+        parse_datetime_required = self._parse_datetime_required
+
+        # Transform each page as it arrives rather than after the last one
+        commits: list[Commit] = []
+        for commits_page in self.client.iter_pr_commits(pr_number):
+            commits.extend(
+                Commit(
+                    sha=commit_data["sha"],
+                    message=commit_data["commit"]["message"],
+                    author=commit_data["commit"]["author"]["name"],
+                    author_email=commit_data["commit"]["author"]["email"],
+                    timestamp=parse_datetime_required(commit_data["commit"]["author"]["date"], "commit.author.date"),
+                    url=commit_data["html_url"],
+                )
+                for commit_data in commits_page
             )
-            commits.append(commit)
 
         return commits
 
     def _collect_file_changes(self, pr_number: int) -> list[FileChange]:
         """Collect and transform file changes."""
-        files_data = self.client.get_pr_files(pr_number)
-
-        file_changes = []
-        for file_data in files_data:
-            file_change = FileChange(
-                filename=file_data["filename"],
-                status=file_data["status"],
-                additions=file_data["additions"],
-                deletions=file_data["deletions"],
-                changes=file_data["changes"],
-                patch=file_data.get("patch"),
-                previous_filename=file_data.get("previous_filename"),
+        file_changes: list[FileChange] = []
+        for files_page in self.client.iter_pr_files(pr_number):
+            file_changes.extend(
+                FileChange(
+                    filename=file_data["filename"],
+                    status=file_data["status"],
+                    additions=file_data["additions"],
+                    deletions=file_data["deletions"],
+                    changes=file_data["changes"],
+                    patch=file_data.get("patch"),
+                    previous_filename=file_data.get("previous_filename"),
+                )
+                for file_data in files_page
             )
-            file_changes.append(file_change)
 
         return file_changes
 
     def _collect_comments(self, pr_number: int) -> list[PRComment]:
         """Collect and transform all comments (conversation + review)."""
-        comments = []
-
-        # Get conversation comments (issue comments)
-        issue_comments = self.client.get_issue_comments(pr_number)
-        for comment_data in issue_comments:
-            comment = PRComment(
-                id=comment_data["id"],
-                author=comment_data["user"]["login"],
-                created_at=self._parse_datetime_required(comment_data["created_at"], "comment.created_at"),
-                updated_at=self._parse_datetime(comment_data.get("updated_at")),
-                body=comment_data["body"],
-                comment_type="conversation",
-                url=comment_data["html_url"],
-            )
-            comments.append(comment)
-
-        # Get review comments (inline code comments)
-        review_comments = self.client.get_pr_comments(pr_number)
-        for comment_data in review_comments:
-            comment = PRComment(
-                id=comment_data["id"],
-                author=comment_data["user"]["login"],
-                created_at=self._parse_datetime_required(comment_data["created_at"], "comment.created_at"),
-                updated_at=self._parse_datetime(comment_data.get("updated_at")),
-                body=comment_data["body"],
-                comment_type="inline",
-                url=comment_data["html_url"],
-                file_path=comment_data.get("path"),
-                line_number=comment_data.get("line") or comment_data.get("original_line"),
-                diff_hunk=comment_data.get("diff_hunk"),
-                in_reply_to_id=comment_data.get("in_reply_to_id"),
+        # The two comment endpoints are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            issue_comments_future = executor.submit(self._collect_issue_comments, pr_number)
+            review_comments_future = executor.submit(self._collect_review_comments, pr_number)
+            comments = issue_comments_future.result()
+            comments.extend(review_comments_future.result())
+
+        # Sort by creation time. Each endpoint returns its comments in creation
+        # order, so this is a run-merging pass over two sorted runs.
+        comments.sort(key=attrgetter("created_at"))
+
+        return comments
+
+    def _collect_issue_comments(self, pr_number: int) -> list[PRComment]:
+        """Collect and transform conversation comments (issue comments)."""
+        parse_datetime = self._parse_datetime
+        parse_datetime_required = self._parse_datetime_required
+
+        comments: list[PRComment] = []
+        for comments_page in self.client.iter_issue_comments(pr_number):
+            comments.extend(
+                PRComment(
+                    id=comment_data["id"],
+                    author=comment_data["user"]["login"],
+                    created_at=parse_datetime_required(comment_data["created_at"], "comment.created_at"),
+                    updated_at=parse_datetime(comment_data.get("updated_at")),
+                    body=comment_data["body"],
+                    comment_type="conversation",
+                    url=comment_data["html_url"],
+                )
+                for comment_data in comments_page
             )
-            comments.append(comment)
 
-        # Sort by creation time
-        comments.sort(key=lambda c: c.created_at)
+        return comments
+
+    def _collect_review_comments(self, pr_number: int) -> list[PRComment]:
+        """Collect and transform review comments (inline code comments)."""
+        parse_datetime = self._parse_datetime
+        parse_datetime_required = self._parse_datetime_required
+
+        comments: list[PRComment] = []
+        for comments_page in self.client.iter_pr_comments(pr_number):
+            comments.extend(
+                PRComment(
+                    id=comment_data["id"],
+                    author=comment_data["user"]["login"],
+                    created_at=parse_datetime_required(comment_data["created_at"], "comment.created_at"),
+                    updated_at=parse_datetime(comment_data.get("updated_at")),
+                    body=comment_data["body"],
+                    comment_type="inline",
+                    url=comment_data["html_url"],
+                    file_path=comment_data.get("path"),
+                    line_number=comment_data.get("line") or comment_data.get("original_line"),
+                    diff_hunk=comment_data.get("diff_hunk"),
+                    in_reply_to_id=comment_data.get("in_reply_to_id"),
+                )
+                for comment_data in comments_page
+            )
 
         return comments
 
     def _collect_reviews(self, pr_number: int) -> list[Review]:
         """Collect and transform PR reviews."""
-        reviews_data = self.client.get_pr_reviews(pr_number)
-
-        reviews = []
-        for review_data in reviews_data:
-            # Skip reviews without a state (shouldn't happen, but defensive)
-            if not review_data.get("state"):
-                continue
-
-            review = Review(
-                id=review_data["id"],
-                author=review_data["user"]["login"],
-                state=review_data["state"],
-                submitted_at=self._parse_datetime(review_data.get("submitted_at")),
-                body=review_data.get("body"),
-                url=review_data["html_url"],
-                commit_sha=review_data.get("commit_id"),
+        parse_datetime = self._parse_datetime
+
+        reviews: list[Review] = []
+        for reviews_page in self.client.iter_pr_reviews(pr_number):
+            reviews.extend(
+                Review(
+                    id=review_data["id"],
+                    author=review_data["user"]["login"],
+                    state=review_data["state"],
+                    submitted_at=parse_datetime(review_data.get("submitted_at")),
+                    body=review_data.get("body"),
+                    url=review_data["html_url"],
+                    commit_sha=review_data.get("commit_id"),
+                )
+                for review_data in reviews_page
+                # Skip reviews without a state (shouldn't happen, but defensive)
+                if review_data.get("state")
             )
-            reviews.append(review)
 
         # Sort by submission time
         reviews.sort(key=lambda r: r.submitted_at or datetime.min)
@@ -228,21 +354,186 @@ class PRActivityCollector:
             logger.warning(f"Failed to fetch check runs for {ref}: {e}")
             return []
 
-        check_runs = []
-        for check_data in check_runs_data:
-            check_run = CheckRun(
+        parse_datetime = self._parse_datetime
+        parse_datetime_required = self._parse_datetime_required
+
+        return [
+            CheckRun(
                 id=check_data["id"],
                 name=check_data["name"],
                 status=check_data["status"],
                 conclusion=check_data.get("conclusion"),
-                started_at=self._parse_datetime_required(check_data["started_at"], "check_run.started_at"),
-                completed_at=self._parse_datetime(check_data.get("completed_at")),
+                started_at=parse_datetime_required(check_data["started_at"], "check_run.started_at"),
+                completed_at=parse_datetime(check_data.get("completed_at")),
                 html_url=check_data["html_url"],
                 app_name=check_data.get("app", {}).get("name"),
             )
-            check_runs.append(check_run)
+            for check_data in check_runs_data
+        ]
 
-        return check_runs
+    def _fetch_pr_graphql(self, pr_number: int) -> Optional[dict[str, Any]]:
+        """Get the PR from GraphQL, or None if it failed or didn't fit in one query."""
+        return self._fetch_prs_graphql([pr_number]).get(pr_number)
+
+    def _fetch_prs_graphql(self, pr_numbers: list[int]) -> dict[int, dict[str, Any]]:
+        """Get PRs from GraphQL, leaving out any that failed or didn't fit in one query."""
+        try:
+            prs = self.client.fetch_prs_graphql(pr_numbers)
+        except GitHubAPIError as e:
+            logger.info(f"GraphQL query unavailable, using REST API: {e}")
+            return {}
+
+        complete = {}
+        for pr_number, pr in prs.items():
+            if _has_next_page(pr):
+                logger.info(f"PR #{pr_number} has more than 100 items in a GraphQL connection, using REST API")
+            elif _has_unstarted_check_run(pr):
+                # REST sets started_at as soon as a check run is created
+                logger.info(f"PR #{pr_number} has a check run without a start time in GraphQL, using REST API")
+            else:
+                complete[pr_number] = pr
+        return complete
+
+    @staticmethod
+    def _graphql_pr_data(pr: dict[str, Any]) -> dict[str, Any]:
+        """Reshape a GraphQL pullRequest into the REST PR fields used to build PRActivity."""
+        author = pr.get("author") or {}
+        merged_by = pr.get("mergedBy")
+        head_repo = pr.get("headRepository")
+        merge_commit = pr.get("mergeCommit") or pr.get("potentialMergeCommit")
+
+        return {
+            "number": pr["number"],
+            "title": pr["title"],
+            "user": {"login": author.get("login", GHOST_USER), "avatar_url": author.get("avatarUrl", "")},
+            # REST reports merged PRs as closed, with merged_at set
+            "state": "open" if pr["state"] == "OPEN" else "closed",
+            "base": {"ref": pr["baseRefName"], "repo": {"full_name": pr["baseRepository"]["nameWithOwner"]}},
+            "head": {
+                "ref": pr["headRefName"],
+                "repo": {"full_name": head_repo["nameWithOwner"]} if head_repo else None,
+            },
+            "created_at": pr["createdAt"],
+            "updated_at": pr["updatedAt"],
+            "closed_at": pr.get("closedAt"),
+            "merged_at": pr.get("mergedAt"),
+            "merge_commit_sha": merge_commit["oid"] if merge_commit else None,
+            "merged_by": {"login": merged_by["login"]} if merged_by else None,
+            "body": pr.get("body"),
+            "labels": pr["labels"]["nodes"],
+            "html_url": pr["url"],
+            "diff_url": f"{pr['url']}.diff",
+            "patch_url": f"{pr['url']}.patch",
+        }
+
+    def _graphql_commits(self, pr: dict[str, Any]) -> list[Commit]:
+        """Transform GraphQL PR commits."""
+        parse_datetime_required = self._parse_datetime_required
+
+        commits = []
+        for node in pr["commits"]["nodes"]:
+            commit_data = node["commit"]
+            author = commit_data["author"]
+            commits.append(
+                Commit(
+                    sha=commit_data["oid"],
+                    message=commit_data["message"],
+                    author=author["name"],
+                    author_email=author["email"],
+                    timestamp=parse_datetime_required(author["date"], "commit.author.date"),
+                    url=commit_data["url"],
+                )
+            )
+        return commits
+
+    def _graphql_comments(self, pr: dict[str, Any]) -> list[PRComment]:
+        """Transform GraphQL conversation and review thread comments."""
+        parse_datetime = self._parse_datetime
+        parse_datetime_required = self._parse_datetime_required
+
+        comments = [
+            PRComment(
+                id=comment_data["databaseId"],
+                author=_login(comment_data.get("author")),
+                created_at=parse_datetime_required(comment_data["createdAt"], "comment.created_at"),
+                updated_at=parse_datetime(comment_data.get("updatedAt")),
+                body=comment_data["body"],
+                comment_type="conversation",
+                url=comment_data["url"],
+            )
+            for comment_data in pr["comments"]["nodes"]
+        ]
+
+        comments.extend(
+            PRComment(
+                id=comment_data["databaseId"],
+                author=_login(comment_data.get("author")),
+                created_at=parse_datetime_required(comment_data["createdAt"], "comment.created_at"),
+                updated_at=parse_datetime(comment_data.get("updatedAt")),
+                body=comment_data["body"],
+                comment_type="inline",
+                url=comment_data["url"],
+                file_path=comment_data.get("path"),
+                line_number=comment_data.get("line") or comment_data.get("originalLine"),
+                diff_hunk=comment_data.get("diffHunk"),
+                in_reply_to_id=(comment_data.get("replyTo") or {}).get("databaseId"),
+            )
+            for thread in pr["reviewThreads"]["nodes"]
+            for comment_data in thread["comments"]["nodes"]
+        )
+
+        # Threads are ordered by thread, not by comment time
+        comments.sort(key=attrgetter("created_at"))
+
+        return comments
+
+    def _graphql_reviews(self, pr: dict[str, Any]) -> list[Review]:
+        """Transform GraphQL PR reviews."""
+        parse_datetime = self._parse_datetime
+
+        reviews = [
+            Review(
+                id=review_data["databaseId"],
+                author=_login(review_data.get("author")),
+                state=review_data["state"],
+                submitted_at=parse_datetime(review_data.get("submittedAt")),
+                body=review_data.get("body"),
+                url=review_data["url"],
+                commit_sha=(review_data.get("commit") or {}).get("oid"),
+            )
+            for review_data in pr["reviews"]["nodes"]
+            if review_data.get("state")
+        ]
+
+        # Sort by submission time
+        reviews.sort(key=lambda r: r.submitted_at or datetime.min)
+
+        return reviews
+
+    def _graphql_check_runs(self, pr: dict[str, Any]) -> list[CheckRun]:
+        """Transform the GraphQL check runs of the PR's merge commit."""
+        merge_commit = pr.get("mergeCommit") or pr.get("potentialMergeCommit")
+        if not merge_commit:
+            return []
+
+        parse_datetime = self._parse_datetime
+        parse_datetime_required = self._parse_datetime_required
+
+        # GraphQL enums are upper case; REST (and the models) use lower case
+        return [
+            CheckRun(
+                id=check_data["databaseId"],
+                name=check_data["name"],
+                status=check_data["status"].lower(),
+                conclusion=check_data["conclusion"].lower() if check_data.get("conclusion") else None,
+                started_at=parse_datetime_required(check_data["startedAt"], "check_run.started_at"),
+                completed_at=parse_datetime(check_data.get("completedAt")),
+                html_url=check_data["url"],
+                app_name=(suite.get("app") or {}).get("name"),
+            )
+            for suite in merge_commit["checkSuites"]["nodes"]
+            for check_data in suite["checkRuns"]["nodes"]
+        ]
 
     def _extract_linked_issues(self, pr_data: dict[str, Any]) -> tuple[list[int], list[int]]:
         """
@@ -256,21 +547,16 @@ class PRActivityCollector:
         """
         body = pr_data.get("body") or ""
 
-        # Patterns for issue references
-        # Matches: #123, owner/repo#123
-        reference_pattern = r"(?:^|[\s(])(?:[\w-]+/[\w-]+)?#(\d+)"
-
-        # Patterns for closing keywords
-        # Matches: closes #123, fixes #123, resolves #123, etc.
-        closing_pattern = r"(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s+#(\d+)"
-
-        # Find all issue references
-        all_refs = re.findall(reference_pattern, body, re.IGNORECASE | re.MULTILINE)
-        linked_issues = [int(num) for num in all_refs]
-
-        # Find closing references
-        closing_refs = re.findall(closing_pattern, body, re.IGNORECASE | re.MULTILINE)
-        closes_issues = [int(num) for num in closing_refs]
+        linked_issues: list[int] = []
+        closes_issues: list[int] = []
+        for match in _ISSUE_REF_RE.finditer(body):
+            if match.group("close"):
+                # A closing reference is also a linked one
+                number = int(match.group("close_num"))
+                closes_issues.append(number)
+            else:
+                number = int(match.group("ref_num"))
+            linked_issues.append(number)
 
         return sorted(set(linked_issues)), sorted(set(closes_issues))
 
@@ -288,9 +574,9 @@ class PRActivityCollector:
         if not dt_string:
             return None
 
-        # GitHub returns ISO 8601 with Z suffix
-        # Python 3.11+ can handle this natively
-        return datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+        # GitHub returns ISO 8601 with Z suffix, which fromisoformat()
+        # parses natively on Python 3.11+
+        return datetime.fromisoformat(dt_string)
 
     @staticmethod
     def _parse_datetime_required(dt_string: Optional[str], field_name: str = "datetime") -> datetime:
@@ -310,6 +596,6 @@ class PRActivityCollector:
         if not dt_string:
             raise ValueError(f"Required {field_name} field is missing")
 
-        # GitHub returns ISO 8601 with Z suffix
-        # Python 3.11+ can handle this natively
-        return datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+        # GitHub returns ISO 8601 with Z suffix, which fromisoformat()
+        # parses natively on Python 3.11+
+        return datetime.fromisoformat(dt_string)
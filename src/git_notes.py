@@ -5,6 +5,8 @@ Handles creation and management of git notes attached to commits.
 """
 
 import logging
+import os
+import re
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -12,6 +14,32 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# One line of `git notes list` output: "<note_sha> <commit_sha>" (SHA-1 or SHA-256)
+_NOTE_LINE_RE = re.compile(r"([0-9a-f]{40,64}) ([0-9a-f]{40,64})")
+
+
+def _stripspace(text: str) -> str:
+    """
+    Clean up note content the way ``git notes add`` does (``git stripspace``).
+
+    Strips trailing whitespace from each line, drops leading and trailing
+    blank lines, collapses runs of blank lines into one and ends the text
+    with a single newline.
+    """
+    lines: list[str] = []
+    pending_blank = False
+    for line in text.split("\n"):
+        # git only treats ASCII space, tab and CR as whitespace here
+        line = line.rstrip(" \t\r")
+        if not line:
+            pending_blank = bool(lines)
+            continue
+        if pending_blank:
+            lines.append("")
+            pending_blank = False
+        lines.append(line)
+    return "".join(f"{line}\n" for line in lines)
+
 
 class GitNotesError(Exception):
     """Base exception for git notes operations."""
@@ -33,16 +61,125 @@ class GitNotesManager:
         self.repo_path = Path(repo_path).resolve()
         self.notes_ref = notes_ref
 
+        # cwd for git subprocesses, stringified once instead of per call
+        self._repo_str = str(self.repo_path)
+
+        # Long-lived `git cat-file --batch-check`, started on first lookup
+        self._catfile: Optional[subprocess.Popen[str]] = None
+
         # Validate repository
         self._validate_repo()
 
     def _validate_repo(self) -> None:
         """Validate that repo_path is a git repository."""
+        # Most checkouts can be recognized without spawning git
+        if self._has_git_dir():
+            return
+
         try:
             self._run_git_command(["git", "rev-parse", "--git-dir"])
         except GitNotesError as e:
             raise GitNotesError(f"Not a git repository: {self.repo_path}") from e
 
+    def _has_git_dir(self) -> bool:
+        """
+        Check for a ``.git`` directory or worktree link in repo_path or above.
+
+        Returns False when unsure (bare repositories, GIT_DIR set, repo_path
+        not a directory), in which case the caller asks git itself.
+        """
+        # A missing path or a file is left for git to reject
+        if "GIT_DIR" in os.environ or not self.repo_path.is_dir():
+            return False
+
+        for directory in (self.repo_path, *self.repo_path.parents):
+            git_path = directory / ".git"
+            if git_path.is_dir():
+                return True
+            if git_path.is_file():
+                # Worktrees and submodules use a "gitdir: <path>" file
+                try:
+                    with git_path.open(encoding="utf-8") as f:
+                        return f.readline().startswith("gitdir:")
+                except OSError:
+                    return False
+        return False
+
+    def close(self) -> None:
+        """Stop the background ``git cat-file`` process, if one is running."""
+        catfile, self._catfile = self._catfile, None
+        if catfile is None:
+            return
+        if catfile.stdin:
+            catfile.stdin.close()
+        try:
+            catfile.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            catfile.kill()
+            catfile.wait()
+        if catfile.stdout:
+            catfile.stdout.close()
+
+    def __del__(self) -> None:
+        """Make sure the background ``git cat-file`` process does not outlive the manager."""
+        # __init__ may have failed before _catfile was set
+        if getattr(self, "_catfile", None) is not None:
+            self.close()
+
+    def _resolve_commit(self, commit_sha: str) -> Optional[str]:
+        """
+        Resolve a commit SHA (or any revision) to a full object SHA.
+
+        Lookups go through one long-lived ``git cat-file --batch-check``
+        process rather than a ``git rev-parse --verify`` process each.
+
+        Args:
+            commit_sha: Commit SHA, abbreviated SHA or revision
+
+        Returns:
+            Full object SHA, or None if the object does not exist
+
+        Raises:
+            GitNotesError: If the cat-file process cannot be started or dies
+        """
+        # The batch protocol is line based, so a name with a newline would
+        # desynchronize it; git can't resolve such a name anyway
+        if "\n" in commit_sha:
+            return None
+
+        if self._catfile is None or self._catfile.poll() is not None:
+            try:
+                self._catfile = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+                    cwd=self._repo_str,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+            except OSError as e:
+                raise GitNotesError(f"Failed to start git cat-file: {e}") from e
+
+        catfile = self._catfile
+        assert catfile.stdin is not None and catfile.stdout is not None
+        try:
+            catfile.stdin.write(f"{commit_sha}\n")
+            catfile.stdin.flush()
+            line = catfile.stdout.readline()
+        except (BrokenPipeError, OSError) as e:
+            self.close()
+            raise GitNotesError(f"git cat-file failed while resolving {commit_sha}") from e
+
+        if not line:
+            self.close()
+            raise GitNotesError(f"git cat-file exited while resolving {commit_sha}")
+
+        # "<sha> <type>" for objects, "<name> missing" / "<name> ambiguous" otherwise
+        object_sha, _, object_type = line.rstrip("\n").partition(" ")
+        if object_type in ("missing", "ambiguous"):
+            return None
+        return object_sha
+
     def _run_git_command(
         self, cmd: list[str], input_data: Optional[str] = None, capture_stderr: bool = True
     ) -> str:
@@ -60,25 +197,29 @@ class GitNotesManager:
         Raises:
             GitNotesError: If command fails
         """
-        logger.debug(f"Running git command: {' '.join(cmd)}")
+        # Skip building the message when debug logging is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Running git command: {' '.join(cmd)}")
 
         try:
             result = subprocess.run(
                 cmd,
-                cwd=self.repo_path,
-                input=input_data.encode() if input_data else None,
+                cwd=self._repo_str,
+                input=input_data,
                 capture_output=True,
                 check=True,
                 timeout=30,
+                encoding="utf-8",
             )
 
-            output = result.stdout.decode().strip()
-            logger.debug(f"Git command output: {output[:200]}")
+            output = result.stdout.strip()
+            # Lazy %-formatting: nothing is sliced or formatted unless debug is on
+            logger.debug("Git command output: %.200s", output)
 
             return output
 
         except subprocess.CalledProcessError as e:
-            stderr = e.stderr.decode().strip() if capture_stderr else ""
+            stderr = e.stderr.strip() if capture_stderr else ""
             error_msg = f"Git command failed: {' '.join(cmd)}\n{stderr}"
             logger.error(error_msg)
             raise GitNotesError(error_msg) from e
@@ -86,6 +227,10 @@ class GitNotesManager:
         except subprocess.TimeoutExpired as e:
             raise GitNotesError(f"Git command timeout: {' '.join(cmd)}") from e
 
+        except OSError as e:
+            # Missing git binary, or a repo_path that doesn't exist or isn't a directory
+            raise GitNotesError(f"Failed to run git command: {' '.join(cmd)}\n{e}") from e
+
     def add_note(self, commit_sha: str, content: str, force: bool = True) -> None:
         """
         Add a git note to a commit.
@@ -101,9 +246,7 @@ class GitNotesManager:
         logger.info(f"Adding git note to commit {commit_sha[:7]} in {self.notes_ref}")
 
         # Validate commit exists
-        try:
-            self._run_git_command(["git", "rev-parse", "--verify", commit_sha])
-        except GitNotesError:
+        if self._resolve_commit(commit_sha) is None:
             raise GitNotesError(f"Commit not found: {commit_sha}")
 
         # Build git notes add command
@@ -112,16 +255,83 @@ class GitNotesManager:
         if force:
             cmd.append("--force")
 
-        cmd.extend(["-m", content, commit_sha])
+        # Pass the content on stdin rather than argv, which is size-limited
+        # and would end up in the logged command line
+        cmd.extend(["-F", "-", commit_sha])
 
         try:
-            self._run_git_command(cmd)
+            self._run_git_command(cmd, input_data=content)
             logger.info(f"Successfully added note to {commit_sha[:7]}")
         except GitNotesError as e:
             if "already exists" in str(e) and not force:
                 raise GitNotesError(f"Note already exists for {commit_sha} (use force=True to overwrite)") from e
             raise
 
+    def add_notes_batch(self, notes: list[tuple[str, str]], force: bool = True) -> None:
+        """
+        Add git notes to several commits with a fixed number of git processes.
+
+        add_note() spawns a ``git notes add`` process per note. This instead
+        validates every commit through the shared ``git cat-file`` process and
+        writes all notes in a single notes commit through ``git fast-import``.
+
+        Args:
+            notes: List of (commit_sha, content) tuples
+            force: Overwrite existing notes if present
+
+        Raises:
+            GitNotesError: If a commit is missing or adding the notes fails
+        """
+        if not notes:
+            return
+
+        logger.info(f"Adding {len(notes)} git notes in {self.notes_ref}")
+
+        # Validate all commits up front and resolve them to full SHAs
+        resolved = []
+        for commit_sha, content in notes:
+            object_sha = self._resolve_commit(commit_sha)
+            if object_sha is None:
+                raise GitNotesError(f"Commit not found: {commit_sha}")
+            resolved.append((object_sha, content))
+
+        if not force:
+            existing = {commit_sha for commit_sha, _ in self.list_notes()}
+            for commit_sha, _ in resolved:
+                if commit_sha in existing:
+                    raise GitNotesError(f"Note already exists for {commit_sha} (use force=True to overwrite)")
+
+        # The notes ref tip also goes through cat-file, so the whole batch
+        # costs only `git var` and `git fast-import` on top of it
+        notes_ref = self._qualified_notes_ref()
+        parent = self._resolve_commit(notes_ref)
+        committer = self._run_git_command(["git", "var", "GIT_COMMITTER_IDENT"])
+
+        message = "Notes added by 'git notes add'\n"
+        stream = [
+            f"commit {notes_ref}\n",
+            f"committer {committer}\n",
+            f"data {len(message.encode())}\n{message}",
+        ]
+        if parent:
+            stream.append(f"from {parent}\n")
+        for commit_sha, content in resolved:
+            # Store the same bytes `git notes add -F -` would
+            data = _stripspace(content)
+            stream.append(f"N inline {commit_sha}\ndata {len(data.encode())}\n{data}")
+        stream.append("\n")
+
+        self._run_git_command(["git", "fast-import", "--quiet"], input_data="".join(stream))
+        logger.info(f"Successfully added {len(resolved)} notes")
+
+    def _qualified_notes_ref(self) -> str:
+        """Expand notes_ref the way ``git notes --ref`` does."""
+        if self.notes_ref.startswith("refs/"):
+            return self.notes_ref
+        if self.notes_ref.startswith("notes/"):
+            return f"refs/{self.notes_ref}"
+        return f"refs/notes/{self.notes_ref}"
+
     def get_note(self, commit_sha: str) -> Optional[str]:
         """
         Get git note for a commit.
@@ -197,15 +407,11 @@ class GitNotesManager:
             return []
 
         # Parse output: "note_sha commit_sha"
-        notes = []
-        for line in output.split("\n"):
-            if line.strip():
-                parts = line.split()
-                if len(parts) == 2:
-                    note_sha, commit_sha = parts
-                    notes.append((commit_sha, note_sha))
-
-        return notes
+        return [
+            (match.group(2), match.group(1))
+            for line in output.splitlines()
+            if (match := _NOTE_LINE_RE.fullmatch(line))
+        ]
 
     def configure_git_user(self, name: str = "github-actions[bot]", email: str = "github-actions[bot]@users.noreply.github.com") -> None:
         """
@@ -235,6 +441,16 @@ class GitNotesManager:
         """
         logger.info(f"Fetching notes from {remote}")
 
+        # ls-remote is a single round trip; skip the fetch and its pack
+        # negotiation when there is nothing new to bring over
+        remote_sha = self.get_remote_notes_ref_sha(remote)
+        if remote_sha is None:
+            logger.warning(f"Notes ref {self.notes_ref} doesn't exist on {remote} yet")
+            return
+        if remote_sha == self._resolve_commit(self._qualified_notes_ref()):
+            logger.info("Notes are already up to date")
+            return
+
         refspec = f"{self.notes_ref}:{self.notes_ref}"
         cmd = ["git", "fetch", remote, refspec]
 
@@ -248,6 +464,29 @@ class GitNotesManager:
             else:
                 raise
 
+    def get_remote_notes_ref_sha(self, remote: str = "origin") -> Optional[str]:
+        """
+        Get SHA of the notes ref on a remote.
+
+        Args:
+            remote: Remote name
+
+        Returns:
+            SHA of the remote notes ref or None if it doesn't exist there
+
+        Raises:
+            GitNotesError: If the remote can't be queried
+        """
+        notes_ref = self._qualified_notes_ref()
+        output = self._run_git_command(["git", "ls-remote", remote, notes_ref])
+
+        # Lines are "<sha>\t<ref>"; the pattern can also match longer refs
+        for line in output.splitlines():
+            sha, _, ref = line.partition("\t")
+            if ref == notes_ref:
+                return sha
+        return None
+
     def push_notes(self, remote: str = "origin", force: bool = False) -> None:
         """
         Push notes to remote.
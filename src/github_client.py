@@ -4,18 +4,225 @@ GitHub API client for fetching PR data.
 Handles authentication, pagination, rate limiting, and retries.
 """
 
+import copy
+import hashlib
+import itertools
+import json
 import logging
+import os
+import random
+import threading
 import time
-from typing import Any, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional
+from urllib.parse import parse_qs, urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
+from requests.utils import parse_header_links
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # Optional - fall back to the stdlib json module
+    orjson = None  # type: ignore[assignment]
+
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on pages of one endpoint fetched at the same time
+MAX_PAGE_WORKERS = 8
+
+# Connections kept alive per host by the session
+HTTP_POOL_SIZE = 32
+
+# Transport-level retries on connection errors and 5xx server errors. Retry
+# objects are immutable (urllib3 returns a new one per attempt), so one
+# policy serves every session. Rate limits (403/429) are handled by
+# _request() instead.
+RETRY_STRATEGY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+)
+
+# Retries for a rate-limited request, and the longest single wait worth
+# sleeping through (a primary limit can take up to an hour to reset)
+MAX_RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 300.0
+
+# Starting request rate (per second). GitHub's secondary rate limit allows
+# roughly 900 REST requests a minute, i.e. 15 per second.
+INITIAL_REQUEST_RATE = 15.0
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON with orjson when available (several times faster on large bodies)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode JSON as UTF-8 bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _last_page(headers: Mapping[str, str]) -> Optional[int]:
+    """Get the page number of the rel="last" link in a Link header, if any."""
+    link_header = headers.get("Link")
+    if not link_header:
+        return None
+
+    for link in parse_header_links(link_header):
+        if link.get("rel") == "last":
+            page = parse_qs(urlsplit(link["url"]).query).get("page")
+            if page and page[0].isdigit():
+                return int(page[0])
+    return None
+
+
+# PRs fetched per GraphQL query when summarizing several at once. Each PR
+# can return up to ~10k review thread comments, so keep well under
+# GitHub's 500k node limit.
+GRAPHQL_BATCH_SIZE = 10
+
+# A PR and everything the summary shows except file changes, which GraphQL
+# returns without patches or previous filenames. Every connection asks for
+# pageInfo so callers can tell if anything was cut off.
+PR_GRAPHQL_FRAGMENTS = """
+fragment PullRequestFields on PullRequest {
+  number title body state url createdAt updatedAt closedAt mergedAt
+  author { login avatarUrl }
+  mergedBy { login }
+  baseRefName headRefName
+  baseRepository { nameWithOwner }
+  headRepository { nameWithOwner }
+  labels(first: 100) { pageInfo { hasNextPage } nodes { name } }
+  commits(first: 100) {
+    pageInfo { hasNextPage }
+    nodes { commit { oid message url author { name email date } } }
+  }
+  comments(first: 100) {
+    pageInfo { hasNextPage }
+    nodes { databaseId author { login } createdAt updatedAt body url }
+  }
+  reviews(first: 100) {
+    pageInfo { hasNextPage }
+    nodes { databaseId author { login } state submittedAt body url commit { oid } }
+  }
+  reviewThreads(first: 100) {
+    pageInfo { hasNextPage }
+    nodes {
+      comments(first: 100) {
+        pageInfo { hasNextPage }
+        nodes {
+          databaseId author { login } createdAt updatedAt body url
+          path line originalLine diffHunk replyTo { databaseId }
+        }
+      }
+    }
+  }
+  mergeCommit { ...CheckRuns }
+  potentialMergeCommit { ...CheckRuns }
+}
+
+fragment CheckRuns on Commit {
+  oid
+  checkSuites(first: 20) {
+    pageInfo { hasNextPage }
+    nodes {
+      app { name }
+      checkRuns(first: 100) {
+        pageInfo { hasNextPage }
+        nodes { databaseId name status conclusion startedAt completedAt url }
+      }
+    }
+  }
+}
+"""
+
+
+def _pr_graphql_query(pr_numbers: list[int]) -> str:
+    """Build one query fetching each PR under an alias pr<number>."""
+    pulls = "\n".join(
+        f"    pr{number}: pullRequest(number: {number}) {{ ...PullRequestFields }}" for number in pr_numbers
+    )
+    return (
+        "query($owner: String!, $name: String!) {\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"{pulls}\n"
+        "  }\n"
+        "}\n"
+        f"{PR_GRAPHQL_FRAGMENTS}"
+    )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose refill rate adapts to rate-limit feedback.
+
+    The rate grows additively after successful requests and is cut
+    multiplicatively when GitHub pushes back (AIMD), so concurrent fetches
+    settle just under the server's limit instead of bursting into it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Initial refill rate in tokens per second
+            capacity: Maximum number of tokens (burst size)
+            min_rate: Lower bound for the rate when decreasing
+            max_rate: Upper bound for the rate when increasing (default: rate)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+
+            # Reserve the token even if it isn't there yet; callers that go
+            # into debt wait in turn for the refill to cover them
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def increase_rate(self, delta: float = 0.5) -> None:
+        """Raise the rate additively after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + delta)
+
+    def decrease_rate(self, factor: float = 0.5) -> None:
+        """Cut the rate multiplicatively after being rate limited."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * factor)
+            # Drop any saved-up burst so the slowdown takes effect at once
+            self._tokens = min(self._tokens, 0.0)
+
 
 class GitHubAPIError(Exception):
     """Base exception for GitHub API errors."""
@@ -44,7 +251,14 @@ class GitHubClient:
     BASE_URL = "https://api.github.com"
     API_VERSION = "2022-11-28"
 
-    def __init__(self, token: str, owner: str, repo: str, timeout: int = 30):
+    def __init__(
+        self,
+        token: str,
+        owner: str,
+        repo: str,
+        timeout: int = 30,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize GitHub API client.
 
@@ -53,15 +267,24 @@ class GitHubClient:
             owner: Repository owner (username or organization)
             repo: Repository name
             timeout: Request timeout in seconds
+            cache_dir: Directory for caching GET responses by ETag (disabled if None)
         """
         self.token = token
         self.owner = owner
         self.repo = repo
         self.timeout = timeout
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         # Create session with retry strategy
         self.session = self._create_session()
 
+        # Paces requests across all threads sharing this client
+        self.rate_limiter = TokenBucket(rate=INITIAL_REQUEST_RATE, capacity=HTTP_POOL_SIZE)
+
+        # Responses of endpoints that don't change during a run, by endpoint
+        self._memo: dict[str, dict[str, Any]] = {}
+        self._memo_lock = threading.Lock()
+
         # Validate authentication on initialization
         self._validate_auth()
 
@@ -69,15 +292,15 @@ class GitHubClient:
         """Create requests session with retry strategy."""
         session = requests.Session()
 
-        # Retry strategy: retry on connection errors and 5xx server errors
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET", "POST"],
+        # Collection runs several endpoints at once, each fetching up to
+        # MAX_PAGE_WORKERS pages, so keep enough connections alive for all of
+        # them instead of urllib3's default of 10 (extra ones get discarded
+        # and every later request pays a new TCP + TLS handshake)
+        adapter = HTTPAdapter(
+            max_retries=RETRY_STRATEGY,
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
         )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
@@ -97,7 +320,7 @@ class GitHubClient:
         try:
             # Use repository endpoint instead of /user since GitHub Actions tokens
             # don't have access to user scope
-            response = self._make_request(f"/repos/{self.owner}/{self.repo}")
+            response = self._get_memoized(f"/repos/{self.owner}/{self.repo}")
             logger.info(f"Authenticated for repository: {response.get('full_name', 'unknown')}")
         except GitHubAPIError as e:
             if e.status_code == 401:
@@ -107,7 +330,11 @@ class GitHubClient:
             raise
 
     def _make_request(
-        self, endpoint: str, params: Optional[dict[str, Any]] = None, method: str = "GET"
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        json_body: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """
         Make a request to the GitHub API.
@@ -116,6 +343,7 @@ class GitHubClient:
             endpoint: API endpoint (e.g., '/repos/{owner}/{repo}/pulls/{number}')
             params: Query parameters
             method: HTTP method
+            json_body: Request body, sent as JSON
 
         Returns:
             Response JSON data
@@ -125,31 +353,130 @@ class GitHubClient:
             AuthenticationError: If authentication fails
             GitHubAPIError: For other API errors
         """
-        url = urljoin(self.BASE_URL, endpoint)
+        result: dict[str, Any]
+        result, _ = self._request(endpoint, params, method, json_body)
+        return result
+
+    def _get_memoized(self, endpoint: str) -> dict[str, Any]:
+        """
+        GET an endpoint once per client and reuse the response afterwards.
+
+        Only for data that can't change during a run (repository and user
+        metadata). Callers get a copy, so they may modify it freely.
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            Response JSON data
+        """
+        with self._memo_lock:
+            result = self._memo.get(endpoint)
+
+        if result is None:
+            result = self._make_request(endpoint)
+            with self._memo_lock:
+                self._memo[endpoint] = result
+
+        return copy.deepcopy(result)
+
+    def invalidate(self) -> None:
+        """Forget memoized responses so the next call fetches them again."""
+        with self._memo_lock:
+            self._memo.clear()
+
+    def _request(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        json_body: Optional[dict[str, Any]] = None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """
+        Make a request to the GitHub API and keep the response headers.
+
+        Args:
+            endpoint: API endpoint (e.g., '/repos/{owner}/{repo}/pulls/{number}')
+            params: Query parameters
+            method: HTTP method
+            json_body: Request body, sent as JSON
+
+        Returns:
+            Tuple of (response JSON data, response headers)
+
+        Raises:
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+            GitHubAPIError: For other API errors
+        """
+        # Endpoints are root-relative, so plain concatenation gives the same
+        # URL as urljoin() without parsing both strings on every request
+        assert endpoint.startswith("/"), f"Endpoint must start with '/': {endpoint}"
+        url = self.BASE_URL + endpoint
 
         logger.debug(f"{method} {url} with params: {params}")
 
+        # Revalidate a cached response instead of downloading it again
+        cache_path = self._cache_path(method, url, params)
+        cached = self._load_cached_response(cache_path) if cache_path else None
+        headers: Optional[dict[str, str]] = None
+        if cached:
+            headers = {}
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
-            response = self.session.request(method, url, params=params, timeout=self.timeout)
+            attempt = 0
+            while True:
+                self.rate_limiter.acquire()
+                response = self.session.request(
+                    method, url, params=params, json=json_body, headers=headers, timeout=self.timeout
+                )
 
-            # Check rate limit
-            remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
-            if remaining < 10:
-                reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-                logger.warning(
-                    f"API rate limit low: {remaining} requests remaining. "
-                    f"Resets at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(reset_time))}"
+                # Check rate limit; responses without the header (e.g. from a
+                # proxy) say nothing about it
+                remaining_header = response.headers.get("X-RateLimit-Remaining")
+                remaining = int(remaining_header) if remaining_header is not None else None
+                if remaining is not None and remaining < 10:
+                    reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+                    logger.warning(
+                        f"API rate limit low: {remaining} requests remaining. "
+                        f"Resets at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(reset_time))}"
+                    )
+
+                # A 403 is only a rate limit with one of these headers; others
+                # (e.g. "Resource not accessible by integration") are permission errors
+                rate_limited = response.status_code == 429 or (
+                    response.status_code == 403 and (remaining == 0 or "Retry-After" in response.headers)
                 )
 
-            # Handle rate limiting
-            if response.status_code == 403 and remaining == 0:
-                reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-                wait_time = max(0, reset_time - time.time())
-                raise RateLimitError(
-                    f"Rate limit exceeded. Resets in {wait_time:.0f} seconds",
-                    status_code=403,
-                    response=response.json() if response.content else None,
+                # Feed the outcome back into the request rate
+                if rate_limited:
+                    self.rate_limiter.decrease_rate()
+                elif response.status_code < 400:
+                    self.rate_limiter.increase_rate()
+
+                # Handle rate limiting: wait and retry while the wait is short
+                # enough, then give up
+                if not rate_limited:
+                    break
+
+                wait_time = self._rate_limit_wait(response.headers, attempt)
+                if attempt >= MAX_RATE_LIMIT_RETRIES or wait_time > MAX_RATE_LIMIT_WAIT:
+                    raise RateLimitError(
+                        f"Rate limit exceeded. Resets in {wait_time:.0f} seconds",
+                        status_code=response.status_code,
+                        response=self._error_body(response),
+                    )
+
+                attempt += 1
+                logger.warning(
+                    f"Rate limited on {url}, retrying in {wait_time:.1f}s "
+                    f"(attempt {attempt}/{MAX_RATE_LIMIT_RETRIES})"
                 )
+                time.sleep(wait_time)
 
             # Handle authentication errors
             if response.status_code == 401:
@@ -158,14 +485,192 @@ class GitHubClient:
             # Handle other errors
             response.raise_for_status()
 
-            result: dict[str, Any] = response.json()
-            return result
+            # 304 Not Modified has no body and doesn't count against the rate limit
+            if response.status_code == 304 and cached:
+                logger.debug(f"Using cached response for {url}")
+                return cached["body"], cached["headers"]
+
+            result = _json_loads(response.content)
+            if cache_path:
+                self._store_cached_response(cache_path, response, result)
+
+            return result, response.headers
 
         except requests.exceptions.Timeout as e:
             raise GitHubAPIError(f"Request timeout after {self.timeout}s") from e
         except requests.exceptions.RequestException as e:
             raise GitHubAPIError(f"Request failed: {str(e)}") from e
 
+    @staticmethod
+    def _error_body(response: requests.Response) -> Optional[dict[str, Any]]:
+        """
+        Decode the body of an error response for the exception.
+
+        Error bodies aren't always JSON (proxies and secondary rate limits
+        can answer with HTML), so anything else is kept as a short message
+        rather than masking the original error with a decode failure.
+        """
+        if not response.content:
+            return None
+
+        try:
+            body = _json_loads(response.content)
+        except ValueError:
+            return {"message": response.text[:512]}
+        return body if isinstance(body, dict) else {"message": response.text[:512]}
+
+    @staticmethod
+    def _rate_limit_wait(headers: Mapping[str, str], attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a rate-limited request.
+
+        Follows GitHub's guidance: honor Retry-After, otherwise wait for the
+        reset time once the limit is used up, otherwise back off
+        exponentially from one minute. Jitter keeps concurrent requests from
+        retrying in lockstep.
+
+        Args:
+            headers: Response headers of the rate-limited request
+            attempt: Number of retries made so far
+
+        Returns:
+            Seconds to wait
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+
+        jitter = random.uniform(0, 1)
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset_time = int(headers.get("X-RateLimit-Reset", 0))
+            return max(0.0, reset_time - time.time()) + jitter
+
+        return 60.0 * 2.0**attempt + jitter
+
+    def _cache_path(self, method: str, url: str, params: Optional[dict[str, Any]]) -> Optional[Path]:
+        """Get the cache file for a request, or None if it isn't cacheable."""
+        if self.cache_dir is None or method != "GET":
+            return None
+
+        key = json.dumps([method, url, sorted((params or {}).items())], default=str)
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _load_cached_response(cache_path: Path) -> Optional[dict[str, Any]]:
+        """Load a cached response, treating unreadable entries as missing."""
+        try:
+            entry: dict[str, Any] = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if "body" not in entry or not (entry.get("etag") or entry.get("last_modified")):
+            return None
+        return entry
+
+    @staticmethod
+    def _store_cached_response(cache_path: Path, response: requests.Response, body: Any) -> None:
+        """Cache a response body with its validators, if it has any."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+            # Only the Link header is needed again (for pagination)
+            "headers": {"Link": response.headers["Link"]} if response.headers.get("Link") else {},
+        }
+
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(_json_dumps(entry))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to cache response in {cache_path}: {e}")
+
+    def _iter_pages(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None, per_page: int = 100
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield each page of a paginated endpoint as soon as it is fetched.
+
+        The first response's Link header names the last page, so the
+        remaining pages are fetched concurrently and yielded in page order.
+        Without that header the pages are walked serially, each one only
+        requested once the caller asks for it.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            per_page: Results per page (max 100)
+
+        Yields:
+            Non-empty list of results for each page
+        """
+        params = dict(params or {})
+        params["per_page"] = min(per_page, 100)
+
+        def fetch_page(page_number: int) -> Any:
+            logger.debug(f"Fetching page {page_number} of {endpoint}")
+            result, _ = self._request(endpoint, {**params, "page": page_number})
+            return result
+
+        logger.debug(f"Fetching page 1 of {endpoint}")
+        first_page, headers = self._request(endpoint, {**params, "page": 1})
+        if isinstance(first_page, list) and len(first_page) == params["per_page"]:
+            last_page = _last_page(headers)
+        else:
+            last_page = 1
+
+        total = 0
+        pages: Iterator[Any]
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            if last_page is None:
+                # No Link header to size the walk by, so stop at the first short page
+                pages = map(fetch_page, itertools.count(2))
+            else:
+                # map() yields results in page order
+                pages = executor.map(fetch_page, range(2, last_page + 1))
+
+            for page in itertools.chain([first_page], pages):
+                # Paginated endpoints return arrays - verify with isinstance
+                if not isinstance(page, list):
+                    logger.error(f"Expected list from paginated endpoint {endpoint}, got {type(page)}")
+                    break
+
+                if not page:
+                    break
+
+                total += len(page)
+                yield page
+
+                # Check if there are more pages
+                if len(page) < params["per_page"]:
+                    break
+
+        logger.info(f"Fetched {total} total items from {endpoint}")
+
+    def _paginate_iter(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None, per_page: int = 100
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield every result of a paginated endpoint, one page in memory at a time.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            per_page: Results per page (max 100)
+
+        Yields:
+            Each result across all pages
+        """
+        for page in self._iter_pages(endpoint, params, per_page):
+            yield from page
+
     def _paginate(
         self, endpoint: str, params: Optional[dict[str, Any]] = None, per_page: int = 100
     ) -> list[dict[str, Any]]:
@@ -180,36 +685,67 @@ class GitHubClient:
         Returns:
             List of all results across all pages
         """
-        params = params or {}
-        params["per_page"] = min(per_page, 100)
-        params["page"] = 1
+        return list(self._paginate_iter(endpoint, params, per_page))
+
+    # PR endpoints
 
-        all_results: list[dict[str, Any]] = []
+    def fetch_pr_graphql(self, pr_number: int) -> dict[str, Any]:
+        """
+        Get a PR with its commits, comments, reviews and check runs in one query.
 
-        while True:
-            logger.debug(f"Fetching page {params['page']} of {endpoint}")
-            response = self._make_request(endpoint, params)
+        Each connection holds at most its first 100 nodes; check
+        pageInfo.hasNextPage to see whether the REST endpoints are needed.
 
-            # Paginated endpoints return arrays - verify with isinstance
-            if not isinstance(response, list):
-                logger.error(f"Expected list from paginated endpoint {endpoint}, got {type(response)}")
-                break
+        Args:
+            pr_number: Pull request number
 
-            if not response:
-                break
+        Returns:
+            The GraphQL pullRequest object
 
-            all_results.extend(response)
+        Raises:
+            GitHubAPIError: If the query fails or returns errors
+        """
+        return self.fetch_prs_graphql([pr_number])[pr_number]
 
-            # Check if there are more pages
-            if len(response) < params["per_page"]:
-                break
+    def fetch_prs_graphql(self, pr_numbers: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Get several PRs as in fetch_pr_graphql, with one query per batch.
 
-            params["page"] += 1
+        Args:
+            pr_numbers: Pull request numbers (at most GRAPHQL_BATCH_SIZE per query)
 
-        logger.info(f"Fetched {len(all_results)} total items from {endpoint}")
-        return all_results
+        Returns:
+            GraphQL pullRequest objects keyed by PR number
 
-    # PR endpoints
+        Raises:
+            GitHubAPIError: If a query fails or returns errors
+        """
+        pull_requests: dict[int, dict[str, Any]] = {}
+        for start in range(0, len(pr_numbers), GRAPHQL_BATCH_SIZE):
+            batch = pr_numbers[start:start + GRAPHQL_BATCH_SIZE]
+            response = self._make_request(
+                "/graphql",
+                method="POST",
+                json_body={
+                    "query": _pr_graphql_query(batch),
+                    "variables": {"owner": self.owner, "name": self.repo},
+                },
+            )
+
+            # GraphQL reports errors (e.g. a token without checks access) in a
+            # 200 response, possibly alongside partial data
+            if response.get("errors"):
+                messages = "; ".join(error.get("message", "unknown error") for error in response["errors"])
+                raise GitHubAPIError(f"GraphQL query failed: {messages}", response=response)
+
+            repository = (response.get("data") or {}).get("repository") or {}
+            for pr_number in batch:
+                pull_request = repository.get(f"pr{pr_number}")
+                if not pull_request:
+                    raise GitHubAPIError(f"Pull request #{pr_number} not found", status_code=404, response=response)
+                pull_requests[pr_number] = pull_request
+
+        return pull_requests
 
     def get_pull_request(self, pr_number: int) -> dict[str, Any]:
         """
@@ -237,6 +773,19 @@ class GitHubClient:
         endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/commits"
         return self._paginate(endpoint)
 
+    def iter_pr_commits(self, pr_number: int) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the commits in a PR one page at a time.
+
+        Args:
+            pr_number: Pull request number
+
+        Yields:
+            Page of commits
+        """
+        endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/commits"
+        return self._iter_pages(endpoint)
+
     def get_pr_files(self, pr_number: int) -> list[dict[str, Any]]:
         """
         Get all file changes in a PR.
@@ -250,6 +799,19 @@ class GitHubClient:
         endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/files"
         return self._paginate(endpoint)
 
+    def iter_pr_files(self, pr_number: int) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the file changes in a PR one page at a time.
+
+        Args:
+            pr_number: Pull request number
+
+        Yields:
+            Page of file changes
+        """
+        endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/files"
+        return self._iter_pages(endpoint)
+
     def get_pr_comments(self, pr_number: int) -> list[dict[str, Any]]:
         """
         Get review comments (inline code comments) on a PR.
@@ -263,6 +825,19 @@ class GitHubClient:
         endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/comments"
         return self._paginate(endpoint)
 
+    def iter_pr_comments(self, pr_number: int) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the review comments on a PR one page at a time.
+
+        Args:
+            pr_number: Pull request number
+
+        Yields:
+            Page of review comments
+        """
+        endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/comments"
+        return self._iter_pages(endpoint)
+
     def get_issue_comments(self, pr_number: int) -> list[dict[str, Any]]:
         """
         Get conversation comments on a PR.
@@ -278,6 +853,19 @@ class GitHubClient:
         endpoint = f"/repos/{self.owner}/{self.repo}/issues/{pr_number}/comments"
         return self._paginate(endpoint)
 
+    def iter_issue_comments(self, pr_number: int) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the conversation comments on a PR one page at a time.
+
+        Args:
+            pr_number: Pull request number
+
+        Yields:
+            Page of conversation comments
+        """
+        endpoint = f"/repos/{self.owner}/{self.repo}/issues/{pr_number}/comments"
+        return self._iter_pages(endpoint)
+
     def get_pr_reviews(self, pr_number: int) -> list[dict[str, Any]]:
         """
         Get PR reviews (approvals, change requests, etc.).
@@ -291,6 +879,19 @@ class GitHubClient:
         endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/reviews"
         return self._paginate(endpoint)
 
+    def iter_pr_reviews(self, pr_number: int) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the reviews in a PR one page at a time.
+
+        Args:
+            pr_number: Pull request number
+
+        Yields:
+            Page of reviews
+        """
+        endpoint = f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}/reviews"
+        return self._iter_pages(endpoint)
+
     def get_check_runs(self, ref: str) -> list[dict[str, Any]]:
         """
         Get check runs for a commit SHA or ref.
@@ -327,7 +928,7 @@ class GitHubClient:
             Repository data
         """
         endpoint = f"/repos/{self.owner}/{self.repo}"
-        return self._make_request(endpoint)
+        return self._get_memoized(endpoint)
 
     def get_user(self, username: str) -> dict[str, Any]:
         """
@@ -340,4 +941,4 @@ class GitHubClient:
             User data
         """
         endpoint = f"/users/{username}"
-        return self._make_request(endpoint)
+        return self._get_memoized(endpoint)
@@ -18,8 +18,10 @@ from .utils import (
     get_env_var,
     github_action_error,
     github_action_notice,
-    github_action_output,
+    github_action_outputs,
     parse_pr_number,
+    parse_pr_numbers,
+    resolve_workspace_path,
     setup_logging,
     validate_inputs,
 )
@@ -45,18 +47,20 @@ def main() -> int:
         # Get configuration from environment
         config = get_configuration()
 
-        # Validate inputs
-        validate_inputs(
-            token=config["token"],
-            owner=config["owner"],
-            repo=config["repo"],
-            pr_number=config["pr_number"],
-            merge_commit_sha=config["merge_commit_sha"],
-        )
+        # Validate inputs, including every PR in a batch
+        for pr_number in config["pr_numbers"]:
+            validate_inputs(
+                token=config["token"],
+                owner=config["owner"],
+                repo=config["repo"],
+                pr_number=pr_number,
+                merge_commit_sha=config["merge_commit_sha"],
+            )
 
+        pr_list = ", ".join(f"#{n}" for n in config["pr_numbers"])
         logger.info(
             f"Configuration: {config['owner']}/{config['repo']} "
-            f"PR #{config['pr_number']} "
+            f"PR {pr_list} "
             f"Commit {config['merge_commit_sha'][:7] if config['merge_commit_sha'] else 'N/A'}"
         )
 
@@ -65,6 +69,7 @@ def main() -> int:
             token=config["token"],
             owner=config["owner"],
             repo=config["repo"],
+            cache_dir=config["cache_dir"],
         )
 
         collector = PRActivityCollector(github_client)
@@ -85,38 +90,47 @@ def main() -> int:
             # Notes might not exist yet - that's ok for first PR
             logger.info(f"Could not fetch existing notes (might be first PR): {e}")
 
-        # Collect PR activity
-        logger.info(f"Collecting activity for PR #{config['pr_number']}")
-        activity = collector.collect_all_activity(config["pr_number"])
-
-        if not activity.is_merged:
-            logger.warning(f"PR #{config['pr_number']} is not merged, continuing anyway")
-            github_action_notice(f"PR #{config['pr_number']} is not merged")
-
-        # Format summary
-        logger.info("Formatting PR summary")
-        summary = formatter.format(activity)
-
-        # Determine commit SHA to attach note to
-        commit_sha = config["merge_commit_sha"] or activity.merge_commit_sha
-
-        if not commit_sha:
-            raise ValueError(
-                f"No merge commit SHA available for PR #{config['pr_number']}. "
-                "Ensure the PR is merged or provide MERGE_COMMIT_SHA."
+        # Collect PR activity and format a summary per PR
+        logger.info(f"Collecting activity for PR {pr_list}")
+        notes: list[tuple[str, str]] = []
+        for activity in collector.collect_activities(config["pr_numbers"]):
+            if not activity.is_merged:
+                logger.warning(f"PR #{activity.number} is not merged, continuing anyway")
+                github_action_notice(f"PR #{activity.number} is not merged")
+
+            # Format summary
+            logger.info(f"Formatting summary for PR #{activity.number}")
+            summary = formatter.format(activity)
+
+            # Determine commit SHA to attach note to
+            commit_sha = config["merge_commit_sha"] or activity.merge_commit_sha
+
+            if not commit_sha:
+                raise ValueError(
+                    f"No merge commit SHA available for PR #{activity.number}. "
+                    "Ensure the PR is merged or provide MERGE_COMMIT_SHA."
+                )
+
+            logger.info(f"Attaching note for PR #{activity.number} to commit {commit_sha[:7]}")
+            notes.append((commit_sha, summary))
+
+            logger.info(
+                f"Collected PR #{activity.number}: "
+                f"{len(activity.commits)} commits, "
+                f"{len(activity.comments)} comments, "
+                f"{len(activity.reviews)} reviews, "
+                f"{len(activity.check_runs)} checks"
             )
 
-        logger.info(f"Attaching note to commit {commit_sha[:7]}")
-
-        # Add git note
-        git_notes.add_note(commit_sha, summary, force=True)
+        # Add all git notes in one notes commit
+        git_notes.add_notes_batch(notes, force=True)
 
         # Push notes to remote if configured
         if config["push_notes"]:
             logger.info(f"Pushing notes to remote: {config['remote']}")
             try:
                 git_notes.push_notes(remote=config["remote"], force=False)
-                github_action_notice(f"Successfully pushed PR summary for #{config['pr_number']}")
+                github_action_notice(f"Successfully pushed PR summary for {pr_list}")
             except GitNotesError as e:
                 logger.error(f"Failed to push notes: {e}")
                 github_action_error(f"Failed to push notes: {e}")
@@ -129,19 +143,17 @@ def main() -> int:
             )
 
         # Output summary stats
-        github_action_output("pr_number", str(config["pr_number"]))
-        github_action_output("commit_sha", commit_sha)
-        github_action_output("notes_ref", config["notes_ref"])
-        github_action_output("summary_length", str(len(summary)))
-
-        logger.info(
-            f"Successfully created PR summary: "
-            f"{len(activity.commits)} commits, "
-            f"{len(activity.comments)} comments, "
-            f"{len(activity.reviews)} reviews, "
-            f"{len(activity.check_runs)} checks"
+        github_action_outputs(
+            {
+                "pr_number": ",".join(str(n) for n in config["pr_numbers"]),
+                "commit_sha": ",".join(sha for sha, _ in notes),
+                "notes_ref": config["notes_ref"],
+                "summary_length": ",".join(str(len(note)) for _, note in notes),
+            }
         )
 
+        logger.info(f"Successfully created {len(notes)} PR summaries")
+
         return 0
 
     except AuthenticationError as e:
@@ -187,8 +199,14 @@ def get_configuration() -> dict[str, Any]:
     """
     # Required variables
     token = get_env_var("GITHUB_TOKEN", required=True)
-    pr_number_str = get_env_var("PR_NUMBER", required=True)
-    pr_number = parse_pr_number(pr_number_str)
+
+    # PR_NUMBERS (comma-separated) summarizes several PRs in one run and
+    # takes precedence over PR_NUMBER
+    pr_numbers_str = get_env_var("PR_NUMBERS", required=False)
+    if pr_numbers_str:
+        pr_numbers = parse_pr_numbers(pr_numbers_str)
+    else:
+        pr_numbers = [parse_pr_number(get_env_var("PR_NUMBER", required=True))]
 
     # Repository information
     # GitHub Actions provides GITHUB_REPOSITORY as "owner/repo"
@@ -203,9 +221,12 @@ def get_configuration() -> dict[str, Any]:
 
     # Optional variables with defaults
     merge_commit_sha = get_env_var("MERGE_COMMIT_SHA", required=False, default=None)
+    if merge_commit_sha and len(pr_numbers) > 1:
+        raise ValueError("MERGE_COMMIT_SHA cannot be used with more than one PR number")
     repo_path = get_env_var("REPO_PATH", required=False, default=".")
     notes_ref = get_env_var("NOTES_REF", required=False, default="refs/notes/commits")
     remote = get_env_var("REMOTE", required=False, default="origin")
+    cache_dir = get_env_var("CACHE_DIR", required=False, default=None)
 
     # Boolean flags
     push_notes_str = get_env_var("PUSH_NOTES", required=False, default="true")
@@ -213,7 +234,8 @@ def get_configuration() -> dict[str, Any]:
 
     return {
         "token": token,
-        "pr_number": pr_number,
+        "pr_number": pr_numbers[0],
+        "pr_numbers": pr_numbers,
         "owner": owner,
         "repo": repo,
         "merge_commit_sha": merge_commit_sha,
@@ -221,6 +243,7 @@ def get_configuration() -> dict[str, Any]:
         "notes_ref": notes_ref,
         "remote": remote,
         "push_notes": push_notes,
+        "cache_dir": resolve_workspace_path(cache_dir) if cache_dir else None,
     }
 
 
@@ -2,14 +2,18 @@
 Data models for PR activity tracking.
 
 All models use dataclasses with full type annotations for type safety.
+They all use slots: a large PR creates many of the per-item models
+(commits, comments, reviews, checks, files), and slots also catch typos
+in attribute assignments.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 from typing import Optional, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class Commit:
     """Represents a single commit in a PR."""
 
@@ -21,7 +25,7 @@ class Commit:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PRComment:
     """Represents a comment in a PR (conversation, review, or inline code comment)."""
 
@@ -42,7 +46,7 @@ class PRComment:
     in_reply_to_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """Represents a PR review (approval, changes requested, or comment-only)."""
 
@@ -55,7 +59,7 @@ class Review:
     commit_sha: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckRun:
     """Represents a CI/CD check run or status check."""
 
@@ -76,7 +80,7 @@ class CheckRun:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChange:
     """Represents changes to a single file in the PR."""
 
@@ -89,7 +93,7 @@ class FileChange:
     previous_filename: Optional[str] = None  # For renamed files
 
 
-@dataclass
+@dataclass(slots=True)
 class PRActivity:
     """Complete PR activity data including all metadata, comments, reviews, and checks."""
 
@@ -146,18 +150,25 @@ class PRActivity:
 
     def __post_init__(self) -> None:
         """Calculate derived fields after initialization."""
-        # Calculate file statistics
-        self.total_additions = sum(fc.additions for fc in self.file_changes)
-        self.total_deletions = sum(fc.deletions for fc in self.file_changes)
+        # Calculate file statistics in one pass
+        additions = deletions = 0
+        for fc in self.file_changes:
+            additions += fc.additions
+            deletions += fc.deletions
+        self.total_additions = additions
+        self.total_deletions = deletions
         self.files_changed_count = len(self.file_changes)
 
         # Calculate unique participants
-        participants_set = {self.author}
-        participants_set.update(commit.author for commit in self.commits)
-        participants_set.update(comment.author for comment in self.comments)
-        participants_set.update(review.author for review in self.reviews)
-        if self.merged_by:
-            participants_set.add(self.merged_by)
+        participants_set = set(
+            chain(
+                (self.author,),
+                (commit.author for commit in self.commits),
+                (comment.author for comment in self.comments),
+                (review.author for review in self.reviews),
+                (self.merged_by,) if self.merged_by else (),
+            )
+        )
 
         self.participants = sorted(participants_set)
 
@@ -197,7 +208,7 @@ class PRActivity:
         return [c for c in self.check_runs if c.conclusion == "failure"]
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubRepository:
     """Represents a GitHub repository."""
 
@@ -6,10 +6,19 @@ Helper functions for environment variables, logging, and validation.
 
 import logging
 import os
+import re
 import sys
+from pathlib import Path
 from typing import Optional
 
 
+# Input formats, checked before any API request is made
+# Abbreviated or full object names, SHA-1 (40 hex) or SHA-256 (64 hex)
+_SHA_RE = re.compile(r"[0-9a-fA-F]{7,64}")
+_OWNER_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9-]{0,38}")
+_REPO_RE = re.compile(r"[A-Za-z0-9._-]{1,100}")
+
+
 def setup_logging(level: str = "INFO") -> None:
     """
     Configure logging for the application.
@@ -78,16 +87,16 @@ def validate_inputs(
     if not token or len(token) < 10:
         raise ValueError("Invalid GitHub token")
 
-    if not owner or not owner.strip():
-        raise ValueError("Invalid repository owner")
+    if not _OWNER_RE.fullmatch(owner):
+        raise ValueError(f"Invalid repository owner: {owner!r}")
 
-    if not repo or not repo.strip():
-        raise ValueError("Invalid repository name")
+    if not _REPO_RE.fullmatch(repo):
+        raise ValueError(f"Invalid repository name: {repo!r}")
 
     if pr_number <= 0:
         raise ValueError(f"Invalid PR number: {pr_number}")
 
-    if merge_commit_sha is not None and len(merge_commit_sha) < 7:
+    if merge_commit_sha and not _SHA_RE.fullmatch(merge_commit_sha):
         raise ValueError(f"Invalid merge commit SHA: {merge_commit_sha}")
 
 
@@ -113,6 +122,73 @@ def parse_pr_number(pr_number_str: str) -> int:
         raise ValueError(f"Invalid PR number: {pr_number_str}") from e
 
 
+def parse_pr_numbers(pr_numbers_str: str) -> list[int]:
+    """
+    Parse a comma-separated list of PR numbers.
+
+    Args:
+        pr_numbers_str: PR numbers as a string (e.g. "12, 15,18")
+
+    Returns:
+        PR numbers in the order given, without duplicates
+
+    Raises:
+        ValueError: If any PR number is invalid or none are given
+    """
+    pr_numbers = [parse_pr_number(part) for part in pr_numbers_str.split(",") if part.strip()]
+    if not pr_numbers:
+        raise ValueError(f"Invalid PR numbers: {pr_numbers_str!r}")
+    return list(dict.fromkeys(pr_numbers))
+
+
+def resolve_workspace_path(path: str) -> Path:
+    """
+    Resolve a user-supplied path against the workspace.
+
+    The action runs from its own checkout, so relative paths are taken
+    relative to GITHUB_WORKSPACE (when set) rather than the current directory.
+
+    Args:
+        path: Absolute or workspace-relative path
+
+    Returns:
+        Absolute path
+    """
+    resolved = Path(path).expanduser()
+    if not resolved.is_absolute():
+        resolved = Path(os.getenv("GITHUB_WORKSPACE") or ".") / resolved
+    return resolved.resolve()
+
+
+def github_action_outputs(outputs: dict[str, str]) -> None:
+    """
+    Set several GitHub Actions output variables at once.
+
+    Outputs are appended to the $GITHUB_OUTPUT file in a single write. The
+    deprecated ``::set-output`` command is only used outside the runner,
+    where GITHUB_OUTPUT is not set.
+
+    Args:
+        outputs: Mapping of output variable name to value
+    """
+    output_file = os.getenv("GITHUB_OUTPUT")
+    if not output_file:
+        for name, value in outputs.items():
+            print(f"::set-output name={name}::{value}")
+        return
+
+    lines = []
+    for name, value in outputs.items():
+        if "\n" in value:
+            # Multiline values need the heredoc-style delimiter syntax
+            lines.append(f"{name}<<ghadelimiter\n{value}\nghadelimiter\n")
+        else:
+            lines.append(f"{name}={value}\n")
+
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
 def github_action_output(name: str, value: str) -> None:
     """
     Set GitHub Actions output variable.
@@ -121,8 +197,7 @@ def github_action_output(name: str, value: str) -> None:
         name: Output variable name
         value: Output variable value
     """
-    # GitHub Actions output format
-    print(f"::set-output name={name}::{value}")
+    github_action_outputs({name: value})
 
 
 def github_action_error(message: str, file: Optional[str] = None, line: Optional[int] = None) -> None:
@@ -1,23 +1,39 @@
 """
 Pytest configuration and shared fixtures.
+
+The mock API payloads are session-scoped and shared by every test, so
+treat them as read-only: copy one (copy.deepcopy) before changing it.
+A payload changed in place fails the run at session teardown.
 """
 
+import copy
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 import pytest
 
 
-@pytest.fixture
+T = TypeVar("T")
+
+
+def _read_only(payload: T) -> Iterator[T]:
+    """Share a payload for the session and check no test modified it."""
+    snapshot = copy.deepcopy(payload)
+    yield payload
+    assert payload == snapshot, "A test modified a shared mock payload; deepcopy it before changing it"
+
+
+@pytest.fixture(scope="session")
 def sample_datetime() -> datetime:
     """Provide a sample datetime for testing."""
     return datetime(2025, 10, 14, 10, 30, 0, tzinfo=timezone.utc)
 
 
-@pytest.fixture
-def mock_pr_data() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def mock_pr_data() -> Iterator[dict[str, Any]]:
     """Mock GitHub API PR data."""
-    return {
+    payload = {
         "number": 123,
         "title": "Add dark mode support",
         "state": "closed",
@@ -48,12 +64,13 @@ def mock_pr_data() -> dict[str, Any]:
         "diff_url": "https://github.com/owner/repo/pull/123.diff",
         "patch_url": "https://github.com/owner/repo/pull/123.patch",
     }
+    yield from _read_only(payload)
 
 
-@pytest.fixture
-def mock_commits_data() -> list[dict[str, Any]]:
+@pytest.fixture(scope="session")
+def mock_commits_data() -> Iterator[list[dict[str, Any]]]:
     """Mock GitHub API commits data."""
-    return [
+    payload = [
         {
             "sha": "abc123",
             "commit": {
@@ -79,12 +96,13 @@ def mock_commits_data() -> list[dict[str, Any]]:
             "html_url": "https://github.com/owner/repo/commit/def456",
         },
     ]
+    yield from _read_only(payload)
 
 
-@pytest.fixture
-def mock_files_data() -> list[dict[str, Any]]:
+@pytest.fixture(scope="session")
+def mock_files_data() -> Iterator[list[dict[str, Any]]]:
     """Mock GitHub API files data."""
-    return [
+    payload = [
         {
             "filename": "styles/theme.css",
             "status": "modified",
@@ -108,12 +126,13 @@ def mock_files_data() -> list[dict[str, Any]]:
             "changes": 3,
         },
     ]
+    yield from _read_only(payload)
 
 
-@pytest.fixture
-def mock_issue_comments_data() -> list[dict[str, Any]]:
+@pytest.fixture(scope="session")
+def mock_issue_comments_data() -> Iterator[list[dict[str, Any]]]:
     """Mock GitHub API issue comments (conversation comments)."""
-    return [
+    payload = [
         {
             "id": 1,
             "user": {"login": "reviewer1"},
@@ -131,12 +150,13 @@ def mock_issue_comments_data() -> list[dict[str, Any]]:
             "html_url": "https://github.com/owner/repo/pull/123#issuecomment-2",
         },
     ]
+    yield from _read_only(payload)
 
 
-@pytest.fixture
-def mock_review_comments_data() -> list[dict[str, Any]]:
+@pytest.fixture(scope="session")
+def mock_review_comments_data() -> Iterator[list[dict[str, Any]]]:
     """Mock GitHub API review comments (inline code comments)."""
-    return [
+    payload = [
         {
             "id": 10,
             "user": {"login": "reviewer1"},
@@ -150,12 +170,13 @@ def mock_review_comments_data() -> list[dict[str, Any]]:
             "in_reply_to_id": None,
         },
     ]
+    yield from _read_only(payload)
 
 
-@pytest.fixture
-def mock_reviews_data() -> list[dict[str, Any]]:
+@pytest.fixture(scope="session")
+def mock_reviews_data() -> Iterator[list[dict[str, Any]]]:
     """Mock GitHub API reviews data."""
-    return [
+    payload = [
         {
             "id": 100,
             "user": {"login": "reviewer1"},
@@ -175,12 +196,13 @@ def mock_reviews_data() -> list[dict[str, Any]]:
             "commit_id": "def456",
         },
     ]
+    yield from _read_only(payload)
 
 
-@pytest.fixture
-def mock_check_runs_data() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def mock_check_runs_data() -> Iterator[dict[str, Any]]:
     """Mock GitHub API check runs data."""
-    return {
+    payload = {
         "check_runs": [
             {
                 "id": 1000,
@@ -214,15 +236,132 @@ def mock_check_runs_data() -> dict[str, Any]:
             },
         ]
     }
+    yield from _read_only(payload)
 
 
-@pytest.fixture
-def mock_repo_data() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def mock_repo_data() -> Iterator[dict[str, Any]]:
     """Mock GitHub API repository data."""
-    return {
+    payload = {
         "name": "repo",
         "full_name": "owner/repo",
         "owner": {"login": "owner"},
         "description": "A test repository",
         "html_url": "https://github.com/owner/repo",
     }
+    yield from _read_only(payload)
+
+
+@pytest.fixture(scope="session")
+def mock_graphql_pr_data() -> Iterator[dict[str, Any]]:
+    """Mock GitHub GraphQL pullRequest data."""
+    payload = {
+        "number": 123,
+        "title": "Add dark mode support",
+        "body": "This PR adds dark mode support.\n\nCloses #45",
+        "state": "MERGED",
+        "url": "https://github.com/owner/repo/pull/123",
+        "createdAt": "2025-10-14T10:00:00Z",
+        "updatedAt": "2025-10-14T15:30:00Z",
+        "closedAt": "2025-10-14T15:30:00Z",
+        "mergedAt": "2025-10-14T15:30:00Z",
+        "author": {"login": "testuser", "avatarUrl": "https://github.com/testuser.png"},
+        "mergedBy": {"login": "maintainer"},
+        "baseRefName": "main",
+        "headRefName": "feature/dark-mode",
+        "baseRepository": {"nameWithOwner": "owner/repo"},
+        "headRepository": {"nameWithOwner": "owner/repo"},
+        "labels": {"pageInfo": {"hasNextPage": False}, "nodes": [{"name": "enhancement"}]},
+        "commits": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "commit": {
+                        "oid": "abc123",
+                        "message": "Add dark mode CSS variables",
+                        "url": "https://github.com/owner/repo/commit/abc123",
+                        "author": {"name": "Test User", "email": "test@example.com", "date": "2025-10-14T10:15:00Z"},
+                    }
+                },
+            ],
+        },
+        "comments": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "databaseId": 1,
+                    "author": {"login": "reviewer1"},
+                    "createdAt": "2025-10-14T12:00:00Z",
+                    "updatedAt": "2025-10-14T12:00:00Z",
+                    "body": "Looks great!",
+                    "url": "https://github.com/owner/repo/pull/123#issuecomment-1",
+                },
+            ],
+        },
+        "reviews": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "databaseId": 100,
+                    "author": None,
+                    "state": "APPROVED",
+                    "submittedAt": "2025-10-14T14:00:00Z",
+                    "body": "LGTM",
+                    "url": "https://github.com/owner/repo/pull/123#pullrequestreview-100",
+                    "commit": {"oid": "abc123"},
+                },
+            ],
+        },
+        "reviewThreads": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "comments": {
+                        "pageInfo": {"hasNextPage": False},
+                        "nodes": [
+                            {
+                                "databaseId": 10,
+                                "author": {"login": "reviewer2"},
+                                "createdAt": "2025-10-14T11:00:00Z",
+                                "updatedAt": "2025-10-14T11:00:00Z",
+                                "body": "Consider using CSS variables here",
+                                "url": "https://github.com/owner/repo/pull/123#discussion_r10",
+                                "path": "styles/theme.css",
+                                "line": None,
+                                "originalLine": 42,
+                                "diffHunk": "@@ -1,3 +1,5 @@",
+                                "replyTo": None,
+                            },
+                        ],
+                    }
+                },
+            ],
+        },
+        "mergeCommit": {
+            "oid": "abc123def456",
+            "checkSuites": {
+                "pageInfo": {"hasNextPage": False},
+                "nodes": [
+                    {
+                        "app": {"name": "GitHub Actions"},
+                        "checkRuns": {
+                            "pageInfo": {"hasNextPage": False},
+                            "nodes": [
+                                {
+                                    "databaseId": 1000,
+                                    "name": "Unit Tests",
+                                    "status": "COMPLETED",
+                                    "conclusion": "SUCCESS",
+                                    "startedAt": "2025-10-14T15:00:00Z",
+                                    "completedAt": "2025-10-14T15:05:00Z",
+                                    "url": "https://github.com/owner/repo/runs/1000",
+                                },
+                            ],
+                        },
+                    }
+                ],
+            },
+        },
+        "potentialMergeCommit": None,
+    }
+    yield from _read_only(payload)
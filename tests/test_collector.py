@@ -2,12 +2,13 @@
 Tests for PR activity collector.
 """
 
+import copy
 from unittest.mock import Mock, patch
 
 import pytest
 
 from src.collector import PRActivityCollector
-from src.github_client import GitHubClient
+from src.github_client import GitHubAPIError, GitHubClient
 
 
 @pytest.fixture
@@ -29,15 +30,26 @@ def mock_github_client(
     client.get_pr_comments.return_value = mock_review_comments_data
     client.get_pr_reviews.return_value = mock_reviews_data
     client.get_check_runs.return_value = mock_check_runs_data["check_runs"]
+    client.iter_pr_commits.side_effect = lambda pr_number: iter([mock_commits_data])
+    client.iter_pr_files.side_effect = lambda pr_number: iter([mock_files_data])
+    client.iter_pr_reviews.side_effect = lambda pr_number: iter([mock_reviews_data])
+    client.iter_issue_comments.side_effect = lambda pr_number: iter([mock_issue_comments_data])
+    client.iter_pr_comments.side_effect = lambda pr_number: iter([mock_review_comments_data])
+    client.fetch_prs_graphql.side_effect = GitHubAPIError("GraphQL unavailable")
     return client
 
 
+@pytest.fixture
+def collector(mock_github_client):
+    """Create a collector backed by the mock GitHub client."""
+    return PRActivityCollector(mock_github_client)
+
+
 class TestPRActivityCollector:
     """Tests for PRActivityCollector."""
 
-    def test_collect_all_activity(self, mock_github_client):
+    def test_collect_all_activity(self, collector):
         """Test collecting complete PR activity."""
-        collector = PRActivityCollector(mock_github_client)
         activity = collector.collect_all_activity(123)
 
         # Verify PR metadata
@@ -62,9 +74,87 @@ class TestPRActivityCollector:
         assert "testuser" in activity.participants
         assert "maintainer" in activity.participants
 
-    def test_collect_commits(self, mock_github_client):
+    def test_collect_all_activity_graphql(self, mock_github_client, collector, mock_graphql_pr_data):
+        """Test that one GraphQL query replaces every REST call but file changes."""
+        mock_github_client.fetch_prs_graphql.side_effect = None
+        mock_github_client.fetch_prs_graphql.return_value = {123: mock_graphql_pr_data}
+
+        activity = collector.collect_all_activity(123)
+
+        mock_github_client.get_pull_request.assert_not_called()
+        mock_github_client.iter_pr_commits.assert_not_called()
+        mock_github_client.iter_issue_comments.assert_not_called()
+        mock_github_client.iter_pr_comments.assert_not_called()
+        mock_github_client.iter_pr_reviews.assert_not_called()
+        mock_github_client.get_check_runs.assert_not_called()
+
+        assert activity.state == "merged"
+        assert activity.head_repo == "owner/repo"
+        assert activity.merge_commit_sha == "abc123def456"
+        assert activity.merged_by == "maintainer"
+        assert activity.labels == ["enhancement"]
+        assert activity.closes_issues == [45]
+        assert activity.diff_url == "https://github.com/owner/repo/pull/123.diff"
+        assert len(activity.file_changes) == 3
+
+        assert activity.commits[0].sha == "abc123"
+        assert [c.comment_type for c in activity.comments] == ["inline", "conversation"]
+        assert activity.comments[0].line_number == 42
+        assert activity.reviews[0].author == "ghost"
+        assert activity.reviews[0].commit_sha == "abc123"
+        assert activity.check_runs[0].status == "completed"
+        assert activity.check_runs[0].conclusion == "success"
+        assert activity.check_runs[0].app_name == "GitHub Actions"
+
+    def test_collect_all_activity_graphql_truncated(self, mock_github_client, collector, mock_graphql_pr_data):
+        """Test that a connection with more pages falls back to the REST endpoints."""
+        pr_data = copy.deepcopy(mock_graphql_pr_data)
+        pr_data["reviewThreads"]["nodes"][0]["comments"]["pageInfo"]["hasNextPage"] = True
+        mock_github_client.fetch_prs_graphql.side_effect = None
+        mock_github_client.fetch_prs_graphql.return_value = {123: pr_data}
+
+        activity = collector.collect_all_activity(123)
+
+        mock_github_client.get_pull_request.assert_called_once_with(123)
+        assert len(activity.comments) == 3
+
+    def test_collect_all_activity_graphql_queued_check_run(self, mock_github_client, collector, mock_graphql_pr_data):
+        """Test that a check run with no startedAt falls back to the REST endpoints."""
+        pr_data = copy.deepcopy(mock_graphql_pr_data)
+        pr_data["mergeCommit"]["checkSuites"]["nodes"][0]["checkRuns"]["nodes"][0]["startedAt"] = None
+        mock_github_client.fetch_prs_graphql.side_effect = None
+        mock_github_client.fetch_prs_graphql.return_value = {123: pr_data}
+
+        activity = collector.collect_all_activity(123)
+
+        mock_github_client.get_pull_request.assert_called_once_with(123)
+        mock_github_client.get_check_runs.assert_called_once()
+        assert len(activity.check_runs) == 3
+
+    def test_collect_activities_batches_graphql(self, mock_github_client, collector, mock_graphql_pr_data):
+        """Test that several PRs share one GraphQL call and truncated ones use REST."""
+        truncated = {**mock_graphql_pr_data, "commits": {"pageInfo": {"hasNextPage": True}, "nodes": []}}
+        mock_github_client.fetch_prs_graphql.side_effect = None
+        mock_github_client.fetch_prs_graphql.return_value = {123: mock_graphql_pr_data, 124: truncated}
+
+        activities = list(collector.collect_activities([123, 124]))
+
+        mock_github_client.fetch_prs_graphql.assert_called_once_with([123, 124])
+        mock_github_client.get_pull_request.assert_called_once_with(124)
+        assert len(activities) == 2
+        assert len(activities[0].commits) == 1  # From GraphQL
+        assert len(activities[1].commits) == 2  # From REST
+
+    def test_collect_all_activity_rest_only(self, mock_github_client):
+        """Test that GraphQL can be turned off."""
+        collector = PRActivityCollector(mock_github_client, use_graphql=False)
+        collector.collect_all_activity(123)
+
+        mock_github_client.fetch_prs_graphql.assert_not_called()
+        mock_github_client.get_pull_request.assert_called_once_with(123)
+
+    def test_collect_commits(self, collector):
         """Test commit collection and transformation."""
-        collector = PRActivityCollector(mock_github_client)
         commits = collector._collect_commits(123)
 
         assert len(commits) == 2
@@ -73,9 +163,8 @@ class TestPRActivityCollector:
         assert commits[0].author == "Test User"
         assert commits[0].author_email == "test@example.com"
 
-    def test_collect_file_changes(self, mock_github_client):
+    def test_collect_file_changes(self, collector):
         """Test file changes collection."""
-        collector = PRActivityCollector(mock_github_client)
         files = collector._collect_file_changes(123)
 
         assert len(files) == 3
@@ -84,9 +173,8 @@ class TestPRActivityCollector:
         assert files[0].additions == 50
         assert files[0].deletions == 10
 
-    def test_collect_comments(self, mock_github_client):
+    def test_collect_comments(self, collector):
         """Test comments collection (conversation + review)."""
-        collector = PRActivityCollector(mock_github_client)
         comments = collector._collect_comments(123)
 
         # Should have 2 conversation + 1 review comment
@@ -103,9 +191,8 @@ class TestPRActivityCollector:
         assert review_comments[0].file_path == "styles/theme.css"
         assert review_comments[0].line_number == 42
 
-    def test_collect_reviews(self, mock_github_client):
+    def test_collect_reviews(self, collector):
         """Test reviews collection."""
-        collector = PRActivityCollector(mock_github_client)
         reviews = collector._collect_reviews(123)
 
         assert len(reviews) == 2
@@ -113,9 +200,8 @@ class TestPRActivityCollector:
         assert reviews[0].author == "reviewer1"
         assert reviews[1].state == "COMMENTED"
 
-    def test_collect_check_runs(self, mock_github_client):
+    def test_collect_check_runs(self, collector):
         """Test check runs collection."""
-        collector = PRActivityCollector(mock_github_client)
         checks = collector._collect_check_runs("abc123")
 
         assert len(checks) == 3
@@ -123,22 +209,19 @@ class TestPRActivityCollector:
         assert checks[0].conclusion == "success"
         assert checks[2].conclusion == "failure"
 
-    def test_collect_check_runs_failure(self, mock_github_client):
+    def test_collect_check_runs_failure(self, mock_github_client, collector):
         """Test check runs collection with API failure."""
         mock_github_client.get_check_runs.side_effect = Exception("API Error")
 
-        collector = PRActivityCollector(mock_github_client)
         checks = collector._collect_check_runs("abc123")
 
         # Should return empty list on failure
         assert checks == []
 
-    def test_extract_linked_issues(self, mock_github_client, mock_pr_data):
+    def test_extract_linked_issues(self, collector):
         """Test linked issues extraction from PR body."""
-        collector = PRActivityCollector(mock_github_client)
-
         # Test with closes keyword
-        pr_data = {**mock_pr_data, "body": "This PR closes #45 and fixes #67"}
+        pr_data = {"body": "This PR closes #45 and fixes #67"}
         linked, closes = collector._extract_linked_issues(pr_data)
 
         assert 45 in linked
@@ -146,31 +229,44 @@ class TestPRActivityCollector:
         assert 45 in closes
         assert 67 in closes
 
-    def test_extract_linked_issues_references(self, mock_github_client, mock_pr_data):
+    def test_extract_linked_issues_references(self, collector):
         """Test extracting issue references without closing keywords."""
-        collector = PRActivityCollector(mock_github_client)
-
-        pr_data = {**mock_pr_data, "body": "Related to #100 and #200"}
+        pr_data = {"body": "Related to #100 and #200"}
         linked, closes = collector._extract_linked_issues(pr_data)
 
         assert 100 in linked
         assert 200 in linked
         assert len(closes) == 0
 
-    def test_extract_linked_issues_no_body(self, mock_github_client, mock_pr_data):
+    def test_extract_linked_issues_no_body(self, collector):
         """Test extraction with no PR body."""
-        collector = PRActivityCollector(mock_github_client)
-
-        pr_data = {**mock_pr_data, "body": None}
+        pr_data = {"body": None}
         linked, closes = collector._extract_linked_issues(pr_data)
 
         assert linked == []
         assert closes == []
 
-    def test_parse_datetime(self, mock_github_client):
+    @pytest.mark.parametrize(
+        "body,expected_linked,expected_closes",
+        [
+            ("Closes #45", [45], [45]),
+            ("Fixes #1 and fixes #1", [1], [1]),
+            ("Resolved #3\nSee #2", [2, 3], [3]),
+            ("CLOSED #7, related #8", [7, 8], [7]),
+            ("Follow-up to owner/repo#12 (#9)", [9, 12], []),
+            ("commit abc#5 and issue#6", [], []),
+            ("", [], []),
+        ],
+    )
+    def test_extract_linked_issues_bodies(self, collector, body, expected_linked, expected_closes):
+        """Test keyword, case, cross-repo and word-boundary handling of issue references."""
+        linked, closes = collector._extract_linked_issues({"body": body})
+
+        assert linked == expected_linked
+        assert closes == expected_closes
+
+    def test_parse_datetime(self, collector):
         """Test datetime parsing."""
-        collector = PRActivityCollector(mock_github_client)
-
         # Test valid datetime
         dt = collector._parse_datetime("2025-10-14T10:30:00Z")
         assert dt is not None
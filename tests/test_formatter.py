@@ -2,6 +2,7 @@
 Tests for summary formatter.
 """
 
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
@@ -10,9 +11,13 @@ from src.formatter import SummaryFormatter
 from src.models import CheckRun, Commit, FileChange, PRActivity, PRComment, Review
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pr_activity(sample_datetime):
-    """Create a sample PRActivity for testing."""
+    """Create a sample PRActivity for testing.
+
+    Shared by every test: derive variants with dataclasses.replace() rather
+    than modifying it.
+    """
     commits = [
         Commit(
             sha="abc123",
@@ -109,66 +114,62 @@ def sample_pr_activity(sample_datetime):
     )
 
 
+@pytest.fixture(scope="session")
+def formatter():
+    """Share a default SummaryFormatter; it keeps no state between calls."""
+    return SummaryFormatter()
+
+
 class TestSummaryFormatter:
     """Tests for SummaryFormatter."""
 
-    def test_format_complete_summary(self, sample_pr_activity):
+    def test_format_complete_summary(self, formatter, sample_pr_activity):
         """Test formatting a complete PR summary."""
-        formatter = SummaryFormatter()
         summary = formatter.format(sample_pr_activity)
 
-        # Check header
-        assert "# 🟣 PR #123: Add dark mode" in summary
-
-        # Check metadata
-        assert "**Author:** @testuser" in summary
-        assert "**Merged:** 2025-10-14" in summary
-        assert "**Labels:** `enhancement`" in summary
-
-        # Check description
-        assert "This PR adds dark mode support" in summary
-
-        # Check commits
-        assert "## Commits (1)" in summary
-        assert "abc123" in summary
-
-        # Check reviews
-        assert "## Reviews (1)" in summary
-        assert "✅ @reviewer1" in summary
-
-        # Check discussion
-        assert "## Discussion (2 comments)" in summary
-        assert "Great work!" in summary
-
-        # Check checks
-        assert "## Checks (1)" in summary
-        assert "✅" in summary
-
-        # Check footer
-        assert "Summary generated for PR #123" in summary
-
-    def test_format_header_merged(self, sample_pr_activity):
-        """Test header formatting for merged PR."""
-        formatter = SummaryFormatter()
-        header = formatter._format_header(sample_pr_activity)
+        expected = [
+            # Header
+            "# 🟣 PR #123: Add dark mode",
+            # Metadata
+            "**Author:** @testuser",
+            "**Merged:** 2025-10-14",
+            "**Labels:** `enhancement`",
+            # Description
+            "This PR adds dark mode support",
+            # Commits
+            "## Commits (1)",
+            "abc123",
+            # Reviews
+            "## Reviews (1)",
+            "✅ @reviewer1",
+            # Discussion
+            "## Discussion (2 comments)",
+            "Great work!",
+            # Checks
+            "## Checks (1)",
+            "✅",
+            # Footer
+            "Summary generated for PR #123",
+        ]
 
-        assert "🟣" in header
-        assert "PR #123" in header
-        assert "Add dark mode" in header
+        # Report every missing piece at once rather than stopping at the first
+        missing = [text for text in expected if text not in summary]
+        assert not missing, missing
 
-    def test_format_header_closed(self, sample_pr_activity):
-        """Test header formatting for closed PR."""
-        sample_pr_activity.state = "closed"
-        sample_pr_activity.merged_at = None
+    @pytest.mark.parametrize(
+        "state,emoji",
+        [("merged", "🟣"), ("closed", "🔴"), ("open", "🟢"), ("draft", "⚪")],
+    )
+    def test_format_header(self, formatter, sample_pr_activity, state, emoji):
+        """Test header formatting for each PR state."""
+        activity = replace(sample_pr_activity, state=state)
 
-        formatter = SummaryFormatter()
-        header = formatter._format_header(sample_pr_activity)
+        header = formatter._format_header(activity)
 
-        assert "🔴" in header
+        assert header == f"# {emoji} PR #123: Add dark mode"
 
-    def test_format_metadata(self, sample_pr_activity):
+    def test_format_metadata(self, formatter, sample_pr_activity):
         """Test metadata formatting."""
-        formatter = SummaryFormatter()
         metadata = formatter._format_metadata(sample_pr_activity)
 
         assert "@testuser" in metadata
@@ -177,9 +178,8 @@ class TestSummaryFormatter:
         assert "`enhancement`" in metadata
         assert "#45" in metadata
 
-    def test_format_commits(self, sample_pr_activity):
+    def test_format_commits(self, formatter, sample_pr_activity):
         """Test commits formatting."""
-        formatter = SummaryFormatter()
         commits_section = formatter._format_commits(sample_pr_activity)
 
         assert "## Commits (1)" in commits_section
@@ -187,18 +187,17 @@ class TestSummaryFormatter:
         assert "Add dark mode CSS" in commits_section
         assert "@testuser" in commits_section
 
-    def test_format_file_changes(self, sample_pr_activity):
+    def test_format_file_changes(self, formatter, sample_pr_activity):
         """Test file changes formatting."""
-        formatter = SummaryFormatter()
         files_section = formatter._format_file_changes(sample_pr_activity)
 
         assert "## File Changes (1)" in files_section
         assert "**Total changes:** +10 -5" in files_section
         assert "src/main.py" in files_section
 
-    def test_format_file_changes_by_status(self, sample_pr_activity):
+    def test_format_file_changes_by_status(self, formatter, sample_pr_activity):
         """Test file changes grouped by status."""
-        sample_pr_activity.file_changes = [
+        file_changes = [
             FileChange(filename="new.py", status="added", additions=20, deletions=0, changes=20),
             FileChange(filename="old.py", status="removed", additions=0, deletions=30, changes=30),
             FileChange(
@@ -210,45 +209,41 @@ class TestSummaryFormatter:
                 previous_filename="old_name.py",
             ),
         ]
+        activity = replace(sample_pr_activity, file_changes=file_changes)
 
-        formatter = SummaryFormatter()
-        files_section = formatter._format_file_changes(sample_pr_activity)
+        files_section = formatter._format_file_changes(activity)
 
         assert "### Added (1)" in files_section
         assert "### Removed (1)" in files_section
         assert "### Renamed (1)" in files_section
 
-    def test_format_reviews(self, sample_pr_activity):
+    def test_format_reviews(self, formatter, sample_pr_activity):
         """Test reviews formatting."""
-        formatter = SummaryFormatter()
         reviews_section = formatter._format_reviews(sample_pr_activity)
 
         assert "## Reviews (1)" in reviews_section
         assert "### Approved (1)" in reviews_section
         assert "✅ @reviewer1" in reviews_section
 
-    def test_format_reviews_with_changes_requested(self, sample_pr_activity):
+    def test_format_reviews_with_changes_requested(self, formatter, sample_pr_activity):
         """Test formatting reviews with changes requested."""
-        sample_pr_activity.reviews.append(
-            Review(
-                id=101,
-                author="reviewer2",
-                state="CHANGES_REQUESTED",
-                submitted_at=sample_pr_activity.created_at,
-                body="Please fix",
-                url="url",
-            )
+        changes_requested = Review(
+            id=101,
+            author="reviewer2",
+            state="CHANGES_REQUESTED",
+            submitted_at=sample_pr_activity.created_at,
+            body="Please fix",
+            url="url",
         )
+        activity = replace(sample_pr_activity, reviews=[*sample_pr_activity.reviews, changes_requested])
 
-        formatter = SummaryFormatter()
-        reviews_section = formatter._format_reviews(sample_pr_activity)
+        reviews_section = formatter._format_reviews(activity)
 
         assert "### Changes Requested (1)" in reviews_section
         assert "⚠️ @reviewer2" in reviews_section
 
-    def test_format_discussion(self, sample_pr_activity):
+    def test_format_discussion(self, formatter, sample_pr_activity):
         """Test discussion formatting."""
-        formatter = SummaryFormatter()
         discussion_section = formatter._format_discussion(sample_pr_activity)
 
         assert "## Discussion (2 comments)" in discussion_section
@@ -258,9 +253,8 @@ class TestSummaryFormatter:
         assert "Great work!" in discussion_section
         assert "`src/main.py:42`" in discussion_section
 
-    def test_format_checks(self, sample_pr_activity):
+    def test_format_checks(self, formatter, sample_pr_activity):
         """Test checks formatting."""
-        formatter = SummaryFormatter()
         checks_section = formatter._format_checks(sample_pr_activity)
 
         assert "## Checks (1)" in checks_section
@@ -269,52 +263,85 @@ class TestSummaryFormatter:
         assert "Tests" in checks_section
         assert "(300.0s)" in checks_section  # Duration
 
-    def test_format_checks_with_failures(self, sample_pr_activity):
+    def test_format_checks_with_failures(self, formatter, sample_pr_activity):
         """Test formatting checks with failures."""
-        sample_pr_activity.check_runs.append(
+        failed = CheckRun(
+            id=1001,
+            name="Lint",
+            status="completed",
+            conclusion="failure",
+            started_at=sample_pr_activity.created_at,
+            completed_at=sample_pr_activity.created_at,
+            html_url="url",
+        )
+        activity = replace(sample_pr_activity, check_runs=[*sample_pr_activity.check_runs, failed])
+
+        checks_section = formatter._format_checks(activity)
+
+        assert "### Failed (1)" in checks_section
+        assert "❌" in checks_section
+
+    def test_format_checks_other_conclusions(self, formatter, sample_pr_activity):
+        """Test that pending and non-pass/fail checks are grouped as other."""
+        other = [
             CheckRun(
-                id=1001,
-                name="Lint",
-                status="completed",
-                conclusion="failure",
+                id=check_id,
+                name=f"Check {check_id}",
+                status="completed" if conclusion else "in_progress",
+                conclusion=conclusion,
                 started_at=sample_pr_activity.created_at,
-                completed_at=sample_pr_activity.created_at,
+                completed_at=None,
                 html_url="url",
             )
-        )
+            for check_id, conclusion in ((1001, None), (1002, "skipped"))
+        ]
+        activity = replace(sample_pr_activity, check_runs=[*sample_pr_activity.check_runs, *other])
 
-        formatter = SummaryFormatter()
-        checks_section = formatter._format_checks(sample_pr_activity)
+        checks_section = formatter._format_checks(activity)
 
-        assert "### Failed (1)" in checks_section
-        assert "❌" in checks_section
+        assert "### Successful (1)" in checks_section
+        assert "### Failed" not in checks_section
+        assert "### Other (2)" in checks_section
+        assert "- 🔵 [Check 1001](url)" in checks_section
+        assert "- ⏭️ [Check 1002](url)" in checks_section
 
     def test_truncate_long_comment(self, sample_pr_activity):
         """Test comment truncation."""
-        long_comment = "a" * 1000
-        sample_pr_activity.comments[0].body = long_comment
+        long_comment = replace(sample_pr_activity.comments[0], body="a" * 1000)
+        activity = replace(sample_pr_activity, comments=[long_comment, *sample_pr_activity.comments[1:]])
 
         formatter = SummaryFormatter(max_comment_length=100)
-        discussion_section = formatter._format_discussion(sample_pr_activity)
+        discussion_section = formatter._format_discussion(activity)
 
         # Should be truncated with "..."
         assert "..." in discussion_section
         assert len(discussion_section.split("Great")[0]) < 1000
 
-    def test_empty_sections_not_included(self, sample_pr_activity):
+    def test_truncate_normalizes_whitespace(self, formatter):
+        """Test that short comments are returned as-is unless whitespace needs collapsing."""
+        assert formatter._truncate("Looks good to me") == "Looks good to me"
+        assert formatter._truncate("Line one\nline  two\t ") == "Line one line two"
+        assert formatter._truncate(" padded ") == "padded"
+        assert formatter._truncate("non breaking") == "non breaking"
+
+    def test_truncate_long_multiline_comment(self):
+        """Test that long comments are normalized before truncation."""
+        formatter = SummaryFormatter(max_comment_length=20)
+
+        assert formatter._truncate("word\n\n" * 1000) == "word word word wo..."
+        assert formatter._truncate("  padded   " + " " * 1000 + "end") == "padded end"
+
+    def test_empty_sections_not_included(self, formatter, sample_pr_activity):
         """Test that empty sections are not included."""
-        sample_pr_activity.reviews = []
-        sample_pr_activity.check_runs = []
+        activity = replace(sample_pr_activity, reviews=[], check_runs=[])
 
-        formatter = SummaryFormatter()
-        summary = formatter.format(sample_pr_activity)
+        summary = formatter.format(activity)
 
         assert "## Reviews" not in summary
         assert "## Checks" not in summary
 
-    def test_format_footer(self, sample_pr_activity):
+    def test_format_footer(self, formatter, sample_pr_activity):
         """Test footer formatting."""
-        formatter = SummaryFormatter()
         footer = formatter._format_footer(sample_pr_activity)
 
         assert "Summary generated for PR #123" in footer
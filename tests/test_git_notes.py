@@ -2,6 +2,8 @@
 Tests for git notes manager.
 """
 
+import os
+import shutil
 import subprocess
 from unittest.mock import Mock, patch
 
@@ -10,40 +12,81 @@ import pytest
 from src.git_notes import GitNotesError, GitNotesManager
 
 
-@pytest.fixture
-def temp_git_repo(tmp_path):
-    """Create a temporary git repository for testing."""
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
+# These tests run git against temporary repositories
+pytestmark = pytest.mark.integration
+
+# Build the template without reading the user's global or system git config,
+# so settings like commit.gpgsign or hooks can't affect (or slow down) it
+_GIT_ENV = {
+    **os.environ,
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+    "GIT_TERMINAL_PROMPT": "0",
+}
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory):
+    """Create a git repository with one commit, once per test session."""
+    repo_path = tmp_path_factory.mktemp("template")
 
     # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True, env=_GIT_ENV)
     subprocess.run(
         ["git", "config", "user.name", "Test User"],
         cwd=repo_path,
         check=True,
         capture_output=True,
+        env=_GIT_ENV,
     )
     subprocess.run(
         ["git", "config", "user.email", "test@example.com"],
         cwd=repo_path,
         check=True,
         capture_output=True,
+        env=_GIT_ENV,
     )
 
     # Create initial commit
     (repo_path / "test.txt").write_text("test")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True, env=_GIT_ENV)
     subprocess.run(
         ["git", "commit", "-m", "Initial commit"],
         cwd=repo_path,
         check=True,
         capture_output=True,
+        env=_GIT_ENV,
     )
 
     return repo_path
 
 
+@pytest.fixture(scope="session")
+def commit_sha(_git_repo_template):
+    """SHA of the template's commit, which is also HEAD of every temp_git_repo copy."""
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=_git_repo_template,
+        check=True,
+        capture_output=True,
+        env=_GIT_ENV,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def temp_git_repo(tmp_path, _git_repo_template):
+    """Create a temporary git repository for testing.
+
+    Copies the session template instead of running git init/commit for
+    every test, so each test still gets a repository of its own.
+    """
+    repo_path = tmp_path / "test_repo"
+    shutil.copytree(_git_repo_template, repo_path, symlinks=True)
+    return repo_path
+
+
 class TestGitNotesManagerInit:
     """Tests for GitNotesManager initialization."""
 
@@ -61,6 +104,17 @@ class TestGitNotesManagerInit:
         )
         assert manager.notes_ref == "refs/notes/custom"
 
+    def test_init_subdirectory_without_git_process(self, temp_git_repo):
+        """Test that a checkout is recognized from its .git directory without running git."""
+        subdir = temp_git_repo / "src"
+        subdir.mkdir()
+
+        with patch.object(GitNotesManager, "_run_git_command") as mock_run:
+            manager = GitNotesManager(repo_path=str(subdir))
+
+        mock_run.assert_not_called()
+        assert manager.repo_path == subdir
+
     def test_init_invalid_repo(self, tmp_path):
         """Test initialization with invalid repository."""
         non_repo = tmp_path / "not_a_repo"
@@ -69,50 +123,32 @@ class TestGitNotesManagerInit:
         with pytest.raises(GitNotesError, match="Not a git repository"):
             GitNotesManager(repo_path=str(non_repo))
 
+    def test_init_nonexistent_path_in_repo(self, temp_git_repo):
+        """Test that missing paths and files inside a checkout are rejected."""
+        with pytest.raises(GitNotesError, match="Not a git repository"):
+            GitNotesManager(repo_path=str(temp_git_repo / "does" / "not" / "exist"))
+
+        with pytest.raises(GitNotesError, match="Not a git repository"):
+            GitNotesManager(repo_path=str(temp_git_repo / "test.txt"))
+
 
 class TestAddNote:
     """Tests for adding git notes."""
 
-    def test_add_note_success(self, temp_git_repo):
+    def test_add_note_success(self, temp_git_repo, commit_sha):
         """Test successfully adding a note."""
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
-        # Get the commit SHA
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        commit_sha = result.stdout.strip()
-
         # Add note
         manager.add_note(commit_sha, "Test note content")
 
         # Verify note was added
-        result = subprocess.run(
-            ["git", "notes", "--ref", "refs/notes/commits", "show", commit_sha],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        assert "Test note content" in result.stdout
+        assert manager.get_note(commit_sha) == "Test note content"
 
-    def test_add_note_force_overwrite(self, temp_git_repo):
+    def test_add_note_force_overwrite(self, temp_git_repo, commit_sha):
         """Test overwriting existing note with force=True."""
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        commit_sha = result.stdout.strip()
-
         # Add initial note
         manager.add_note(commit_sha, "First note")
 
@@ -120,15 +156,7 @@ class TestAddNote:
         manager.add_note(commit_sha, "Second note", force=True)
 
         # Verify note was overwritten
-        result = subprocess.run(
-            ["git", "notes", "--ref", "refs/notes/commits", "show", commit_sha],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        assert "Second note" in result.stdout
-        assert "First note" not in result.stdout
+        assert manager.get_note(commit_sha) == "Second note"
 
     def test_add_note_invalid_commit(self, temp_git_repo):
         """Test adding note to invalid commit SHA."""
@@ -137,40 +165,110 @@ class TestAddNote:
         with pytest.raises(GitNotesError, match="Commit not found"):
             manager.add_note("invalid_sha", "Test note")
 
+    def test_add_note_large_content(self, temp_git_repo):
+        """Test adding a note larger than a single command-line argument allows."""
+        manager = GitNotesManager(repo_path=str(temp_git_repo))
 
-class TestGetNote:
-    """Tests for getting git notes."""
+        # Linux caps one argv string at 128KB
+        content = "# Summary\n\n" + "- line of summary text\n" * 10000
+        manager.add_note("HEAD", content)
 
-    def test_get_existing_note(self, temp_git_repo):
-        """Test getting an existing note."""
+        assert manager.get_note("HEAD") == content.strip()
+
+    def test_add_note_reuses_catfile_process(self, temp_git_repo):
+        """Test that commit lookups share one git cat-file process."""
+        manager = GitNotesManager(repo_path=str(temp_git_repo))
+
+        manager.add_note("HEAD", "First note")
+        catfile = manager._catfile
+        manager.add_note("HEAD", "Second note")
+
+        assert catfile is not None
+        assert manager._catfile is catfile
+        assert manager._resolve_commit("invalid_sha") is None
+
+        manager.close()
+        assert catfile.poll() is not None
+
+    def test_add_notes_batch(self, temp_git_repo):
+        """Test adding notes to several commits in one batch."""
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
+        (temp_git_repo / "second.txt").write_text("second")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True, capture_output=True, env=_GIT_ENV)
+        subprocess.run(
+            ["git", "commit", "-m", "Second commit"],
+            cwd=temp_git_repo,
+            check=True,
+            capture_output=True,
+            env=_GIT_ENV,
+        )
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
+            ["git", "rev-list", "HEAD"],
             cwd=temp_git_repo,
             check=True,
             capture_output=True,
             text=True,
+            env=_GIT_ENV,
         )
-        commit_sha = result.stdout.strip()
+        second_sha, first_sha = result.stdout.split()
 
-        manager.add_note(commit_sha, "Test note")
+        # An existing note is kept in the history and overwritten
+        manager.add_note(first_sha, "Old note")
+        manager.add_notes_batch([(first_sha, "First note"), (second_sha[:7], "Second note")])
 
-        note = manager.get_note(commit_sha)
-        assert note == "Test note"
-
-    def test_get_nonexistent_note(self, temp_git_repo):
-        """Test getting a note that doesn't exist."""
-        manager = GitNotesManager(repo_path=str(temp_git_repo))
+        assert manager.get_note(first_sha) == "First note"
+        assert manager.get_note(second_sha) == "Second note"
+        assert len(manager.list_notes()) == 2
 
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
+            ["git", "rev-list", "--count", "refs/notes/commits"],
             cwd=temp_git_repo,
             check=True,
             capture_output=True,
             text=True,
+            env=_GIT_ENV,
         )
-        commit_sha = result.stdout.strip()
+        assert result.stdout.strip() == "2"
+
+    def test_add_notes_batch_matches_add_note(self, temp_git_repo, commit_sha):
+        """Test that a batched note is cleaned up into the same blob as add_note's."""
+        manager = GitNotesManager(repo_path=str(temp_git_repo))
+        content = "\n  \n# Summary  \n\n\n\n- item\t\r\n  indented\n\n\n"
+
+        manager.add_note(commit_sha, content)
+        [(_, single_blob)] = manager.list_notes()
+        manager.add_notes_batch([(commit_sha, content)])
+        [(_, batch_blob)] = manager.list_notes()
+
+        assert batch_blob == single_blob
+        assert manager.get_note(commit_sha) == "# Summary\n\n- item\n  indented"
+
+    def test_add_notes_batch_invalid_commit(self, temp_git_repo):
+        """Test that a batch with an unknown commit adds no notes."""
+        manager = GitNotesManager(repo_path=str(temp_git_repo))
+
+        with pytest.raises(GitNotesError, match="Commit not found"):
+            manager.add_notes_batch([("HEAD", "Test note"), ("invalid_sha", "Test note")])
+
+        assert manager.list_notes() == []
+
+
+class TestGetNote:
+    """Tests for getting git notes."""
+
+    def test_get_existing_note(self, temp_git_repo, commit_sha):
+        """Test getting an existing note."""
+        manager = GitNotesManager(repo_path=str(temp_git_repo))
+
+        manager.add_note(commit_sha, "Test note")
+
+        note = manager.get_note(commit_sha)
+        assert note == "Test note"
+
+    def test_get_nonexistent_note(self, temp_git_repo, commit_sha):
+        """Test getting a note that doesn't exist."""
+        manager = GitNotesManager(repo_path=str(temp_git_repo))
 
         note = manager.get_note(commit_sha)
         assert note is None
@@ -179,19 +277,10 @@ class TestGetNote:
 class TestRemoveNote:
     """Tests for removing git notes."""
 
-    def test_remove_existing_note(self, temp_git_repo):
+    def test_remove_existing_note(self, temp_git_repo, commit_sha):
         """Test removing an existing note."""
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        commit_sha = result.stdout.strip()
-
         # Add and then remove note
         manager.add_note(commit_sha, "Test note")
         manager.remove_note(commit_sha)
@@ -200,19 +289,10 @@ class TestRemoveNote:
         note = manager.get_note(commit_sha)
         assert note is None
 
-    def test_remove_nonexistent_note(self, temp_git_repo):
+    def test_remove_nonexistent_note(self, temp_git_repo, commit_sha):
         """Test removing a note that doesn't exist."""
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        commit_sha = result.stdout.strip()
-
         # Should not raise error
         manager.remove_note(commit_sha)
 
@@ -227,19 +307,10 @@ class TestListNotes:
         notes = manager.list_notes()
         assert notes == []
 
-    def test_list_notes_with_notes(self, temp_git_repo):
+    def test_list_notes_with_notes(self, temp_git_repo, commit_sha):
         """Test listing notes when they exist."""
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        commit_sha = result.stdout.strip()
-
         manager.add_note(commit_sha, "Test note")
 
         notes = manager.list_notes()
@@ -263,6 +334,7 @@ class TestConfigureGitUser:
             check=True,
             capture_output=True,
             text=True,
+            env=_GIT_ENV,
         )
         assert result.stdout.strip() == "Test Bot"
 
@@ -272,6 +344,7 @@ class TestConfigureGitUser:
             check=True,
             capture_output=True,
             text=True,
+            env=_GIT_ENV,
         )
         assert result.stdout.strip() == "bot@example.com"
 
@@ -303,15 +376,43 @@ class TestFetchNotes:
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
         with patch.object(manager, "_run_git_command") as mock_run:
-            mock_run.return_value = ""
+            mock_run.side_effect = [f"{'a' * 40}\trefs/notes/commits", ""]
             manager.fetch_notes(remote="origin")
 
-            # Verify git fetch command was called
-            mock_run.assert_called_once()
+            # Verify the remote ref was checked before git fetch was called
+            assert mock_run.call_count == 2
+            assert mock_run.call_args_list[0][0][0][:2] == ["git", "ls-remote"]
             args = mock_run.call_args[0][0]
             assert "fetch" in args
             assert "origin" in args
 
+    def test_fetch_notes_skipped_when_up_to_date(self, temp_git_repo, tmp_path):
+        """Test that notes are only fetched when the remote ref has moved."""
+        remote_path = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "--bare", str(remote_path)], check=True, capture_output=True, env=_GIT_ENV)
+        subprocess.run(
+            ["git", "remote", "add", "origin", str(remote_path)],
+            cwd=temp_git_repo,
+            check=True,
+            capture_output=True,
+            env=_GIT_ENV,
+        )
+        manager = GitNotesManager(repo_path=str(temp_git_repo))
+
+        # No notes on the remote yet
+        assert manager.get_remote_notes_ref_sha("origin") is None
+        manager.fetch_notes(remote="origin")
+
+        manager.add_note("HEAD", "Test note")
+        manager.push_notes(remote="origin")
+        assert manager.get_remote_notes_ref_sha("origin") == manager.get_notes_ref_sha()
+
+        with patch.object(manager, "_run_git_command", wraps=manager._run_git_command) as mock_run:
+            manager.fetch_notes(remote="origin")
+
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0][:2] == ["git", "ls-remote"]
+
 
 class TestErrorHandling:
     """Tests for error handling in git operations."""
@@ -328,5 +429,7 @@ class TestErrorHandling:
         """Test handling of command failure."""
         manager = GitNotesManager(repo_path=str(temp_git_repo))
 
-        with pytest.raises(GitNotesError):
-            manager._run_git_command(["git", "invalid-command"])
+        error = subprocess.CalledProcessError(1, "git", stderr="fatal: not a git command\n")
+        with patch("subprocess.run", side_effect=error):
+            with pytest.raises(GitNotesError, match="Git command failed: git status\nfatal: not a git command"):
+                manager._run_git_command(["git", "status"])
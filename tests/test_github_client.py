@@ -2,16 +2,21 @@
 Tests for GitHub API client.
 """
 
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import Mock, call, patch
 
 import pytest
 import requests
 
 from src.github_client import (
+    GRAPHQL_BATCH_SIZE,
+    HTTP_POOL_SIZE,
+    MAX_PAGE_WORKERS,
     AuthenticationError,
     GitHubAPIError,
     GitHubClient,
     RateLimitError,
+    TokenBucket,
 )
 
 
@@ -39,6 +44,13 @@ def github_client(mock_repo_data):
     return client
 
 
+@pytest.fixture
+def session_request(github_client, mock_response):
+    """Patch the client's session so every request returns mock_response."""
+    with patch.object(github_client.session, "request", return_value=mock_response) as mock_request:
+        yield mock_request
+
+
 class TestGitHubClientInit:
     """Tests for GitHubClient initialization."""
 
@@ -54,6 +66,12 @@ class TestGitHubClientInit:
             assert client.owner == "owner"
             assert client.repo == "repo"
 
+    def test_session_connection_pool(self, github_client):
+        """Test that the session keeps enough connections for concurrent fetches."""
+        adapter = github_client.session.get_adapter(GitHubClient.BASE_URL)
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+        assert HTTP_POOL_SIZE >= MAX_PAGE_WORKERS
+
     def test_client_initialization_auth_failure(self):
         """Test client initialization with auth failure."""
         mock_response = Mock()
@@ -72,13 +90,13 @@ class TestGitHubClientInit:
 class TestMakeRequest:
     """Tests for _make_request method."""
 
+    @pytest.mark.usefixtures("session_request")
     def test_successful_request(self, github_client, mock_response):
         """Test successful API request."""
-        mock_response.json.return_value = {"data": "value"}
+        mock_response.content = json.dumps({"data": "value"}).encode()
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            result = github_client._make_request("/test")
-            assert result == {"data": "value"}
+        result = github_client._make_request("/test")
+        assert result == {"data": "value"}
 
     def test_rate_limit_exceeded(self, github_client):
         """Test rate limit error handling."""
@@ -89,11 +107,71 @@ class TestMakeRequest:
             "X-RateLimit-Reset": "1234567890",
         }
         mock_response.content = b'{"message": "rate limit exceeded"}'
-        mock_response.json.return_value = {"message": "rate limit exceeded"}
 
         with patch.object(github_client.session, "request", return_value=mock_response):
-            with pytest.raises(RateLimitError, match="Rate limit exceeded"):
-                github_client._make_request("/test")
+            with patch("src.github_client.time.sleep"):
+                with pytest.raises(RateLimitError, match="Rate limit exceeded"):
+                    github_client._make_request("/test")
+
+    def test_rate_limit_error_with_non_json_body(self, github_client):
+        """Test that a non-JSON rate limit body is kept as the error message."""
+        limited = Mock()
+        limited.status_code = 403
+        limited.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"}
+        limited.content = b"<html>Too many requests</html>"
+        limited.text = "<html>Too many requests</html>"
+
+        with patch.object(github_client.session, "request", return_value=limited):
+            with patch("src.github_client.time.time", return_value=1000.0):
+                with pytest.raises(RateLimitError) as exc_info:
+                    github_client._make_request("/test")
+
+        assert exc_info.value.response == {"message": "<html>Too many requests</html>"}
+
+    def test_rate_limit_retry_after(self, github_client, mock_response):
+        """Test that a rate-limited request is retried after the Retry-After delay."""
+        limited = Mock()
+        limited.status_code = 429
+        limited.headers = {"X-RateLimit-Remaining": "4000", "Retry-After": "7"}
+        mock_response.content = json.dumps({"data": "value"}).encode()
+
+        with patch.object(github_client.session, "request", side_effect=[limited, mock_response]):
+            with patch("src.github_client.time.sleep") as mock_sleep:
+                assert github_client._make_request("/test") == {"data": "value"}
+
+        # The token bucket may also pace the retry after slowing down
+        assert call(7.0) in mock_sleep.call_args_list
+
+    def test_rate_limit_waits_for_reset(self, github_client, mock_response):
+        """Test that an exhausted primary limit is retried once it resets."""
+        limited = Mock()
+        limited.status_code = 403
+        limited.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+        mock_response.content = json.dumps({"data": "value"}).encode()
+
+        with patch.object(github_client.session, "request", side_effect=[limited, mock_response]):
+            with patch("src.github_client.time.time", return_value=1000.0):
+                with patch("src.github_client.time.sleep") as mock_sleep:
+                    assert github_client._make_request("/test") == {"data": "value"}
+
+        wait_time = max(args[0] for args, _ in mock_sleep.call_args_list)
+        assert 30.0 <= wait_time <= 31.0
+
+    def test_rate_limit_gives_up_on_long_wait(self, github_client):
+        """Test that a reset too far away raises instead of sleeping."""
+        limited = Mock()
+        limited.status_code = 403
+        limited.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"}
+        limited.content = b""
+
+        with patch.object(github_client.session, "request", return_value=limited) as mock_request:
+            with patch("src.github_client.time.time", return_value=1000.0):
+                with patch("src.github_client.time.sleep") as mock_sleep:
+                    with pytest.raises(RateLimitError, match=r"Resets in 360[01] seconds"):
+                        github_client._make_request("/test")
+
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
 
     def test_authentication_error(self, github_client):
         """Test authentication error handling."""
@@ -117,6 +195,39 @@ class TestMakeRequest:
             with pytest.raises(GitHubAPIError, match="Request timeout"):
                 github_client._make_request("/test")
 
+    def test_decodes_without_orjson(self, github_client, mock_response):
+        """Test that responses decode with the stdlib json module when orjson is missing."""
+        mock_response.content = b'{"data": "value"}'
+
+        with patch("src.github_client.orjson", None):
+            with patch.object(github_client.session, "request", return_value=mock_response):
+                assert github_client._make_request("/test") == {"data": "value"}
+
+    def test_conditional_request_cache(self, github_client, tmp_path):
+        """Test that cached responses are revalidated by ETag and reused on 304."""
+        github_client.cache_dir = tmp_path
+
+        response = Mock()
+        response.status_code = 200
+        response.headers = {"X-RateLimit-Remaining": "5000", "ETag": '"abc"'}
+        response.content = json.dumps({"data": "value"}).encode()
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {"X-RateLimit-Remaining": "5000", "ETag": '"abc"'}
+        not_modified.content = b""
+
+        with patch.object(
+            github_client.session,
+            "request",
+            side_effect=[response, not_modified],
+        ) as mock_request:
+            assert github_client._make_request("/test") == {"data": "value"}
+            assert mock_request.call_args.kwargs["headers"] is None
+
+            assert github_client._make_request("/test") == {"data": "value"}
+            assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
     def test_http_error(self, github_client):
         """Test HTTP error handling."""
         mock_response = Mock()
@@ -131,17 +242,96 @@ class TestMakeRequest:
                 github_client._make_request("/test")
 
 
+class TestTokenBucket:
+    """Tests for adaptive request pacing."""
+
+    def test_acquire_within_burst_does_not_wait(self):
+        """Test that requests within the bucket capacity are not delayed."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        with patch("src.github_client.time.sleep") as mock_sleep:
+            for _ in range(3):
+                bucket.acquire()
+            mock_sleep.assert_not_called()
+
+            bucket.acquire()
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.01)
+
+    def test_rate_adapts_to_feedback(self):
+        """Test additive increase up to max_rate and multiplicative decrease down to min_rate."""
+        bucket = TokenBucket(rate=4.0, capacity=10, min_rate=1.0, max_rate=5.0)
+
+        bucket.increase_rate(delta=0.5)
+        assert bucket.rate == 4.5
+        bucket.increase_rate(delta=5.0)
+        assert bucket.rate == 5.0
+
+        bucket.decrease_rate()
+        assert bucket.rate == 2.5
+        bucket.decrease_rate()
+        bucket.decrease_rate()
+        assert bucket.rate == 1.0
+
+    def test_rate_limited_response_slows_client(self, github_client):
+        """Test that a 429 response lowers the client's request rate."""
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"X-RateLimit-Remaining": "5000"}
+        mock_response.content = b""
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Too many requests")
+
+        rate = github_client.rate_limiter.rate
+        with patch.object(github_client.session, "request", return_value=mock_response):
+            with patch("src.github_client.time.sleep"):
+                with pytest.raises(GitHubAPIError):
+                    github_client._make_request("/test")
+
+        assert github_client.rate_limiter.rate < rate
+
+    def test_permission_error_keeps_rate(self, github_client):
+        """Test that a 403 that isn't a rate limit doesn't slow the client."""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_response.headers = {"X-RateLimit-Remaining": "4000"}
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Forbidden")
+
+        rate = github_client.rate_limiter.rate
+        with patch.object(github_client.session, "request", return_value=mock_response) as mock_request:
+            with pytest.raises(GitHubAPIError):
+                github_client._make_request("/test")
+
+        mock_request.assert_called_once()
+        assert github_client.rate_limiter.rate == rate
+
+
+    def test_forbidden_without_rate_limit_headers_fails_fast(self, github_client):
+        """Test that a 403 with no rate limit headers raises without retrying."""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_response.headers = {}
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Forbidden")
+
+        with patch.object(github_client.session, "request", return_value=mock_response) as mock_request:
+            with patch("src.github_client.time.sleep") as mock_sleep:
+                with pytest.raises(GitHubAPIError, match="Forbidden"):
+                    github_client._make_request("/test")
+
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
 class TestPagination:
     """Tests for pagination handling."""
 
+    @pytest.mark.usefixtures("session_request")
     def test_paginate_single_page(self, github_client, mock_response):
         """Test pagination with single page of results."""
-        mock_response.json.return_value = [{"id": 1}, {"id": 2}]
+        mock_response.content = json.dumps([{"id": 1}, {"id": 2}]).encode()
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            results = github_client._paginate("/test")
-            assert len(results) == 2
-            assert results[0]["id"] == 1
+        results = github_client._paginate("/test")
+        assert len(results) == 2
+        assert results[0]["id"] == 1
 
     def test_paginate_multiple_pages(self, github_client):
         """Test pagination with multiple pages."""
@@ -149,12 +339,12 @@ class TestPagination:
         response1 = Mock()
         response1.status_code = 200
         response1.headers = {"X-RateLimit-Remaining": "5000"}
-        response1.json.return_value = [{"id": i} for i in range(100)]
+        response1.content = json.dumps([{"id": i} for i in range(100)]).encode()
 
         response2 = Mock()
         response2.status_code = 200
         response2.headers = {"X-RateLimit-Remaining": "4999"}
-        response2.json.return_value = [{"id": i} for i in range(100, 150)]
+        response2.content = json.dumps([{"id": i} for i in range(100, 150)]).encode()
 
         with patch.object(
             github_client.session,
@@ -164,90 +354,231 @@ class TestPagination:
             results = github_client._paginate("/test", per_page=100)
             assert len(results) == 150
 
-    def test_paginate_empty_results(self, github_client, mock_response):
-        """Test pagination with empty results."""
-        mock_response.json.return_value = []
+    def test_paginate_uses_last_page_link(self, github_client):
+        """Test that pages after the first are sized by the Link header and kept in order."""
+        first = Mock()
+        first.status_code = 200
+        first.headers = {
+            "X-RateLimit-Remaining": "5000",
+            "Link": (
+                '<https://api.github.com/test?per_page=100&page=2>; rel="next", '
+                '<https://api.github.com/test?per_page=100&page=3>; rel="last"'
+            ),
+        }
+        first.content = json.dumps([{"id": i} for i in range(100)]).encode()
+
+        def request(method, url, params=None, **kwargs):
+            if params["page"] == 1:
+                return first
+            response = Mock()
+            response.status_code = 200
+            response.headers = {"X-RateLimit-Remaining": "4999"}
+            start = (params["page"] - 1) * 100
+            count = 100 if params["page"] < 3 else 20
+            response.content = json.dumps([{"id": i} for i in range(start, start + count)]).encode()
+            return response
+
+        with patch.object(github_client.session, "request", side_effect=request) as mock_request:
+            results = github_client._paginate("/test", per_page=100)
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            results = github_client._paginate("/test")
-            assert len(results) == 0
+        assert [item["id"] for item in results] == list(range(220))
+        assert sorted(call.kwargs["params"]["page"] for call in mock_request.call_args_list) == [1, 2, 3]
 
+    def test_iter_pages_yields_each_page(self, github_client):
+        """Test that pages are yielded one at a time and fetched lazily."""
+        response1 = Mock()
+        response1.status_code = 200
+        response1.headers = {"X-RateLimit-Remaining": "5000"}
+        response1.content = json.dumps([{"id": i} for i in range(100)]).encode()
 
-class TestPREndpoints:
-    """Tests for PR-related endpoints."""
+        response2 = Mock()
+        response2.status_code = 200
+        response2.headers = {"X-RateLimit-Remaining": "4999"}
+        response2.content = json.dumps([{"id": i} for i in range(100, 150)]).encode()
 
-    def test_get_pull_request(self, github_client, mock_pr_data, mock_response):
-        """Test getting PR metadata."""
-        mock_response.json.return_value = mock_pr_data
+        with patch.object(
+            github_client.session,
+            "request",
+            side_effect=[response1, response2],
+        ) as mock_request:
+            pages = github_client._iter_pages("/test", per_page=100)
+            assert len(next(pages)) == 100
+            assert mock_request.call_count == 1
+            assert len(next(pages)) == 50
+            assert list(pages) == []
+            assert mock_request.call_count == 2
+
+    def test_paginate_iter_yields_items(self, github_client):
+        """Test that items are yielded one at a time across page boundaries."""
+        response1 = Mock()
+        response1.status_code = 200
+        response1.headers = {"X-RateLimit-Remaining": "5000"}
+        response1.content = json.dumps([{"id": i} for i in range(100)]).encode()
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            pr = github_client.get_pull_request(123)
-            assert pr["number"] == 123
-            assert pr["title"] == "Add dark mode support"
+        response2 = Mock()
+        response2.status_code = 200
+        response2.headers = {"X-RateLimit-Remaining": "4999"}
+        response2.content = json.dumps([{"id": 100}]).encode()
 
-    def test_get_pr_commits(self, github_client, mock_commits_data, mock_response):
-        """Test getting PR commits."""
-        mock_response.json.return_value = mock_commits_data
+        with patch.object(
+            github_client.session,
+            "request",
+            side_effect=[response1, response2],
+        ) as mock_request:
+            items = github_client._paginate_iter("/test")
+            assert next(items) == {"id": 0}
+            assert mock_request.call_count == 1
+            assert [item["id"] for item in items] == list(range(1, 101))
+            assert mock_request.call_count == 2
+
+    @pytest.mark.usefixtures("session_request")
+    def test_paginate_empty_results(self, github_client, mock_response):
+        """Test pagination with empty results."""
+        mock_response.content = json.dumps([]).encode()
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            commits = github_client.get_pr_commits(123)
-            assert len(commits) == 2
-            assert commits[0]["sha"] == "abc123"
+        results = github_client._paginate("/test")
+        assert len(results) == 0
 
-    def test_get_pr_files(self, github_client, mock_files_data, mock_response):
-        """Test getting PR file changes."""
-        mock_response.json.return_value = mock_files_data
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            files = github_client.get_pr_files(123)
-            assert len(files) == 3
-            assert files[0]["filename"] == "styles/theme.css"
+class TestPREndpoints:
+    """Tests for PR-related endpoints."""
 
-    def test_get_pr_comments(self, github_client, mock_review_comments_data, mock_response):
-        """Test getting PR review comments."""
-        mock_response.json.return_value = mock_review_comments_data
+    @pytest.mark.parametrize(
+        "method_name,arg,data_fixture,key,path",
+        [
+            ("get_pull_request", 123, "mock_pr_data", None, "/pulls/123"),
+            ("get_pr_commits", 123, "mock_commits_data", None, "/pulls/123/commits"),
+            ("get_pr_files", 123, "mock_files_data", None, "/pulls/123/files"),
+            ("get_pr_comments", 123, "mock_review_comments_data", None, "/pulls/123/comments"),
+            ("get_issue_comments", 123, "mock_issue_comments_data", None, "/issues/123/comments"),
+            ("get_pr_reviews", 123, "mock_reviews_data", None, "/pulls/123/reviews"),
+            ("get_check_runs", "abc123", "mock_check_runs_data", "check_runs", "/commits/abc123/check-runs"),
+        ],
+    )
+    def test_get_endpoint(
+        self, github_client, mock_response, session_request, request, method_name, arg, data_fixture, key, path
+    ):
+        """Test that each getter requests its endpoint and returns the decoded data."""
+        data = request.getfixturevalue(data_fixture)
+        mock_response.content = json.dumps(data).encode()
+
+        result = getattr(github_client, method_name)(arg)
+
+        assert result == (data[key] if key else data)
+        method, url = session_request.call_args.args
+        assert (method, url) == ("GET", f"https://api.github.com/repos/owner/repo{path}")
+
+    @pytest.mark.usefixtures("session_request")
+    def test_iter_pr_files(self, github_client, mock_files_data, mock_response):
+        """Test iterating over PR file changes page by page."""
+        mock_response.content = json.dumps(mock_files_data).encode()
+
+        pages = list(github_client.iter_pr_files(123))
+        assert len(pages) == 1
+        assert pages[0][0]["filename"] == "styles/theme.css"
+
+    @pytest.mark.usefixtures("session_request")
+    def test_iter_pr_comments(self, github_client, mock_review_comments_data, mock_response):
+        """Test iterating over PR review comments by page."""
+        mock_response.content = json.dumps(mock_review_comments_data).encode()
+
+        pages = list(github_client.iter_pr_comments(123))
+        assert pages == [mock_review_comments_data]
+
+
+class TestGraphQL:
+    """Tests for the GraphQL PR query."""
+
+    def test_fetch_pr_graphql(self, github_client, mock_graphql_pr_data, mock_response, session_request):
+        """Test that the query is POSTed with the PR coordinates."""
+        mock_response.content = json.dumps({"data": {"repository": {"pr123": mock_graphql_pr_data}}}).encode()
+
+        pr = github_client.fetch_pr_graphql(123)
+
+        assert pr["number"] == 123
+        method, url = session_request.call_args.args
+        assert (method, url) == ("POST", "https://api.github.com/graphql")
+        body = session_request.call_args.kwargs["json"]
+        assert body["variables"] == {"owner": "owner", "name": "repo"}
+        assert "pr123: pullRequest(number: 123)" in body["query"]
+
+    def test_fetch_prs_graphql_batches(self, github_client, mock_graphql_pr_data):
+        """Test that PRs are fetched GRAPHQL_BATCH_SIZE per query."""
+        pr_numbers = list(range(1, GRAPHQL_BATCH_SIZE + 3))
+
+        def respond(method, url, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.headers = {"X-RateLimit-Remaining": "5000"}
+            aliases = [line.split(":")[0].strip() for line in kwargs["json"]["query"].splitlines() if ": pullRequest(" in line]
+            response.content = json.dumps(
+                {"data": {"repository": {alias: mock_graphql_pr_data for alias in aliases}}}
+            ).encode()
+            return response
+
+        with patch.object(github_client.session, "request", side_effect=respond) as mock_request:
+            prs = github_client.fetch_prs_graphql(pr_numbers)
+
+        assert mock_request.call_count == 2
+        assert sorted(prs) == pr_numbers
+
+    @pytest.mark.usefixtures("session_request")
+    def test_fetch_pr_graphql_errors(self, github_client, mock_response):
+        """Test that GraphQL errors in a 200 response raise."""
+        mock_response.content = json.dumps({
+            "data": {"repository": {"pr123": None}},
+            "errors": [{"message": "Resource not accessible by integration"}],
+        }).encode()
+
+        with pytest.raises(GitHubAPIError, match="Resource not accessible"):
+            github_client.fetch_pr_graphql(123)
+
+    @pytest.mark.usefixtures("session_request")
+    def test_fetch_pr_graphql_not_found(self, github_client, mock_response):
+        """Test that a missing PR raises a 404 error."""
+        mock_response.content = json.dumps({"data": {"repository": {"pr999": None}}}).encode()
+
+        with pytest.raises(GitHubAPIError) as exc_info:
+            github_client.fetch_pr_graphql(999)
+
+        assert exc_info.value.status_code == 404
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            comments = github_client.get_pr_comments(123)
-            assert len(comments) == 1
-            assert comments[0]["path"] == "styles/theme.css"
 
-    def test_get_issue_comments(self, github_client, mock_issue_comments_data, mock_response):
-        """Test getting issue (conversation) comments."""
-        mock_response.json.return_value = mock_issue_comments_data
+class TestRepositoryEndpoints:
+    """Tests for repository-related endpoints."""
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            comments = github_client.get_issue_comments(123)
-            assert len(comments) == 2
-            assert comments[0]["user"]["login"] == "reviewer1"
+    @pytest.mark.usefixtures("session_request")
+    def test_get_repository(self, github_client, mock_repo_data, mock_response):
+        """Test getting repository metadata."""
+        mock_response.content = json.dumps(mock_repo_data).encode()
 
-    def test_get_pr_reviews(self, github_client, mock_reviews_data, mock_response):
-        """Test getting PR reviews."""
-        mock_response.json.return_value = mock_reviews_data
+        repo = github_client.get_repository()
+        assert repo["full_name"] == "owner/repo"
+        assert repo["name"] == "repo"
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            reviews = github_client.get_pr_reviews(123)
-            assert len(reviews) == 2
-            assert reviews[0]["state"] == "APPROVED"
+    def test_get_repository_reuses_auth_response(self, mock_repo_data, mock_response):
+        """Test that the repository fetched to validate auth isn't fetched again."""
+        mock_response.content = json.dumps(mock_repo_data).encode()
 
-    def test_get_check_runs(self, github_client, mock_check_runs_data, mock_response):
-        """Test getting check runs."""
-        mock_response.json.return_value = mock_check_runs_data
+        with patch("requests.Session.request", return_value=mock_response) as mock_request:
+            client = GitHubClient(token="test_token", owner="owner", repo="repo")
+            repo = client.get_repository()
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            checks = github_client.get_check_runs("abc123")
-            assert len(checks) == 3
-            assert checks[0]["name"] == "Unit Tests"
+        assert mock_request.call_count == 1
+        assert repo["full_name"] == "owner/repo"
 
+    def test_get_user_memoized(self, github_client, mock_response, session_request):
+        """Test that a user is fetched once per client and callers get copies."""
+        mock_response.content = json.dumps({"login": "testuser", "name": "Test User"}).encode()
 
-class TestRepositoryEndpoints:
-    """Tests for repository-related endpoints."""
+        first = github_client.get_user("testuser")
+        first["name"] = "Changed"
+        second = github_client.get_user("testuser")
+        github_client.get_user("otheruser")
 
-    def test_get_repository(self, github_client, mock_repo_data, mock_response):
-        """Test getting repository metadata."""
-        mock_response.json.return_value = mock_repo_data
+        assert session_request.call_count == 2
+        assert second["name"] == "Test User"
 
-        with patch.object(github_client.session, "request", return_value=mock_response):
-            repo = github_client.get_repository()
-            assert repo["full_name"] == "owner/repo"
-            assert repo["name"] == "repo"
+        github_client.invalidate()
+        github_client.get_user("testuser")
+        assert session_request.call_count == 3
@@ -2,11 +2,44 @@
 Tests for data models.
 """
 
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
 
-from src.models import CheckRun, Commit, FileChange, PRActivity, PRComment, Review
+from src.models import CheckRun, Commit, FileChange, GitHubRepository, PRActivity, PRComment, Review
+
+
+@pytest.fixture(scope="session")
+def base_pr_activity(sample_datetime):
+    """A merged PR with no activity; tests replace() the fields they exercise."""
+    return PRActivity(
+        number=123,
+        title="Test",
+        author="user",
+        author_avatar_url="url",
+        state="merged",
+        base_branch="main",
+        head_branch="feature",
+        base_repo="owner/repo",
+        head_repo="owner/repo",
+        created_at=sample_datetime,
+        updated_at=sample_datetime,
+        closed_at=sample_datetime,
+        merged_at=sample_datetime,
+        merge_commit_sha="abc123",
+        merged_by="user",
+        description="",
+        labels=[],
+        linked_issues=[],
+        closes_issues=[],
+        commits=[],
+        comments=[],
+        reviews=[],
+        check_runs=[],
+        file_changes=[],
+        html_url="url",
+    )
 
 
 class TestCommit:
@@ -261,7 +294,7 @@ class TestPRActivity:
         assert len(activity.comments) == 1
         assert len(activity.reviews) == 1
 
-    def test_pr_activity_computed_stats(self, sample_datetime):
+    def test_pr_activity_computed_stats(self, base_pr_activity):
         """Test PRActivity computed statistics."""
         file_changes = [
             FileChange(
@@ -272,39 +305,13 @@ class TestPRActivity:
             ),
         ]
 
-        activity = PRActivity(
-            number=123,
-            title="Test",
-            author="user1",
-            author_avatar_url="url",
-            state="merged",
-            base_branch="main",
-            head_branch="feature",
-            base_repo="owner/repo",
-            head_repo="owner/repo",
-            created_at=sample_datetime,
-            updated_at=sample_datetime,
-            closed_at=sample_datetime,
-            merged_at=sample_datetime,
-            merge_commit_sha="abc123",
-            merged_by="user2",
-            description="",
-            labels=[],
-            linked_issues=[],
-            closes_issues=[],
-            commits=[],
-            comments=[],
-            reviews=[],
-            check_runs=[],
-            file_changes=file_changes,
-            html_url="url",
-        )
+        activity = replace(base_pr_activity, file_changes=file_changes)
 
         assert activity.total_additions == 30
         assert activity.total_deletions == 5
         assert activity.files_changed_count == 2
 
-    def test_pr_activity_participants(self, sample_datetime):
+    def test_pr_activity_participants(self, base_pr_activity, sample_datetime):
         """Test PRActivity participants calculation."""
         commits = [
             Commit(
@@ -324,99 +331,29 @@ class TestPRActivity:
             ),
         ]
 
-        activity = PRActivity(
-            number=123,
-            title="Test",
-            author="user1",
-            author_avatar_url="url",
-            state="merged",
-            base_branch="main",
-            head_branch="feature",
-            base_repo="owner/repo",
-            head_repo="owner/repo",
-            created_at=sample_datetime,
-            updated_at=sample_datetime,
-            closed_at=sample_datetime,
-            merged_at=sample_datetime,
-            merge_commit_sha="abc123",
-            merged_by="user4",
-            description="",
-            labels=[],
-            linked_issues=[],
-            closes_issues=[],
-            commits=commits,
-            comments=comments,
-            reviews=[],
-            check_runs=[],
-            file_changes=[],
-            html_url="url",
+        activity = replace(
+            base_pr_activity, author="user1", merged_by="user4", commits=commits, comments=comments
         )
 
         # Should include author, commit authors, comment authors, and merged_by
         assert set(activity.participants) == {"user1", "user2", "user3", "user4"}
 
-    def test_is_merged_property(self, sample_datetime):
+    def test_is_merged_property(self, base_pr_activity):
         """Test is_merged property."""
-        merged_activity = PRActivity(
-            number=123,
-            title="Test",
-            author="user",
-            author_avatar_url="url",
-            state="merged",
-            base_branch="main",
-            head_branch="feature",
-            base_repo="owner/repo",
-            head_repo="owner/repo",
-            created_at=sample_datetime,
-            updated_at=sample_datetime,
-            closed_at=sample_datetime,
-            merged_at=sample_datetime,
-            merge_commit_sha="abc123",
-            merged_by="user",
-            description="",
-            labels=[],
-            linked_issues=[],
-            closes_issues=[],
-            commits=[],
-            comments=[],
-            reviews=[],
-            check_runs=[],
-            file_changes=[],
-            html_url="url",
-        )
-
-        closed_activity = PRActivity(
+        merged_activity = base_pr_activity
+        closed_activity = replace(
+            base_pr_activity,
             number=124,
-            title="Test",
-            author="user",
-            author_avatar_url="url",
             state="closed",
-            base_branch="main",
-            head_branch="feature",
-            base_repo="owner/repo",
-            head_repo="owner/repo",
-            created_at=sample_datetime,
-            updated_at=sample_datetime,
-            closed_at=sample_datetime,
             merged_at=None,
             merge_commit_sha=None,
             merged_by=None,
-            description="",
-            labels=[],
-            linked_issues=[],
-            closes_issues=[],
-            commits=[],
-            comments=[],
-            reviews=[],
-            check_runs=[],
-            file_changes=[],
-            html_url="url",
         )
 
         assert merged_activity.is_merged is True
         assert closed_activity.is_merged is False
 
-    def test_filter_properties(self, sample_datetime):
+    def test_filter_properties(self, base_pr_activity, sample_datetime):
         """Test filtering properties for comments, reviews, and checks."""
         comments = [
             PRComment(
@@ -451,33 +388,7 @@ class TestPRActivity:
             ),
         ]
 
-        activity = PRActivity(
-            number=123,
-            title="Test",
-            author="user",
-            author_avatar_url="url",
-            state="merged",
-            base_branch="main",
-            head_branch="feature",
-            base_repo="owner/repo",
-            head_repo="owner/repo",
-            created_at=sample_datetime,
-            updated_at=sample_datetime,
-            closed_at=sample_datetime,
-            merged_at=sample_datetime,
-            merge_commit_sha="abc123",
-            merged_by="user",
-            description="",
-            labels=[],
-            linked_issues=[],
-            closes_issues=[],
-            commits=[],
-            comments=comments,
-            reviews=reviews,
-            check_runs=checks,
-            file_changes=[],
-            html_url="url",
-        )
+        activity = replace(base_pr_activity, comments=comments, reviews=reviews, check_runs=checks)
 
         assert len(activity.conversation_comments) == 1
         assert len(activity.review_comments) == 1
@@ -485,3 +396,10 @@ class TestPRActivity:
         assert len(activity.changes_requested_reviews) == 1
         assert len(activity.successful_checks) == 1
         assert len(activity.failed_checks) == 1
+
+
+@pytest.mark.parametrize("model", [Commit, PRComment, Review, CheckRun, FileChange, PRActivity, GitHubRepository])
+def test_models_are_slotted(model):
+    """Test that models use __slots__, keeping per-instance memory low for large PRs."""
+    assert "__slots__" in vars(model)
+    assert not hasattr(model.__new__(model), "__dict__")
@@ -0,0 +1,441 @@
+"""
+Tests for the git notes browser.
+"""
+
+import json
+import subprocess
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("mistune")
+
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+from notes_browser import notes_browser as nb  # noqa: E402
+
+
+# These tests run git against temporary repositories
+pytestmark = pytest.mark.integration
+
+
+NOTE_CONTENT = """# 🟣 PR #42: Add dark mode
+
+## Metadata
+
+- **Author:** @testuser
+
+## Discussion (2 comments)
+
+### Code Review Comments (2)
+
+**@reviewer** on `app.py:2`
+> Nice line
+
+**@reviewer** on `deleted.py:5`
+> This file is gone
+"""
+
+
+def git(repo_path, *args):
+    """Run a git command in the repository and return its stripped stdout."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=repo_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def notes_repo(tmp_path):
+    """Create a temporary git repository with one noted commit."""
+    repo_path = tmp_path / "notes_repo"
+    repo_path.mkdir()
+
+    git(repo_path, "init")
+    git(repo_path, "config", "user.name", "Test User")
+    git(repo_path, "config", "user.email", "test@example.com")
+
+    (repo_path / "app.py").write_text("line one\nline two\nline three\n")
+    git(repo_path, "add", ".")
+    git(repo_path, "commit", "-m", "Initial commit")
+    git(repo_path, "notes", "add", "-m", NOTE_CONTENT, "HEAD")
+
+    return repo_path
+
+
+@pytest.fixture(params=["subprocess", "pygit2"])
+def backend(request, monkeypatch):
+    """Run a test with objects read through git subprocesses, then through pygit2."""
+    if request.param == "pygit2":
+        pytest.importorskip("pygit2")
+    else:
+        monkeypatch.setattr(nb, "pygit2", None)
+    return request.param
+
+
+@pytest.fixture
+def reader(notes_repo, backend):
+    """Create a notes reader for the temporary repository."""
+    return nb.GitNotesReader(str(notes_repo))
+
+
+@pytest.fixture
+def client(notes_repo, backend, monkeypatch):
+    """Create a Flask test client serving the temporary repository."""
+    monkeypatch.setattr(nb, "REPO_PATH", str(notes_repo))
+    monkeypatch.setattr(nb, "note_pages", nb._NotePageCache())
+    return nb.app.test_client()
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def json_provider(request, monkeypatch):
+    """Serve JSON through Flask's default provider, then through orjson."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        provider = nb.OrjsonProvider(nb.app)
+    else:
+        provider = DefaultJSONProvider(nb.app)
+    monkeypatch.setattr(nb.app, "json", provider)
+    return request.param
+
+
+class TestCatFile:
+    """Tests for the persistent cat-file --batch process."""
+
+    def test_fetch_blob(self, notes_repo):
+        """Test reading a blob by <commit>:<path> and by SHA."""
+        cat_file = nb._CatFile(str(notes_repo))
+        blob_sha = git(notes_repo, "rev-parse", "HEAD:app.py")
+
+        try:
+            assert cat_file.fetch("HEAD:app.py") == b"line one\nline two\nline three\n"
+            assert cat_file.fetch(blob_sha) == b"line one\nline two\nline three\n"
+        finally:
+            cat_file.close()
+
+    def test_fetch_reuses_process(self, notes_repo):
+        """Test that several reads share one process."""
+        cat_file = nb._CatFile(str(notes_repo))
+
+        try:
+            cat_file.fetch("HEAD:app.py")
+            proc = cat_file._proc
+            cat_file.fetch("HEAD:app.py")
+            assert cat_file._proc is proc
+        finally:
+            cat_file.close()
+
+    def test_fetch_missing_and_non_blob(self, notes_repo):
+        """Test that missing objects and trees return None and keep the stream in sync."""
+        cat_file = nb._CatFile(str(notes_repo))
+
+        try:
+            assert cat_file.fetch("HEAD:deleted.py") is None
+            assert cat_file.fetch("HEAD^{tree}") is None
+            assert cat_file.fetch("bad\nspec") is None
+            assert cat_file.fetch("HEAD:app.py").startswith(b"line one")
+        finally:
+            cat_file.close()
+
+    def test_resolve(self, notes_repo):
+        """Test resolving revisions to full SHAs."""
+        cat_file = nb._CatFile(str(notes_repo))
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+
+        try:
+            assert cat_file.resolve("HEAD") == head_sha
+            assert cat_file.resolve(head_sha[:7]) == head_sha
+            assert cat_file.resolve("no-such-branch") is None
+        finally:
+            cat_file.close()
+
+    def test_restarts_dead_process(self, notes_repo):
+        """Test that a process that exited is replaced on the next read."""
+        cat_file = nb._CatFile(str(notes_repo))
+
+        try:
+            cat_file.fetch("HEAD:app.py")
+            dead = cat_file._proc
+            dead.kill()
+            dead.wait()
+
+            assert cat_file.fetch("HEAD:app.py").startswith(b"line one")
+            assert cat_file._proc is not dead
+        finally:
+            cat_file.close()
+
+    def test_retries_once_after_broken_pipe(self, notes_repo):
+        """Test that a read failing mid-request restarts the process and retries."""
+        cat_file = nb._CatFile(str(notes_repo))
+        start = cat_file._start
+        starts = []
+
+        def broken_then_real():
+            proc = start()
+            if not starts:
+                # First process dies before answering
+                proc.stdin.close()
+                proc.wait()
+            starts.append(proc)
+            return proc
+
+        cat_file._start = broken_then_real
+
+        try:
+            assert cat_file.fetch("HEAD:app.py").startswith(b"line one")
+            assert len(starts) == 2
+        finally:
+            cat_file.close()
+
+
+class TestGitNotesReader:
+    """Tests for GitNotesReader with and without pygit2."""
+
+    def test_backend_selection(self, reader, backend):
+        """Test that pygit2 is used when importable and skipped otherwise."""
+        assert (reader._libgit2 is not None) == (backend == "pygit2")
+
+    def test_falls_back_when_pygit2_cannot_open_repo(self, tmp_path):
+        """Test that a path pygit2 cannot open gets no libgit2 handle."""
+        pytest.importorskip("pygit2")
+        assert nb._get_libgit2_repo(str(tmp_path / "not_a_repo")) is None
+
+    def test_iter_notes(self, reader, notes_repo):
+        """Test listing noted commits with their metadata and PR number."""
+        notes = list(reader.iter_notes())
+
+        assert len(notes) == 1
+        assert notes[0]["commit_sha"] == git(notes_repo, "rev-parse", "HEAD")
+        assert notes[0]["note_sha"] == git(notes_repo, "notes", "list", "HEAD")
+        assert notes[0]["author_name"] == "Test User"
+        assert notes[0]["subject"] == "Initial commit"
+        assert notes[0]["pr_number"] == 42
+
+    def test_iter_notes_skips_missing_commits(self, reader, notes_repo):
+        """Test that notes on objects that are not commits in the repo are left out."""
+        blob_sha = git(notes_repo, "rev-parse", "HEAD:app.py")
+        git(notes_repo, "notes", "add", "-m", "Note on a blob", blob_sha)
+
+        assert [n["subject"] for n in reader.iter_notes()] == ["Initial commit"]
+
+    def test_get_note(self, reader, notes_repo):
+        """Test reading a note and its blob SHA."""
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+
+        assert reader.get_note(head_sha).startswith("# 🟣 PR #42")
+        assert reader.get_note_oid(head_sha) == git(notes_repo, "notes", "list", "HEAD")
+        assert reader.get_note_oid(git(notes_repo, "rev-parse", "HEAD^{tree}")) is None
+
+    def test_resolve_commit(self, reader, notes_repo):
+        """Test resolving moving and abbreviated revisions to full SHAs."""
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+
+        assert reader.resolve_commit("HEAD") == head_sha
+        assert reader.resolve_commit(head_sha[:7]) == head_sha
+        assert reader.resolve_commit(head_sha) == head_sha
+        assert reader.resolve_commit("no-such-branch") is None
+
+    def test_get_file_lines_at_commit(self, reader, notes_repo):
+        """Test reading code context, and a file missing at the commit."""
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+
+        context = reader.get_file_lines_at_commit(head_sha, "app.py", 2, context_lines=1)
+        assert context["lines"] == [(1, "line one"), (2, "line two"), (3, "line three")]
+        assert context["target_line"] == 2
+        assert reader.get_file_lines_at_commit(head_sha, "deleted.py", 5) is None
+
+    def test_get_ref_tips(self, reader, notes_repo):
+        """Test listing notes refs, and all refs with a wider prefix."""
+        notes_tip = git(notes_repo, "rev-parse", "refs/notes/commits")
+        git(notes_repo, "branch", "feature")
+
+        assert reader.get_ref_tips() == {"refs/notes/commits": notes_tip}
+        all_tips = reader.get_ref_tips("refs/")
+        assert all_tips["refs/heads/feature"] == git(notes_repo, "rev-parse", "HEAD")
+        assert all_tips["refs/notes/commits"] == notes_tip
+        assert reader.list_available_refs() == ["refs/notes/commits"]
+
+
+class TestNotePageCache:
+    """Tests for the precomputed note detail pages."""
+
+    def test_refresh_and_get(self, notes_repo, backend):
+        """Test that refreshed pages are served for the current note."""
+        cache = nb._NotePageCache()
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+        note_oid = git(notes_repo, "notes", "list", "HEAD")
+
+        cache.refresh(str(notes_repo), "refs/notes/commits", count=10)
+
+        page = cache.get("refs/notes/commits", head_sha, note_oid)
+        assert "Add dark mode" in page
+        assert cache.get("refs/notes/other", head_sha, note_oid) is None
+
+    def test_stale_page_not_served(self, notes_repo, backend):
+        """Test that a page rendered for an older note blob is not served."""
+        cache = nb._NotePageCache()
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+        cache.refresh(str(notes_repo), "refs/notes/commits", count=10)
+
+        git(notes_repo, "notes", "add", "-f", "-m", "# 🟣 PR #43: Replaced", "HEAD")
+        new_oid = git(notes_repo, "notes", "list", "HEAD")
+
+        assert cache.get("refs/notes/commits", head_sha, new_oid) is None
+
+    def test_refresh_limits_count(self, notes_repo, backend):
+        """Test that only the most recent notes are rendered."""
+        cache = nb._NotePageCache()
+        git(notes_repo, "commit", "--allow-empty", "-m", "Second commit", "--date=@4102444800 +0000")
+        git(notes_repo, "notes", "add", "-m", "# 🟣 PR #43: Newer", "HEAD")
+
+        cache.refresh(str(notes_repo), "refs/notes/commits", count=1)
+
+        assert list(cache._pages) == [("refs/notes/commits", git(notes_repo, "rev-parse", "HEAD"))]
+
+    def test_note_detail_serves_precomputed_page(self, client, notes_repo):
+        """Test that the detail route uses a current precomputed page."""
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+        note_oid = git(notes_repo, "notes", "list", "HEAD")
+        nb.note_pages._pages[("refs/notes/commits", head_sha)] = (note_oid, "precomputed")
+
+        assert client.get(f"/note/{head_sha}").data == b"precomputed"
+
+    def test_note_detail_renders_when_stale(self, client, notes_repo):
+        """Test that the detail route renders afresh when the note has moved on."""
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+        nb.note_pages._pages[("refs/notes/commits", head_sha)] = ("0" * 40, "stale")
+
+        response = client.get("/note/HEAD")
+
+        assert response.status_code == 200
+        assert b"Add dark mode" in response.data
+        assert b"Nice line" in response.data
+        assert b"This file is gone" in response.data
+        assert response.data.count(b"target-line") == 1  # Only the comment on app.py has context
+
+    def test_note_detail_not_found(self, client):
+        """Test that unknown revisions and commits without notes return 404."""
+        assert client.get("/note/no-such-branch").status_code == 404
+        assert client.get("/note/HEAD?ref=refs/notes/other").status_code == 404
+
+
+class TestNotesListing:
+    """Tests for the streamed index page and /api/notes, and their ETags."""
+
+    def test_stream_json_array(self):
+        """Test that batched output joins into one JSON array."""
+        items = [{"n": i} for i in range(5)]
+
+        chunks = list(nb.stream_json_array(iter(items), batch_size=4))
+
+        assert len(chunks) > 1
+        assert json.loads("".join(chunks)) == items
+        assert "".join(nb.stream_json_array(iter([]))) == "[]\n"
+
+    def test_api_notes(self, client, notes_repo):
+        """Test that /api/notes streams every note as a JSON array."""
+        response = client.get("/api/notes")
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == "application/json"
+        notes = json.loads(response.data)
+        assert [n["commit_sha"] for n in notes] == [git(notes_repo, "rev-parse", "HEAD")]
+        assert notes[0]["pr_number"] == 42
+
+    def test_index(self, client, notes_repo):
+        """Test that the index page streams a row per note."""
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert git(notes_repo, "rev-parse", "--short=7", "HEAD").encode() in response.data
+        assert b"Initial commit" in response.data
+
+    @pytest.mark.parametrize("path", ["/", "/api/notes"])
+    def test_not_modified(self, client, path):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get(path).headers["ETag"]
+
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    @pytest.mark.parametrize("path", ["/", "/api/notes"])
+    def test_etag_changes_when_refs_move(self, client, notes_repo, path):
+        """Test that moving a notes ref or a branch invalidates the ETag."""
+        first = client.get(path).headers["ETag"]
+
+        git(notes_repo, "branch", "feature")
+        second = client.get(path).headers["ETag"]
+        git(notes_repo, "notes", "add", "-f", "-m", "# 🟣 PR #43: Replaced", "HEAD")
+        third = client.get(path).headers["ETag"]
+
+        assert len({first, second, third}) == 3
+        assert client.get(path, headers={"If-None-Match": first}).status_code == 200
+
+    def test_etag_changes_with_page_version(self, client, monkeypatch):
+        """Test that a template or stylesheet change invalidates the ETag."""
+        first = client.get("/").headers["ETag"]
+
+        monkeypatch.setattr(nb, "PAGE_VERSION", "changed")
+
+        assert client.get("/").headers["ETag"] != first
+
+    def test_etag_depends_on_notes_ref(self, client):
+        """Test that each notes ref has its own ETag."""
+        default = client.get("/api/notes").headers["ETag"]
+        other = client.get("/api/notes?ref=refs/notes/other")
+
+        assert other.headers["ETag"] != default
+        assert json.loads(other.data) == []
+
+
+class TestJSONProviders:
+    """Tests for the API routes with the stdlib and orjson JSON providers."""
+
+    def test_orjson_provider(self):
+        """Test that orjson output matches Flask's sorted, compact JSON."""
+        pytest.importorskip("orjson")
+        provider = nb.OrjsonProvider(nb.app)
+        obj = {"b": 1, "a": [None, True], 3: "x"}
+
+        assert provider.dumps(obj) == '{"3":"x","a":[null,true],"b":1}'
+        assert provider.loads(b'{"a": 1}') == {"a": 1}
+
+        with nb.app.app_context():
+            response = provider.response({"b": 1, "a": 2})
+        assert response.mimetype == "application/json"
+        assert response.data == b'{"a":2,"b":1}'
+
+    def test_api_notes(self, client, json_provider, notes_repo):
+        """Test the streamed listing with each provider."""
+        notes = json.loads(client.get("/api/notes").data)
+
+        assert notes[0]["commit_sha"] == git(notes_repo, "rev-parse", "HEAD")
+        assert list(notes[0]) == sorted(notes[0])
+
+    def test_api_note_detail(self, client, json_provider, notes_repo):
+        """Test the note detail API and its 404 with each provider."""
+        head_sha = git(notes_repo, "rev-parse", "HEAD")
+
+        response = client.get(f"/api/note/{head_sha}")
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        assert response.json["commit_sha"] == head_sha
+        assert response.json["sections"]["pr_number"] == 42
+        assert response.json["raw_content"].startswith("# 🟣 PR #42")
+
+        missing = client.get(f"/api/note/{git(notes_repo, 'rev-parse', 'HEAD^{tree}')}")
+        assert missing.status_code == 404
+        assert missing.json == {"error": "Note not found"}
+
+    def test_api_refs(self, client, json_provider):
+        """Test the refs API with each provider."""
+        assert client.get("/api/refs").json == {"refs": ["refs/notes/commits"]}
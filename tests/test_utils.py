@@ -2,15 +2,19 @@
 Tests for utility functions.
 """
 
-import os
-from unittest.mock import patch
-
 import pytest
 
 from src.utils import (
     format_file_size,
     get_env_var,
+    github_action_error,
+    github_action_notice,
+    github_action_output,
+    github_action_outputs,
+    github_action_warning,
     parse_pr_number,
+    parse_pr_numbers,
+    resolve_workspace_path,
     validate_inputs,
 )
 
@@ -58,74 +62,54 @@ class TestValidateInputs:
             merge_commit_sha="abc123def456",
         )
 
-    def test_invalid_token(self):
-        """Test validation with invalid token."""
-        with pytest.raises(ValueError, match="Invalid GitHub token"):
-            validate_inputs(
-                token="short",
-                owner="testuser",
-                repo="testrepo",
-                pr_number=123,
-            )
-
-    def test_empty_token(self):
-        """Test validation with empty token."""
-        with pytest.raises(ValueError, match="Invalid GitHub token"):
-            validate_inputs(
-                token="",
-                owner="testuser",
-                repo="testrepo",
-                pr_number=123,
-            )
-
-    def test_invalid_owner(self):
-        """Test validation with invalid owner."""
-        with pytest.raises(ValueError, match="Invalid repository owner"):
-            validate_inputs(
-                token="ghp_1234567890abcdef",
-                owner="",
-                repo="testrepo",
-                pr_number=123,
-            )
-
-    def test_invalid_repo(self):
-        """Test validation with invalid repo."""
-        with pytest.raises(ValueError, match="Invalid repository name"):
-            validate_inputs(
-                token="ghp_1234567890abcdef",
-                owner="testuser",
-                repo="  ",
-                pr_number=123,
-            )
-
-    def test_invalid_pr_number(self):
-        """Test validation with invalid PR number."""
-        with pytest.raises(ValueError, match="Invalid PR number"):
-            validate_inputs(
-                token="ghp_1234567890abcdef",
-                owner="testuser",
-                repo="testrepo",
-                pr_number=0,
-            )
+    @pytest.mark.parametrize(
+        "overrides,message",
+        [
+            ({"token": "short"}, "Invalid GitHub token"),
+            ({"token": ""}, "Invalid GitHub token"),
+            ({"owner": ""}, "Invalid repository owner"),
+            ({"owner": "-testuser"}, "Invalid repository owner"),
+            ({"repo": "  "}, "Invalid repository name"),
+            ({"repo": "test/repo"}, "Invalid repository name"),
+            ({"pr_number": 0}, "Invalid PR number"),
+            ({"pr_number": -1}, "Invalid PR number"),
+            ({"merge_commit_sha": "short"}, "Invalid merge commit SHA"),
+            ({"merge_commit_sha": "not-a-hex-sha"}, "Invalid merge commit SHA"),
+            ({"merge_commit_sha": "a" * 65}, "Invalid merge commit SHA"),
+        ],
+    )
+    def test_invalid_input(self, overrides, message):
+        """Test that each malformed input is rejected with its own message."""
+        inputs = {
+            "token": "ghp_1234567890abcdef",
+            "owner": "testuser",
+            "repo": "testrepo",
+            "pr_number": 123,
+            **overrides,
+        }
+
+        with pytest.raises(ValueError, match=message):
+            validate_inputs(**inputs)
+
+    def test_empty_merge_commit_sha(self):
+        """Test that an empty merge commit SHA means auto-detect."""
+        validate_inputs(
+            token="ghp_1234567890abcdef",
+            owner="testuser",
+            repo="testrepo",
+            pr_number=123,
+            merge_commit_sha="",
+        )
 
-        with pytest.raises(ValueError, match="Invalid PR number"):
-            validate_inputs(
-                token="ghp_1234567890abcdef",
-                owner="testuser",
-                repo="testrepo",
-                pr_number=-1,
-            )
-
-    def test_invalid_merge_commit_sha(self):
-        """Test validation with invalid merge commit SHA."""
-        with pytest.raises(ValueError, match="Invalid merge commit SHA"):
-            validate_inputs(
-                token="ghp_1234567890abcdef",
-                owner="testuser",
-                repo="testrepo",
-                pr_number=123,
-                merge_commit_sha="short",
-            )
+    def test_sha256_merge_commit_sha(self):
+        """Test that a full SHA-256 object name is accepted."""
+        validate_inputs(
+            token="ghp_1234567890abcdef",
+            owner="testuser",
+            repo="testrepo",
+            pr_number=123,
+            merge_commit_sha="0123456789abcdef" * 4,
+        )
 
 
 class TestParsePRNumber:
@@ -137,88 +121,103 @@ class TestParsePRNumber:
         assert parse_pr_number("1") == 1
         assert parse_pr_number("999999") == 999999
 
-    def test_parse_invalid_pr_number(self):
+    @pytest.mark.parametrize("value", ["abc", "-1", "0", ""])
+    def test_parse_invalid_pr_number(self, value):
         """Test parsing invalid PR numbers."""
         with pytest.raises(ValueError, match="Invalid PR number"):
-            parse_pr_number("abc")
+            parse_pr_number(value)
 
-        with pytest.raises(ValueError, match="Invalid PR number"):
-            parse_pr_number("-1")
 
-        with pytest.raises(ValueError, match="Invalid PR number"):
-            parse_pr_number("0")
+class TestParsePRNumbers:
+    """Tests for parse_pr_numbers function."""
 
-        with pytest.raises(ValueError, match="Invalid PR number"):
-            parse_pr_number("")
+    def test_parse_pr_numbers(self):
+        """Test parsing a comma-separated list, keeping order and dropping duplicates."""
+        assert parse_pr_numbers("12") == [12]
+        assert parse_pr_numbers("12, 15,18,") == [12, 15, 18]
+        assert parse_pr_numbers("18,12,18") == [18, 12]
 
+    @pytest.mark.parametrize(
+        "value,message",
+        [
+            ("12,abc", "Invalid PR number: abc"),
+            ("12,0", "Invalid PR number: 0"),
+            ("12, 15,-3", "Invalid PR number:  ?-3"),
+            (" , ", "Invalid PR numbers"),
+        ],
+    )
+    def test_parse_invalid_pr_numbers(self, value, message):
+        """Test that an invalid later entry or an empty list raises."""
+        with pytest.raises(ValueError, match=message):
+            parse_pr_numbers(value)
 
-class TestFormatFileSize:
-    """Tests for format_file_size function."""
 
-    def test_format_bytes(self):
-        """Test formatting bytes."""
-        assert format_file_size(500) == "500.0 B"
-        assert format_file_size(1023) == "1023.0 B"
+class TestResolveWorkspacePath:
+    """Tests for resolve_workspace_path function."""
+
+    def test_relative_path_uses_workspace(self, tmp_path, monkeypatch):
+        """Test that relative paths are resolved against GITHUB_WORKSPACE."""
+        monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path))
+        assert resolve_workspace_path(".cache") == tmp_path.resolve() / ".cache"
 
-    def test_format_kilobytes(self):
-        """Test formatting kilobytes."""
-        assert format_file_size(1024) == "1.0 KB"
-        assert format_file_size(5120) == "5.0 KB"
+    def test_absolute_path_unchanged(self, tmp_path, monkeypatch):
+        """Test that absolute paths ignore GITHUB_WORKSPACE."""
+        monkeypatch.setenv("GITHUB_WORKSPACE", "/elsewhere")
+        assert resolve_workspace_path(str(tmp_path / "cache")) == tmp_path.resolve() / "cache"
 
-    def test_format_megabytes(self):
-        """Test formatting megabytes."""
-        assert format_file_size(1048576) == "1.0 MB"
-        assert format_file_size(5242880) == "5.0 MB"
 
-    def test_format_gigabytes(self):
-        """Test formatting gigabytes."""
-        assert format_file_size(1073741824) == "1.0 GB"
-        assert format_file_size(5368709120) == "5.0 GB"
+class TestFormatFileSize:
+    """Tests for format_file_size function."""
 
-    def test_format_terabytes(self):
-        """Test formatting terabytes."""
-        assert format_file_size(1099511627776) == "1.0 TB"
+    @pytest.mark.parametrize(
+        "size,expected",
+        [
+            (500, "500.0 B"),
+            (1023, "1023.0 B"),
+            (1024, "1.0 KB"),
+            (5120, "5.0 KB"),
+            (1048576, "1.0 MB"),
+            (5242880, "5.0 MB"),
+            (1073741824, "1.0 GB"),
+            (5368709120, "5.0 GB"),
+            (1099511627776, "1.0 TB"),
+        ],
+    )
+    def test_format_file_size(self, size, expected):
+        """Test formatting sizes across each unit."""
+        assert format_file_size(size) == expected
 
 
 class TestGitHubActionHelpers:
     """Tests for GitHub Actions helper functions."""
 
-    def test_github_action_output(self, capsys):
-        """Test GitHub Actions output."""
-        from src.utils import github_action_output
-
+    # groups trivial checks to minimize fixture overhead
+    def test_github_action_single_line_annotations(self, capsys, monkeypatch):
+        """Test the set-output fallback and the error, warning and notice annotations."""
+        monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
         github_action_output("test_name", "test_value")
-        captured = capsys.readouterr()
-        assert "::set-output name=test_name::test_value" in captured.out
-
-    def test_github_action_error(self, capsys):
-        """Test GitHub Actions error annotation."""
-        from src.utils import github_action_error
-
         github_action_error("Test error message")
-        captured = capsys.readouterr()
-        assert "::error::Test error message" in captured.out
-
-    def test_github_action_error_with_file(self, capsys):
-        """Test GitHub Actions error with file location."""
-        from src.utils import github_action_error
-
         github_action_error("Test error", file="test.py", line=42)
-        captured = capsys.readouterr()
-        assert "::error file=test.py,line=42::Test error" in captured.out
+        github_action_warning("Test warning")
+        github_action_notice("Test notice")
 
-    def test_github_action_warning(self, capsys):
-        """Test GitHub Actions warning annotation."""
-        from src.utils import github_action_warning
+        assert capsys.readouterr().out.splitlines() == [
+            "::set-output name=test_name::test_value",
+            "::error::Test error message",
+            "::error file=test.py,line=42::Test error",
+            "::warning::Test warning",
+            "::notice::Test notice",
+        ]
 
-        github_action_warning("Test warning")
-        captured = capsys.readouterr()
-        assert "::warning::Test warning" in captured.out
+    def test_github_action_outputs_file(self, capsys, monkeypatch, tmp_path):
+        """Test that outputs are appended to the GITHUB_OUTPUT file."""
+        output_file = tmp_path / "output"
+        output_file.write_text("existing=1\n")
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
 
-    def test_github_action_notice(self, capsys):
-        """Test GitHub Actions notice annotation."""
-        from src.utils import github_action_notice
+        github_action_outputs({"test_name": "test_value", "multi": "a\nb"})
 
-        github_action_notice("Test notice")
-        captured = capsys.readouterr()
-        assert "::notice::Test notice" in captured.out
+        assert output_file.read_text() == (
+            "existing=1\ntest_name=test_value\nmulti<<ghadelimiter\na\nb\nghadelimiter\n"
+        )
+        assert capsys.readouterr().out == ""